@@ -27,6 +27,10 @@ from typing import List, Literal, Optional, Set, Tuple, Union
 from pydantic import Field, HttpUrl, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
+# Fallback used when SESSION_SECRET_KEY is not configured; kept at module level
+# so the application can tell a generated key from a configured one.
+_GENERATED_SESSION_SECRET_KEY = secrets.token_urlsafe(32)
+
 # =============================================================================
 # ENUMS AND CONSTANTS
 # =============================================================================
@@ -171,9 +175,13 @@ class SecurityConfig(BaseSettings):
         description="JWT expiration in minutes",
     )
     SESSION_SECRET_KEY: str = Field(
-        default_factory=lambda: os.getenv("SESSION_SECRET_KEY", "") or secrets.token_urlsafe(32),
+        default_factory=lambda: os.getenv("SESSION_SECRET_KEY", "") or _GENERATED_SESSION_SECRET_KEY,
         min_length=32,
-        description="Session secret key",
+        description=(
+            "Session secret key, also used to sign pantry pagination cursors. "
+            "Falls back to a per-process random key when unset, which "
+            "invalidates cursors across restarts and between workers"
+        ),
     )
 
     # Authentication Settings
@@ -478,6 +486,9 @@ class DatabaseConfig(BaseSettings):
     DB_SLOW_QUERY_THRESHOLD_MS: int = Field(
         default=1000, ge=100, le=10000, description="Slow query threshold"
     )
+    DB_BULK_CONCURRENCY: int = Field(
+        default=4, ge=1, le=20, description="Concurrent queries per bulk pantry operation"
+    )
 
     # Field Length Settings
     DB_EMAIL_MAX_LENGTH: int = Field(default=255, ge=50, le=500, description="Email field length")
@@ -527,6 +538,17 @@ class CacheConfig(BaseSettings):
 
     USER_CACHE_TTL_SECONDS: int = Field(default=300, ge=60, le=3600, description="User cache TTL")
     ENABLE_USER_CACHE: bool = Field(default=True, description="Enable user cache")
+    AUTH_VERIFIED_USER_CACHE_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Reuse a bearer token's Supabase verification for AUTH_VERIFIED_USER_CACHE_TTL_SECONDS. "
+            "Saves a Supabase round-trip per request, but a banned or deleted user, a revoked "
+            "session, or a logout handled by another worker keeps access until the entry expires"
+        ),
+    )
+    AUTH_VERIFIED_USER_CACHE_TTL_SECONDS: int = Field(
+        default=30, ge=1, le=300, description="How long a token's verification is reused"
+    )
     CACHE_DEFAULT_TTL_SECONDS: int = Field(
         default=1800, ge=60, le=7200, description="Default cache TTL"
     )
@@ -535,6 +557,18 @@ class CacheConfig(BaseSettings):
     CACHE_CLEANUP_INTERVAL_SECONDS: int = Field(
         default=3600, ge=300, le=7200, description="Cleanup interval"
     )
+    PANTRY_STATS_CACHE_TTL_SECONDS: int = Field(
+        default=60, ge=0, le=3600, description="Pantry statistics cache TTL (0 disables)"
+    )
+    PANTRY_STATS_CACHE_SIZE: int = Field(
+        default=10000, ge=1, le=100000, description="Max users with cached pantry statistics"
+    )
+    PANTRY_LIST_CACHE_TTL_SECONDS: int = Field(
+        default=10, ge=0, le=300, description="Pantry items list cache TTL (0 disables)"
+    )
+    PANTRY_STATS_MAX_AGE_SECONDS: int = Field(
+        default=30, ge=0, le=3600, description="Client cache max-age of pantry statistics (0 disables)"
+    )
 
 
 class LoggingConfig(BaseSettings):
@@ -747,6 +781,15 @@ class OCRConfig(BaseSettings):
         le=2.0,
         description="Gaussian blur radius for preprocessing",
     )
+    OCR_BINARIZE_ENABLED: bool = Field(
+        default=False, description="Binarize preprocessed images with Otsu's threshold"
+    )
+    OCR_MAX_IMAGE_DIMENSION: int = Field(
+        default=2000,
+        ge=800,
+        le=10000,
+        description="Longest image side in pixels before OCR; larger images are downscaled",
+    )
 
     # OCR processing settings
     OCR_CONFIDENCE_THRESHOLD: float = Field(
@@ -756,6 +799,27 @@ class OCRConfig(BaseSettings):
         default=30.0, ge=0.0, le=100.0, description="Minimum confidence score"
     )
     OCR_PROCESSING_TIMEOUT: int = Field(default=30, ge=5, le=120, description="Processing timeout")
+    OCR_BATCH_CONCURRENCY: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Images of one receipt batch processed at a time; each runs 4 configs on the 4-thread OCR pool",
+    )
+    OCR_MAX_BATCH_SIZE: int = Field(
+        default=10, ge=1, le=50, description="Max receipt images per batch"
+    )
+    OCR_RESULT_CACHE_SIZE: int = Field(
+        default=256,
+        ge=0,
+        le=10000,
+        description="Number of OCR results cached by image hash (0 disables the cache)",
+    )
+    OCR_GOOD_ENOUGH_CONFIDENCE: float = Field(
+        default=85.0,
+        ge=0.0,
+        le=100.0,
+        description="Confidence at which the remaining OCR configurations are skipped",
+    )
     OCR_DEFAULT_LANGUAGE: OCRLanguage = Field(
         default=OCRLanguage.GERMAN, description="Default language"
     )
@@ -803,6 +867,11 @@ class OCRConfig(BaseSettings):
         default=999.99, ge=100.0, le=10000.0, description="Maximum reasonable price"
     )
 
+    # Profiling settings
+    OCR_PATTERN_STATS_ENABLED: bool = Field(
+        default=False, description="Count receipt parsing pattern hits for profiling"
+    )
+
 
 class ValidationConfig(BaseSettings):
     """Input validation configuration."""
@@ -1447,6 +1516,11 @@ class Settings(
             return LogLevel.DEBUG
         return self.LOG_LEVEL
 
+    @property
+    def session_secret_key_generated(self) -> bool:
+        """Whether SESSION_SECRET_KEY fell back to a per-process random key."""
+        return self.SESSION_SECRET_KEY == _GENERATED_SESSION_SECRET_KEY
+
     @property
     def security_headers_enabled_safe(self) -> bool:
         """Get security headers setting with environment awareness."""
@@ -1496,6 +1570,8 @@ class Settings(
                 warnings.append("SUPABASE_KEY is not set in production")
             if len(self.JWT_SECRET_KEY) < 32:
                 warnings.append("JWT_SECRET_KEY should be at least 32 characters")
+            if self.session_secret_key_generated:
+                warnings.append("SESSION_SECRET_KEY is not set in production")
 
         # Check CORS configuration
         if self.is_production and not self.CORS_ORIGINS:
@@ -5,14 +5,22 @@ Application-wide dependencies.
 from typing import Optional
 
 from fastapi import Depends
+from supabase._async.client import AsyncClient
 from supabase._sync.client import SyncClient
 
-from shared.database.supabase import get_supabase_client
+from shared.database.supabase import get_async_supabase_client, get_supabase_client
 
 
-def get_db() -> SyncClient:
+# The factories are async so FastAPI resolves them on the event loop instead
+# of sending each call to its threadpool
+async def get_db() -> SyncClient:
     """Get database client dependency."""
     return get_supabase_client()
 
 
-__all__: list[str] = ["get_db"]
+async def get_async_db() -> AsyncClient:
+    """Get async database client dependency."""
+    return get_async_supabase_client()
+
+
+__all__: list[str] = ["get_db", "get_async_db"]
@@ -3,14 +3,19 @@ Authentication Services with Supabase Integration.
 Handles business logic for user authentication and profile management.
 """
 
+import base64
+import hashlib
 import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from supabase import Client
+from supabase._async.client import AsyncClient
 
 try:
     from gotrue.errors import AuthApiError, AuthError
@@ -24,7 +29,7 @@ except ImportError:
 
 
 from core.config import settings
-from shared.database.supabase import get_supabase_client
+from shared.database.supabase import get_async_supabase_client, get_supabase_client
 
 from .schemas import (
     AuthUser,
@@ -53,6 +58,27 @@ class AuthenticationError(Exception):
         super().__init__(self.message)
 
 
+def _token_expires_at(token: str) -> Optional[float]:
+    """
+    Read the exp claim of a JWT without verifying it.
+
+    The claim only decides whether a token is already expired or how long
+    a verified token may be cached; it is never trusted on its own.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        Expiry as a Unix timestamp, or None if it cannot be read
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
 class AuthService:
     """Service class for authentication operations with Supabase."""
 
@@ -63,6 +89,15 @@ class AuthService:
 
         self.logger = get_logger(f"{__name__}.{self.__class__.__name__}")
 
+        # Users of recently verified tokens when AUTH_VERIFIED_USER_CACHE_ENABLED,
+        # least recently used first. Maps the token's SHA-256 to (expiry time, user)
+        self._user_cache: "OrderedDict[bytes, Tuple[float, AuthUser]]" = OrderedDict()
+
+    @property
+    def async_supabase(self) -> AsyncClient:
+        """Async Supabase client for lookups run on every authenticated request."""
+        return get_async_supabase_client()
+
     async def register_user(self, user_data: UserCreate) -> TokenResponse:
         """
         Register new user via Supabase Auth.
@@ -407,7 +442,7 @@ class AuthService:
         """
         try:
             # Get user from token
-            user_response = self.supabase.auth.get_user(token)
+            user_response = await self.async_supabase.auth.get_user(token)
 
             if not user_response or not user_response.user:
                 raise AuthenticationError("Invalid token", "INVALID_TOKEN")
@@ -421,10 +456,43 @@ class AuthService:
             self.logger.error(f"Token verification error: {str(e)}")
             raise AuthenticationError("Token verification service error", "SERVICE_ERROR")
 
+    @staticmethod
+    def _token_cache_key(token: str) -> bytes:
+        """Key a token in the user cache without keeping the token itself."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def _cache_user(self, token: str, user: AuthUser) -> None:
+        """Cache a verified token's user for AUTH_VERIFIED_USER_CACHE_TTL_SECONDS."""
+        expires_at = _token_expires_at(token)
+        if expires_at is None:
+            return
+
+        now = time.time()
+        expires_at = min(expires_at, now + settings.AUTH_VERIFIED_USER_CACHE_TTL_SECONDS)
+        if expires_at <= now:
+            return
+
+        key = self._token_cache_key(token)
+        self._user_cache[key] = (expires_at, user)
+        self._user_cache.move_to_end(key)
+        while len(self._user_cache) > settings.CACHE_MAX_SIZE:
+            self._user_cache.popitem(last=False)
+
+    def _invalidate_cached_user(self, user_id: UUID) -> None:
+        """Drop every cached token of a user after their data changed."""
+        for key in [key for key, (_, user) in self._user_cache.items() if user.id == user_id]:
+            del self._user_cache[key]
+
     async def get_user_from_token(self, token: str) -> AuthUser:
         """
         Get complete user data from JWT token.
 
+        Tokens whose exp claim has passed are rejected without asking
+        Supabase; the claims of a token are decoded once and memoized.
+        Every other token is verified with Supabase, unless the opt-in
+        AUTH_VERIFIED_USER_CACHE_ENABLED reuses a recent verification (see
+        the setting for the revocation tradeoff).
+
         Args:
             token: JWT access token
 
@@ -434,6 +502,19 @@ class AuthService:
         Raises:
             AuthenticationError: If token is invalid or user not found
         """
+        expires_at = _token_expires_at(token)
+        if expires_at is not None and expires_at <= time.time():
+            raise AuthenticationError("Invalid or expired token", "TOKEN_EXPIRED")
+
+        if settings.AUTH_VERIFIED_USER_CACHE_ENABLED:
+            key = self._token_cache_key(token)
+            cached = self._user_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.time():
+                    self._user_cache.move_to_end(key)
+                    return cached[1]
+                del self._user_cache[key]
+
         try:
             # Verify token and get user data
             user_data = await self.verify_supabase_token(token)
@@ -442,7 +523,7 @@ class AuthService:
             # Get user profile if exists
             profile_data = await self._get_user_profile_by_id(user_id)
 
-            return AuthUser(
+            user = AuthUser(
                 id=user_id,
                 email=user_data["email"],
                 is_active=True,  # Supabase handles active status
@@ -457,6 +538,10 @@ class AuthService:
             self.logger.error(f"Error getting user from token: {str(e)}")
             raise AuthenticationError("Failed to get user data", "SERVICE_ERROR")
 
+        if settings.AUTH_VERIFIED_USER_CACHE_ENABLED:
+            self._cache_user(token, user)
+        return user
+
     async def refresh_supabase_token(self, refresh_token: str) -> TokenResponse:
         """
         Refresh access token using refresh token.
@@ -510,6 +595,8 @@ class AuthService:
         Returns:
             True if logout successful
         """
+        self._user_cache.pop(self._token_cache_key(token), None)
+
         try:
             self.logger.info("Attempting user logout")
 
@@ -582,6 +669,8 @@ class AuthService:
                 update_data["created_at"] = datetime.utcnow().isoformat()
                 response = self.supabase.table("user_profiles").insert(update_data).execute()
 
+            self._invalidate_cached_user(user_id)
+
             if not response.data:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -619,8 +708,8 @@ class AuthService:
             UserProfileResponse if found, None otherwise
         """
         try:
-            response = (
-                self.supabase.table("user_profiles")
+            response = await (
+                self.async_supabase.table("user_profiles")
                 .select("*")
                 .eq("user_id", str(user_id))
                 .execute()
@@ -13,7 +13,12 @@ from .schemas import (
     OCRTextResponse,
     ReceiptItem,
 )
-from .services import OCRError, extract_text_from_image, process_receipt_image
+from .services import (
+    OCRError,
+    extract_text_from_image,
+    process_receipt_image,
+    process_receipt_images,
+)
 
 __all__ = [
     # Routes
@@ -28,5 +33,6 @@ __all__ = [
     # Services
     "extract_text_from_image",
     "process_receipt_image",
+    "process_receipt_images",
     "OCRError",
 ]
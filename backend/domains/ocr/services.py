@@ -4,14 +4,22 @@ Handles OCR text extraction and ingredient matching for receipt processing.
 """
 
 import asyncio
+import bisect
+import functools
 import hashlib
 import os
 import re
-import tempfile
+import shutil
+import sys
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from uuid import NAMESPACE_DNS, UUID, uuid5
 
 from core.config import settings
 from core.logging import get_logger
@@ -28,6 +36,33 @@ except ImportError:
     ImageFilter = None  # type: ignore
     OCR_AVAILABLE = False
 
+# Vectorised confidence aggregation
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
+# In-process tesseract API (avoids a subprocess and temp image per call)
+try:
+    import tesserocr
+
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    tesserocr = None  # type: ignore
+    TESSEROCR_AVAILABLE = False
+
+# Fast content hashing for uploads (falls back to SHA-256)
+try:
+    from blake3 import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None  # type: ignore
+    BLAKE3_AVAILABLE = False
+
 # Security scanning support
 try:
     import magic
@@ -46,6 +81,26 @@ except ImportError:
     SequenceMatcher = None  # type: ignore
     FUZZY_MATCHING_AVAILABLE = False
 
+# Fast fuzzy matching support (falls back to difflib when missing)
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+    from rapidfuzz import process as rapidfuzz_process
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    rapidfuzz_fuzz = None  # type: ignore
+    rapidfuzz_process = None  # type: ignore
+    RAPIDFUZZ_AVAILABLE = False
+
+# Linear-time regex engine for patterns run over noisy OCR lines
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None  # type: ignore
+    RE2_AVAILABLE = False
+
 # Import ingredient name loading
 try:
     from domains.update.ingredient_cache import get_ingredient_names_for_ocr
@@ -74,6 +129,447 @@ from .schemas import (
 logger = get_logger(__name__)
 
 
+def _compile_linear(pattern: str):
+    """
+    Compile a pattern with RE2 when available, falling back to re.
+
+    RE2 matches in linear time, so backtracking on long noisy OCR lines cannot
+    blow up. Only use this for ASCII-only patterns without lookaround or
+    atomic groups; RE2 word, space and digit classes are ASCII-only, so the
+    two engines would disagree on non-ASCII text otherwise.
+
+    Args:
+        pattern: Regex source
+
+    Returns:
+        Compiled pattern with the re search/match/sub interface
+    """
+    if RE2_AVAILABLE and re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            logger.debug(f"RE2 cannot compile {pattern!r}, using re")
+    return re.compile(pattern)
+
+
+def _trie_pattern(tokens: Tuple[str, ...]) -> str:
+    """
+    Build a trie-shaped regex alternation matching any of the given tokens.
+
+    Tokens sharing a prefix are factored together (e.g. "g", "gallon" becomes
+    "g(?:allon)?"), so the engine decides on each character once instead of
+    trying every alternative in turn. The group is atomic; the greedy trie
+    always takes the longest token, which is the only one that can be
+    followed by the delimiter the surrounding pattern requires.
+
+    Args:
+        tokens: Literal tokens to match
+
+    Returns:
+        Regex source for an atomic group matching exactly the tokens
+    """
+    trie: dict = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" not in node:
+            return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if len(branches) == 1 and len(branches[0]) == 1:
+            return f"{branches[0]}?"
+        return f"(?:{'|'.join(branches)})?"
+
+    return f"(?>{render(trie)})"
+
+
+# Unit tokens recognised by the receipt quantity patterns. The parenthesised
+# forms accept a few more units than the bare forms.
+_BARE_UNIT_TOKENS = (
+    "lb",
+    "lbs",
+    "pound",
+    "pounds",
+    "kg",
+    "g",
+    "gallon",
+    "oz",
+    "ounce",
+    "ounces",
+    "bag",
+    "bags",
+    "count",
+    "l",
+    "ml",
+)
+_UNIT_TOKENS = _BARE_UNIT_TOKENS + ("ct", "pc", "pcs", "piece", "pieces")
+# Common OCR misreads of units
+_OCR_BARE_UNIT_TOKENS = ("its", "ibs", "ib", "be", "bs", "1b", "11b", "2b", "ts", "container")
+_OCR_UNIT_TOKENS = _OCR_BARE_UNIT_TOKENS + ("bults", "butte", "goz", "cound", "tresh", "fresh")
+
+# Unit alternations shared by the receipt quantity patterns, compiled into
+# trie form once so every pattern embeds the same compact fragment
+_BARE_UNITS = _trie_pattern(_BARE_UNIT_TOKENS)
+_UNITS = _trie_pattern(_UNIT_TOKENS)
+_OCR_BARE_UNITS = _trie_pattern(_OCR_BARE_UNIT_TOKENS)
+_OCR_UNITS = _trie_pattern(_OCR_UNIT_TOKENS)
+
+# Quantity patterns built from the unit fragments above
+_QTY_PAREN_PATTERN = rf"\(\d+\s*{_UNITS}\)"
+_OCR_QTY_PAREN_PATTERN = rf"\(\d+\s*{_OCR_UNITS}\)"
+_QTY_BARE_PATTERN = rf"\d+\s*{_BARE_UNITS}\s"
+_OCR_QTY_BARE_PATTERN = rf"\d+\s*{_OCR_BARE_UNITS}\s"
+_QTY_TAIL_PATTERN = rf"\s+\d+\s*{_BARE_UNITS}\s*$"
+
+# Price patterns with OCR error tolerance, in priority order. The flag marks
+# patterns anchored at the end of the line.
+_PRICE_PATTERNS = tuple(
+    (re.compile(pattern), tail_anchored)
+    for pattern, tail_anchored in (
+        # Standard patterns
+        (r"\$(\d+[.,]\d{2})", False),  # $12.34
+        (r"\$(\d+[.,]\d{1,2})", False),  # $12.3 or $12.34
+        (r"\$(\d+)", False),  # $12 (no cents)
+        # OCR error patterns - concatenated digits
+        (r"\$(\d{1,2})(\d{2})(?![.,]\d)", False),  # $1234 -> $12.34
+        (r"\$(\d{1,3})(\d{2})(?![.,]\d)", False),  # $12345 -> $123.45
+        # OCR error patterns - missing decimal point
+        (r"\$(\d+)\s*(\d{2})\s*$", True),  # $12 34 -> $12.34
+        (r"\$(\d+)(\d{2})\s*,?\s*$", True),  # $1234, -> $12.34
+        # European style (comma as decimal)
+        (r"\$(\d+),(\d{1,2})", False),  # $12,34
+        # Space separated
+        (r"\$\s*(\d+)[.,]?(\d{0,2})", False),  # $ 12.34 or $ 12 34
+        # Without dollar sign at end
+        (r"(\d+[.,]\d{2})\s*$", True),  # 12.34 at end
+        (r"(\d+)\s+(\d{2})\s*$", True),  # 12 34 at end
+    )
+)
+# Quantity and unit patterns with OCR error tolerance, in priority order
+_QTY_UNIT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # Standard parentheses patterns
+        r"\(([0-9.,]+)\s*([a-zA-Z]+)\)",  # (500 g)
+        r"\(([0-9.,]+)\s*x\s*([0-9.,]+)\s*([a-zA-Z]+)\)",  # (2 x 500 g)
+        # Standard space patterns
+        r"([0-9.,]+)\s*([a-zA-ZÄÖÜäöü]+)\b",  # 500 g, 2 Stück
+        r"([0-9.,]+)\s*x\s*([0-9.,]+)\s*([a-zA-Z]+)",  # 2 x 500 g
+        # Handle OCR common errors: 0->O, l->I, etc.
+        r"([O0-9.,I1l]+)\s*([a-zA-ZÄÖÜäöü]+)\b",
+    )
+)
+
+# The price patterns, with their indices, that can match a line without a "$"
+_PRICE_PATTERNS_WITHOUT_DOLLAR = tuple(
+    (index, entry) for index, entry in enumerate(_PRICE_PATTERNS) if r"\$" not in entry[0].pattern
+)
+# Every character a tail-anchored price pattern can consume
+_PRICE_TAIL_CHARS = "0123456789.,$ \t\n\r\f\v"
+
+# Successful matches per (parser, pattern index), collected only when
+# OCR_PATTERN_STATS_ENABLED is set. Used to order the pattern lists by hit rate.
+_PATTERN_HITS: Counter = Counter()
+
+# Shared pool for tesseract runs; configurations of one image run side by side
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ocr")
+
+# Persistent tesserocr APIs per configuration string. An API is not thread
+# safe, so each one is paired with a lock.
+_TESSEROCR_APIS: Dict[str, Tuple["tesserocr.PyTessBaseAPI", threading.Lock]] = {}
+_TESSEROCR_APIS_LOCK = threading.Lock()
+
+# Recent OCR results by image digest, least recently used first
+_OCR_RESULT_CACHE: "OrderedDict[str, OCRTextResponse]" = OrderedDict()
+
+# OCR runs in progress by image digest, joined by identical concurrent uploads
+_OCR_IN_FLIGHT: Dict[str, "asyncio.Task[OCRTextResponse]"] = {}
+
+# OCR digit confusions and decimal commas in quantities, fixed in one pass
+_OCR_DIGIT_TRANS = str.maketrans({"O": "0", "I": "1", "l": "1", ",": "."})
+
+# A quantity string that float() accepts once OCR digits are corrected
+_QTY_NUMBER_RE = re.compile(r"[0-9]+\.?[0-9]*|\.[0-9]+")
+
+
+# Lines that are store info, receipt metadata, totals or footers rather than
+# products. Matched against the lowercased line. The alternatives are joined
+# into one pattern so a line is searched once rather than once per pattern.
+_SKIP_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            # Store info patterns
+            r"^(fresh|market|grocery|store|shop|supermarket)",
+            r"^\d{1,3}\s+(main|street|ave|avenue|road|rd|st|drive|dr)",
+            r"^(anytown|city|town)",
+            r"^tel[:\s]*\(?[\d\s\-\)]+",
+            r"^phone[:\s]*\(?[\d\s\-\)]+",
+            # Receipt metadata patterns
+            r"^receipt\s*[#:]",
+            r"^date[:\s]*\d",
+            r"^time[:\s]*\d",
+            r"^cashier[:\s]*",
+            r"^clerk[:\s]*",
+            r"^register[:\s]*",
+            # Total/summary patterns - improved
+            r"^(sub)?total[:\s]*",
+            r"^tax[:\s]*\(?[\d\.%]+",
+            r"^change[:\s]*\$",
+            r"^payment[:\s]*",
+            r"^card[:\s]*",
+            r"^cash[:\s]*",
+            r"^subtott",  # OCR error for "subtotal"
+            r"^tot[:\s]*",  # OCR error for "total"
+            r"^tout[:\s]*",  # OCR error for "total"
+            # Footer patterns
+            r"^thank\s+you",
+            r"^have\s+a",
+            r"^visit\s+us",
+            r"^www\.",
+            r"^[\*\-=]{3,}",  # separators
+            # Standalone prices or numbers
+            r"^\$?\d+[.,]\d{2}$",
+            r"^\d{1,2}[:/]\d{1,2}[:/]\d{2,4}",  # dates
+        )
+    )
+)
+
+# Patterns that indicate a product line, joined like _SKIP_RE
+_PRODUCT_INDICATOR_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            # Quantity patterns - more flexible for OCR errors
+            _QTY_PAREN_PATTERN,
+            _OCR_QTY_PAREN_PATTERN,  # OCR errors
+            r"\d+\s*x\s*",  # quantity multiplier
+            r"@\s*\$\d+[.,]\d{2}",  # unit price
+            r"\$\d+[.,]\d{2}\s*$",  # price at end of line
+            r"\$\d+[.,]\d{1,2}[.,]?\s*$",  # price with OCR errors
+            # Common quantity indicators without parentheses
+            _QTY_BARE_PATTERN,
+            _OCR_QTY_BARE_PATTERN,  # OCR errors
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Common OCR misreads of units, fixed in one pass over each line
+_OCR_UNIT_FIXES = {
+    "its": "lbs",
+    "ibs": "lbs",
+    "ib": "lb",
+    "1b": "lb",
+    "11b": "lb",
+    "be": "lbs",
+    "bs": "lbs",
+    "ts": "lbs",
+    "goz": "8oz",
+    "cound": "count",
+    "bults": "bulbs",
+    "butte": "bulbs",
+    "tresh": "fresh",
+}
+_OCR_UNIT_FIX_RE = re.compile(rf"\b{_trie_pattern(tuple(_OCR_UNIT_FIXES))}\b", re.IGNORECASE)
+
+# Common OCR errors in price formatting, applied in order after the unit fixes
+_PRICE_FIX_SUBS = (
+    (re.compile(r"\$(\d+)(\d{2})([,.]?)"), r"$\1.\2"),  # $398 -> $3.98
+    (re.compile(r"\$(\d+)[.,](\d{1})(\d{1})([,.]?)"), r"$\1.\2\3"),  # $1.2.9 -> $1.29
+)
+
+
+def _fix_ocr_unit(match: re.Match) -> str:
+    """Replacement callback for _OCR_UNIT_FIX_RE."""
+    return _OCR_UNIT_FIXES[match.group(0).lower()]
+
+
+_ANY_LETTER_RE = _compile_linear(r"[a-zA-Z]")
+_LETTERS_RE = _compile_linear(r"[a-zA-Z]{2,}")
+_LETTERS_AND_PRICE_RE = _compile_linear(r"[a-zA-Z].*\$[0-9]+[.,][0-9]{1,2}")
+_CAPITALIZED_RE = _compile_linear(r"^[A-Z][a-z]+")
+
+
+def _is_candidate_line(line: str) -> bool:
+    """
+    Cheap pre-filter for stripped receipt lines.
+
+    A product line is at least three characters long and contains letters
+    (a potential product name). Numbers, separators and OCR noise fail here
+    before the skip and product pattern searches run.
+
+    Args:
+        line: Stripped receipt line
+
+    Returns:
+        True if the line may be a product line
+    """
+    return len(line) >= 3 and _LETTERS_RE.search(line) is not None
+
+
+# Words a product line often starts with, including common OCR errors. Matched
+# as a prefix of the lowercased line.
+_FOOD_START_WORDS = (
+    "tomato",
+    "onion",
+    "garlic",
+    "pepper",
+    "carrot",
+    "potato",
+    "spinach",
+    "banana",
+    "apple",
+    "orange",
+    "lemon",
+    "lime",
+    "berry",
+    "grape",
+    "chicken",
+    "beef",
+    "pork",
+    "fish",
+    "salmon",
+    "tuna",
+    "turkey",
+    "milk",
+    "cheese",
+    "egg",
+    "butter",
+    "yogurt",
+    "cream",
+    "bread",
+    "rice",
+    "pasta",
+    "flour",
+    "cereal",
+    "oat",
+    "oil",
+    "salt",
+    "pepper",
+    "spice",
+    "herb",
+    "basil",
+    "oregano",
+    "bean",
+    "lentil",
+    "nut",
+    "almond",
+    "walnut",
+    "lettuce",
+    "cabbage",
+    "broccoli",
+    "cauliflower",
+    "mushroom",
+    # Common variations and OCR errors
+    "tomatnes",
+    "onions",
+    "garlie",
+    "bellpeppers",
+    "cancts",
+    "bananas",
+    "apples",
+    "ground",
+    "salmon",
+    "fillet",
+    "mitk",
+    "imtik",
+    "eggs",
+    "fggs",
+    "cheddar",
+    "chesidar",
+    "pasa",
+    "otiweoit",
+    "otiveoil",
+    "basilfresh",
+)
+_FOOD_START_RE = re.compile(_trie_pattern(_FOOD_START_WORDS))
+
+# Basic food keywords, used when the ingredient names could not be loaded
+_FALLBACK_FOOD_KEYWORDS = (
+    "tomato",
+    "onion",
+    "garlic",
+    "pepper",
+    "carrot",
+    "potato",
+    "chicken",
+    "beef",
+    "pork",
+    "fish",
+    "milk",
+    "cheese",
+    "egg",
+    "bread",
+    "rice",
+    "pasta",
+    "oil",
+    "salt",
+    "apple",
+    "banana",
+)
+
+# Cleanup turning a product line into a product name, applied in order
+_ITEM_CLEANUP_SUBS = (
+    # Remove trailing prices (more flexible patterns)
+    (re.compile(r"\s*\$\d+[.,]\d{1,2}[.,]?\s*$"), ""),
+    (re.compile(r"\s*\$\d+[.,]\d{1,2}\s*,?\s*$"), ""),
+    # Remove trailing quantities and unit prices
+    (re.compile(r"\s*\d+\s*x\s*$"), ""),
+    (re.compile(r"\s*@\s*\$\d+[.,]\d{1,2}\s*$"), ""),
+    # Remove quantity indicators in parentheses but keep the text before
+    (re.compile(rf"\s*{_QTY_PAREN_PATTERN}\s*"), " "),
+    # Remove trailing quantity without parentheses
+    (re.compile(rf"\s*{_OCR_QTY_PAREN_PATTERN}\s*"), " "),
+    (re.compile(_QTY_TAIL_PATTERN), ""),
+    # Clean up extra whitespace and OCR artifacts
+    (re.compile(r"\s+"), " "),  # normalize whitespace
+    (re.compile(r"[^\w\s\-\']"), " "),  # remove special chars except useful ones
+)
+
+# Cleanup of a receipt line before ingredient matching, applied in order
+_SUGGESTION_CLEANUP_SUBS = (
+    (re.compile(r"\s*\([^)]*\)\s*"), " "),  # Remove parentheses content
+    (re.compile(r"\s*\$[\d.,]+\s*"), " "),  # Remove prices
+    (re.compile(r"[^\w\s]"), " "),  # Remove special chars
+    (re.compile(r"\s+"), " "),  # normalize whitespace
+)
+
+# Quantity info and trailing price of a receipt item, removed in one pass to
+# get the product name when no suggestions are made
+_ITEM_NAME_NOISE_RE = re.compile(r"\s*\(\d+.*?\)\s*|\s*\$\d+[.,]\d{2}\s*$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Common product name OCR errors, fixed in one pass over each product name
+_PRODUCT_NAME_FIXES = {
+    "tomatnes": "tomatoes",
+    "garlie": "garlic",
+    "bellpeppers": "bell peppers",
+    "cancts": "carrots",
+    "mitk": "milk",
+    "imtik": "milk",
+    "fggs": "eggs",
+    "chesidar": "cheddar",
+    "pasa": "pasta",
+    "otiweoit": "olive oil",
+    "otiveoil": "olive oil",
+    "basilfresh": "basil fresh",
+}
+_PRODUCT_NAME_FIX_RE = re.compile(
+    rf"\b{_trie_pattern(tuple(_PRODUCT_NAME_FIXES))}\b", re.IGNORECASE
+)
+
+
+def _fix_product_name(match: re.Match) -> str:
+    """Replacement callback for _PRODUCT_NAME_FIX_RE."""
+    return _PRODUCT_NAME_FIXES[match.group(0).lower()]
+
+
 def _load_ingredient_names_from_file() -> List[str]:
     """
     Load ingredient names from the ingredient_names.txt file.
@@ -90,21 +586,20 @@ def _load_ingredient_names_from_file() -> List[str]:
 
     # Fallback to reading directly from file
     try:
-        # Use absolute path relative to backend directory
-        backend_dir = Path(__file__).parent.parent.parent
-        ingredient_file = backend_dir / "data" / "ingredient_names.txt"
+        ingredient_file = _INGREDIENT_NAMES_FILE
 
         if not ingredient_file.exists():
             logger.warning(f"Ingredient names file not found: {ingredient_file}")
             return []
 
-        ingredients = []
-        with open(ingredient_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith("#"):
-                    ingredients.append(line.lower())
+        # Read and lowercase the file in one go, then strip and filter the lines
+        lines = ingredient_file.read_text(encoding="utf-8").lower().split("\n")
+        ingredients = [
+            line
+            for line in map(str.strip, lines)
+            # Skip comments and empty lines
+            if line and not line.startswith("#")
+        ]
 
         logger.info(f"Loaded {len(ingredients)} ingredient names from file")
         return ingredients
@@ -139,6 +634,10 @@ def _compute_similarity(text1: str, text2: str) -> float:
     if text1_lower in text2_lower or text2_lower in text1_lower:
         return 0.9
 
+    # Fuzzy matching using RapidFuzz's indel ratio (if available)
+    if RAPIDFUZZ_AVAILABLE and rapidfuzz_fuzz is not None:
+        return rapidfuzz_fuzz.ratio(text1_lower, text2_lower) / 100.0
+
     # Fuzzy matching using SequenceMatcher (if available)
     if FUZZY_MATCHING_AVAILABLE and SequenceMatcher is not None:
         try:
@@ -151,10 +650,267 @@ def _compute_similarity(text1: str, text2: str) -> float:
     return 0.0
 
 
-# Global ingredient names cache
-_ingredient_names_cache: Optional[List[str]] = None
-_cache_last_loaded: float = 0.0
-_cache_ttl = 300  # 5 minutes
+@dataclass(frozen=True)
+class IngredientNames:
+    """
+    Ingredient names with the per-name values used for local matching.
+
+    Stored as parallel lists so a match index selects the display name and
+    mock id directly, without lowercasing, title-casing or hashing per query.
+    The lowercase names are also indexed for exact and substring lookups.
+    """
+
+    names: List[str]
+    names_lower: List[str]
+    names_title: List[str]
+    mock_ids: List[UUID]
+    # Positions of each lowercase name, for names contained in the text
+    positions: Dict[str, List[int]]
+    # Lowercase names joined by newlines and where each one starts, for text
+    # contained in a name
+    joined_lower: str
+    starts: List[int]
+    # Name indices grouped by stripped name length, for pruning fuzzy scoring
+    by_length: Dict[int, List[int]]
+
+    @classmethod
+    def from_names(cls, names: List[str]) -> "IngredientNames":
+        """Build all derived lists in a single pass over the names."""
+        names_lower, names_title, mock_ids = [], [], []
+        positions: Dict[str, List[int]] = {}
+        by_length: Dict[int, List[int]] = {}
+        starts = []
+        offset = 0
+        for index, name in enumerate(names):
+            name_lower = name.lower()
+            names_lower.append(name_lower)
+            names_title.append(name.title())
+            mock_ids.append(uuid5(NAMESPACE_DNS, f"local-ingredient-{name}"))
+            positions.setdefault(name_lower, []).append(index)
+            by_length.setdefault(len(name_lower.strip()), []).append(index)
+            starts.append(offset)
+            offset += len(name_lower) + 1
+        return cls(
+            list(names),
+            names_lower,
+            names_title,
+            mock_ids,
+            positions,
+            "\n".join(names_lower),
+            starts,
+            by_length,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def substring_scores(self, text: str) -> Dict[int, float]:
+        """
+        Find names equal to, containing or contained in the text.
+
+        Equivalent to checking every name as _compute_similarity does, but the
+        names inside the text are looked up per substring of the text and the
+        names containing the text are found by searching the joined names.
+
+        Args:
+            text: Cleaned, lowercase detected text
+
+        Returns:
+            Mapping of name index to 1.0 for exact and 0.9 for substring matches
+        """
+        scores: Dict[int, float] = {}
+
+        # Names containing the text; the text cannot span two names unless it
+        # contains the separator
+        if "\n" not in text:
+            position = self.joined_lower.find(text)
+            while position != -1:
+                index = bisect.bisect_right(self.starts, position) - 1
+                scores[index] = 0.9
+                if index + 1 == len(self.starts):
+                    break
+                position = self.joined_lower.find(text, self.starts[index + 1])
+
+        # Names contained in the text
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                for index in self.positions.get(text[start:end], ()):
+                    scores[index] = 0.9
+
+        for index in self.positions.get(text, ()):
+            scores[index] = 1.0
+        return scores
+
+    def contains_name_in(self, text: str) -> bool:
+        """
+        Check whether any name occurs in the text.
+
+        Looks up the substrings of the text instead of searching the text once
+        per name, so the cost depends on the text length, not the name count.
+
+        Args:
+            text: Lowercase text
+
+        Returns:
+            True if some lowercase name is a substring of the text
+        """
+        positions = self.positions
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                if text[start:end] in positions:
+                    return True
+        return False
+
+    def fuzzy_candidates(self, text: str, threshold: float) -> List[int]:
+        """
+        Select the names whose length allows a fuzzy score of at least threshold.
+
+        A SequenceMatcher ratio is 2 * matches / (p + q) for lengths p and q,
+        and matches cannot exceed min(p, q), so names that are much shorter or
+        longer than the text can be skipped without scoring them.
+
+        Args:
+            text: Cleaned, lowercase detected text
+            threshold: Minimum similarity score (0.0 to 1.0)
+
+        Returns:
+            Indices of the names worth scoring
+        """
+        text_length = len(text.strip())
+        candidates = []
+        for length, indices in self.by_length.items():
+            if 2 * min(text_length, length) >= threshold * (text_length + length) - 1e-9:
+                candidates.extend(indices)
+        return candidates
+
+
+def _match_local_ingredients(
+    text: str, ingredients: IngredientNames, threshold: float
+) -> List[Tuple[int, float]]:
+    """
+    Score ingredient names against detected text for local fuzzy matching.
+
+    Scores follow _compute_similarity. Exact and substring matches come from
+    the ingredient index; with RapidFuzz the fuzzy scores for the whole list
+    are computed in one native call.
+
+    Args:
+        text: Cleaned, lowercase detected text
+        ingredients: Ingredient names to match against
+        threshold: Minimum similarity score (0.0 to 1.0)
+
+    Returns:
+        List of (ingredient index, similarity) tuples, best match first
+    """
+    substring_scores = ingredients.substring_scores(text)
+
+    if RAPIDFUZZ_AVAILABLE and rapidfuzz_process is not None:
+        scores = {
+            index: score / 100.0
+            for _, score, index in rapidfuzz_process.extract(
+                text,
+                ingredients.names_lower,
+                scorer=rapidfuzz_fuzz.ratio,
+                limit=None,
+                score_cutoff=threshold * 100,
+            )
+        }
+    else:
+        scores = {}
+        names_lower = ingredients.names_lower
+        text_key = text.lower().strip()
+        for index in ingredients.fuzzy_candidates(text, threshold):
+            if index in substring_scores:
+                continue
+            if threshold > 0 and FUZZY_MATCHING_AVAILABLE and SequenceMatcher is not None:
+                # Same ratio as _compute_similarity, but skip names whose cheap
+                # upper bound already rules them out
+                matcher = SequenceMatcher(None, text_key, names_lower[index].strip())
+                if matcher.quick_ratio() < threshold:
+                    continue
+                similarity = matcher.ratio()
+            else:
+                similarity = _compute_similarity(text, names_lower[index])
+            if similarity >= threshold:
+                scores[index] = similarity
+
+    # Exact and substring matches take precedence over the fuzzy ratio
+    for index, similarity in substring_scores.items():
+        if similarity >= threshold:
+            scores[index] = similarity
+        else:
+            scores.pop(index, None)
+
+    # Keep file order among equal scores
+    matches = sorted(scores.items())
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches
+
+
+# Fallback ingredient names file, used when the ingredient cache is unavailable
+_INGREDIENT_NAMES_FILE = Path(__file__).parent.parent.parent / "data" / "ingredient_names.txt"
+
+
+# Byte sequences that indicate script content embedded in an upload
+_SUSPICIOUS_PATTERNS = (
+    b"<?php",  # PHP code
+    b"<script",  # JavaScript
+    b"<%",  # ASP/JSP
+    b"eval(",  # Code evaluation
+    b"exec(",  # Code execution
+    b"system(",  # System commands
+    b"import ",  # Python imports
+    b"require(",  # Node.js requires
+    b"include(",  # PHP includes
+)
+
+# With RE2 all patterns are found in one linear pass over the upload. Python's
+# re is slower on this alternation than separate substring searches, so
+# without RE2 the patterns are searched one by one.
+_SUSPICIOUS_RE = (
+    re2.compile(b"|".join(re.escape(pattern) for pattern in _SUSPICIOUS_PATTERNS))
+    if RE2_AVAILABLE and re2 is not None
+    else None
+)
+
+
+def _find_suspicious_pattern(image_data: bytes) -> Optional[bytes]:
+    """
+    Find script-like content in raw upload bytes.
+
+    Args:
+        image_data: Raw image bytes
+
+    Returns:
+        A suspicious byte sequence found in the data, or None
+    """
+    if _SUSPICIOUS_RE is not None:
+        match = _SUSPICIOUS_RE.search(image_data)
+        return match.group(0) if match else None
+    return next((pattern for pattern in _SUSPICIOUS_PATTERNS if pattern in image_data), None)
+
+
+# libmagic identifies image types from their header; the rest of the upload
+# need not cross into libmagic
+_MAGIC_HEADER_BYTES = 4096
+
+
+def _image_digest(image_data: bytes) -> str:
+    """
+    Hash uploaded image bytes to identify the image.
+
+    The digest is not used for integrity protection, so BLAKE3 is preferred
+    when installed; it is several times faster than SHA-256 on large uploads.
+
+    Args:
+        image_data: Raw image bytes
+
+    Returns:
+        Hex digest of the image bytes
+    """
+    if BLAKE3_AVAILABLE and blake3 is not None:
+        return blake3(image_data).hexdigest()
+    return hashlib.sha256(image_data).hexdigest()
 
 
 # Security validation functions
@@ -180,33 +936,21 @@ def _validate_image_security(image_data: bytes) -> None:
         raise OCRError("Empty image file", "EMPTY_IMAGE")
 
     # Check for malicious patterns
-    suspicious_patterns = [
-        b"<?php",  # PHP code
-        b"<script",  # JavaScript
-        b"<%",  # ASP/JSP
-        b"eval(",  # Code evaluation
-        b"exec(",  # Code execution
-        b"system(",  # System commands
-        b"import ",  # Python imports
-        b"require(",  # Node.js requires
-        b"include(",  # PHP includes
-    ]
-
-    for pattern in suspicious_patterns:
-        if pattern in image_data:
-            logger.error(
-                "Malicious content detected in image",
-                extra={
-                    "pattern": pattern.decode("utf-8", errors="ignore"),
-                    "file_size": len(image_data),
-                },
-            )
-            raise OCRError("Suspicious content detected in image file", "MALICIOUS_CONTENT")
+    detected_pattern = _find_suspicious_pattern(image_data)
+    if detected_pattern is not None:
+        logger.error(
+            "Malicious content detected in image",
+            context={
+                "pattern": detected_pattern.decode("utf-8", errors="ignore"),
+                "file_size": len(image_data),
+            },
+        )
+        raise OCRError("Suspicious content detected in image file", "MALICIOUS_CONTENT")
 
     # Validate MIME type if magic is available
     if MAGIC_AVAILABLE and magic:
         try:
-            detected_type = magic.from_buffer(image_data, mime=True)
+            detected_type = magic.from_buffer(image_data[:_MAGIC_HEADER_BYTES], mime=True)
             if not detected_type.startswith("image/"):
                 raise OCRError(
                     f"Invalid file type: {detected_type}. Expected image file.",
@@ -248,100 +992,462 @@ def _validate_image_security(image_data: bytes) -> None:
         raise OCRError(f"Image validation failed: {str(e)}", "IMAGE_VALIDATION_ERROR")
 
 
-def _create_secure_temp_file(image_data: bytes) -> Tuple[str, str]:
+def _file_mtime(path: Path) -> int:
+    """Return the modification time of a file in nanoseconds, or 0 if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ingredient_names_cached(
+    cache_file_mtime: int, fallback_file_mtime: int
+) -> IngredientNames:
+    """
+    Load ingredient names once per combination of source file versions.
+
+    Args:
+        cache_file_mtime: Modification time of the ingredient cache file
+        fallback_file_mtime: Modification time of the fallback ingredient file
+
+    Returns:
+        Ingredient names with their precomputed matching values
+    """
+    return IngredientNames.from_names(_load_ingredient_names_from_file())
+
+
+def _get_ingredient_names() -> IngredientNames:
+    """
+    Get ingredient names with caching.
+
+    The names are reloaded only when one of the source files changes.
+
+    Returns:
+        Ingredient names with their precomputed matching values
+    """
+    return _load_ingredient_names_cached(
+        _file_mtime(Path(settings.UPDATE_INGREDIENT_CACHE_FILE_PATH)),
+        _file_mtime(_INGREDIENT_NAMES_FILE),
+    )
+
+
+def _parse_price(text: str) -> Optional[float]:
+    """
+    Extract price with advanced OCR error correction.
+
+    Args:
+        text: Receipt line text
+
+    Returns:
+        Extracted price as float or None
+    """
+    # Bind the price range once; settings attribute lookups are not free
+    min_price = settings.OCR_MIN_PRICE
+    max_price = settings.OCR_MAX_PRICE
+
+    # Tail-anchored patterns can only match inside the trailing run of
+    # digits, separators and whitespace, so start their search there.
+    tail_start = len(text.rstrip(_PRICE_TAIL_CHARS))
+
+    # Most price patterns need a "$"; lines without one skip them in one check
+    candidates = enumerate(_PRICE_PATTERNS) if "$" in text else _PRICE_PATTERNS_WITHOUT_DOLLAR
+
+    for index, (pattern, tail_anchored) in candidates:
+        match = pattern.search(text, tail_start) if tail_anchored else pattern.search(text)
+        if match:
+            if len(match.groups()) == 1:
+                # Single group - standard price
+                price_str = match.group(1).replace(",", ".")
+                price = float(price_str)
+                if min_price <= price <= max_price:  # Reasonable price range
+                    if settings.OCR_PATTERN_STATS_ENABLED:
+                        _PATTERN_HITS["price", index] += 1
+                    return price
+            else:
+                # Two groups - dollars and cents
+                dollars = int(match.group(1))
+                cents = int(match.group(2)) if match.group(2) else 0
+
+                # Handle OCR concatenation errors
+                if len(match.group(1)) >= 3 and match.group(2):
+                    # Likely concatenated: $1234 -> $12.34
+                    price_str = match.group(1) + match.group(2)
+                    if len(price_str) >= 3:
+                        dollars = int(price_str[:-2])
+                        cents = int(price_str[-2:])
+
+                price = dollars + (cents / 100.0)
+                if min_price <= price <= max_price:  # Reasonable price range
+                    if settings.OCR_PATTERN_STATS_ENABLED:
+                        _PATTERN_HITS["price", index] += 1
+                    return price
+
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_unit(raw_unit: str) -> str:
+    """
+    Normalize a unit string captured from a receipt line.
+
+    Units repeat across thousands of receipt lines, so the result is interned
+    to let every identical unit share a single string object, and cached since
+    a receipt only ever contains a handful of distinct unit spellings.
+
+    Args:
+        raw_unit: Unit text as captured by the quantity patterns
+
+    Returns:
+        Interned unit string
+    """
+    return sys.intern(raw_unit.strip())
+
+
+def _parse_quantity_number(raw_quantity: str) -> Optional[float]:
+    """
+    Parse a captured quantity string with OCR digit correction.
+
+    The quantity patterns can capture malformed numbers such as "1.2.3", so
+    the string is validated up front instead of relying on float() raising.
+
+    Args:
+        raw_quantity: Quantity text as captured by the quantity patterns
+
+    Returns:
+        Parsed quantity, or None if the text is not a valid number
+    """
+    qty_str = raw_quantity.translate(_OCR_DIGIT_TRANS)
+    if not _QTY_NUMBER_RE.fullmatch(qty_str):
+        return None
+    return float(qty_str)
+
+
+def _parse_quantity_and_unit(text: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Extract quantity and unit with advanced pattern matching and OCR correction.
+
+    Args:
+        text: Receipt line text
+
+    Returns:
+        Tuple of (quantity, unit)
+    """
+    for index, pattern in enumerate(_QTY_UNIT_PATTERNS):
+        match = pattern.search(text)
+        if not match:
+            continue
+
+        # Handle different match group structures
+        groups = match.groups()
+        if len(groups) == 2:  # (quantity, unit)
+            qty_str, unit_str = groups
+            quantity = _parse_quantity_number(qty_str)
+        elif len(groups) == 3:  # (multiplier, quantity, unit)
+            mult_str, qty_str, unit_str = groups
+            multiplier = _parse_quantity_number(mult_str)
+            base_qty = _parse_quantity_number(qty_str)
+            quantity = (
+                multiplier * base_qty if multiplier is not None and base_qty is not None else None
+            )
+        else:
+            continue
+
+        if quantity:
+            unit = _normalize_unit(unit_str)
+            if unit:
+                if settings.OCR_PATTERN_STATS_ENABLED:
+                    _PATTERN_HITS["quantity", index] += 1
+                return quantity, unit
+
+    return None, None
+
+
+def log_pattern_hits() -> None:
+    """Log the receipt parsing pattern hit counts collected so far."""
+    if not _PATTERN_HITS:
+        return
+
+    logger.info(
+        "Receipt parsing pattern hit counts",
+        data={
+            "pattern_hits": {
+                f"{parser}[{index}]": hits for (parser, index), hits in _PATTERN_HITS.most_common()
+            }
+        },
+    )
+
+
+def _parse_receipt_line(text: str) -> Tuple[Optional[float], Optional[str], Optional[float]]:
+    """
+    Parse quantity, unit, and price from a single receipt line.
+
+    This is the per-line hot path of receipt processing; it is kept as a pure
+    module-level function so it carries no service state.
+
+    Args:
+        text: Receipt line text
+
+    Returns:
+        Tuple of (quantity, unit, price)
+    """
+    price = _parse_price(text)
+    quantity, unit = _parse_quantity_and_unit(text)
+    return quantity, unit, price
+
+
+def _average_confidence(ocr_data: dict) -> float:
+    """
+    Average the word confidences of a tesseract image_to_data result.
+
+    Args:
+        ocr_data: image_to_data output as a dict
+
+    Returns:
+        Mean of the confidences above OCR_MIN_CONFIDENCE_SCORE, or that minimum
+        when there are none
+    """
+    min_confidence = settings.OCR_MIN_CONFIDENCE_SCORE
+    if NUMPY_AVAILABLE and np is not None:
+        confidences = np.asarray(ocr_data["conf"], dtype=np.int32)
+        confidences = confidences[confidences > min_confidence]
+        return float(confidences.mean()) if confidences.size else min_confidence
+
+    confidences = [conf for conf in map(int, ocr_data["conf"]) if conf > min_confidence]
+    return sum(confidences) / len(confidences) if confidences else min_confidence
+
+
+def _text_from_ocr_data(ocr_data: dict) -> str:
+    """
+    Rebuild the page text from a tesseract image_to_data result.
+
+    Words are joined with spaces per line and lines with newlines, with a blank
+    line between paragraphs, matching the layout image_to_string produces.
+
+    Args:
+        ocr_data: image_to_data output as a dict
+
+    Returns:
+        Extracted text
+    """
+    lines: List[str] = []
+    words: List[str] = []
+    current_line = None
+    for word, block_num, par_num, line_num in zip(
+        ocr_data["text"], ocr_data["block_num"], ocr_data["par_num"], ocr_data["line_num"]
+    ):
+        if not word or not word.strip():
+            continue
+        line_key = (block_num, par_num, line_num)
+        if line_key != current_line:
+            if words:
+                lines.append(" ".join(words))
+                words = []
+                if line_key[:2] != current_line[:2]:
+                    lines.append("")
+            current_line = line_key
+        words.append(word)
+    if words:
+        lines.append(" ".join(words))
+    return "\n".join(lines)
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """
+    Compute Otsu's threshold from a 256-bin grayscale histogram.
+
+    Args:
+        histogram: Pixel counts per gray level, as returned by Image.histogram()
+
+    Returns:
+        Gray level maximising the between-class variance
+    """
+    total = sum(histogram)
+    total_sum = sum(level * count for level, count in enumerate(histogram))
+    weight_background = 0
+    sum_background = 0
+    best_threshold, best_variance = 0, -1.0
+    for level, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+        sum_background += level * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (total_sum - sum_background) / weight_foreground
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = level, variance
+    return best_threshold
+
+
+def _contrast_lut(histogram: List[int], factor: float) -> List[int]:
+    """
+    Build the lookup table equivalent to ImageEnhance.Contrast on a grayscale image.
+
+    ImageEnhance blends the image with a flat image of its rounded mean gray
+    level; as a table the same result takes one lookup per pixel.
+
+    Args:
+        histogram: Pixel counts per gray level, as returned by Image.histogram()
+        factor: Contrast factor, as passed to ImageEnhance.Contrast.enhance()
+
+    Returns:
+        256-entry table for Image.point()
+    """
+    total = sum(histogram)
+    mean = int(sum(level * count for level, count in enumerate(histogram)) / total + 0.5)
+    return [min(255, max(0, int(mean + factor * (level - mean)))) for level in range(256)]
+
+
+def _parse_tesseract_config(config: str) -> Tuple[Optional[int], Optional[int], Dict[str, str]]:
     """
-    Create a secure temporary file for image processing.
+    Split a tesseract command line configuration into API settings.
 
     Args:
-        image_data: Raw image bytes
+        config: Configuration such as "--psm 6 --oem 1 -c name=value"
 
     Returns:
-        Tuple of (file_path, file_hash)
+        Tuple of (psm, oem, variables); psm and oem are None when not given
+    """
+    psm, oem, variables = None, None, {}
+    tokens = config.split()
+    for option, value in zip(tokens, tokens[1:]):
+        if option == "--psm":
+            psm = int(value)
+        elif option == "--oem":
+            oem = int(value)
+        elif option == "-c" and "=" in value:
+            name, _, variable_value = value.partition("=")
+            variables[name] = variable_value
+    return psm, oem, variables
+
+
+def _get_tesserocr_api(config: str) -> Tuple["tesserocr.PyTessBaseAPI", threading.Lock]:
+    """
+    Get the persistent tesserocr API for a configuration, creating it once.
 
-    Raises:
-        OCRError: If file creation fails
+    Args:
+        config: Tesseract configuration string
+
+    Returns:
+        Tuple of (api, lock guarding the api)
     """
-    try:
-        # Create file hash for integrity checking
-        file_hash = hashlib.sha256(image_data).hexdigest()
-
-        # Create secure temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="wb",
-            suffix=".tmp",
-            prefix="ocr_secure_",
-            delete=False,
-            dir=tempfile.gettempdir(),
-        ) as temp_file:
-            temp_file.write(image_data)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())  # Ensure data is written to disk
-            temp_path = temp_file.name
-
-        # Set restrictive permissions (owner read/write only)
-        os.chmod(temp_path, 0o600)
-
-        logger.debug(
-            "Created secure temporary file for OCR processing",
-            extra={
-                "temp_path": temp_path,
-                "file_hash": file_hash[:16],  # Only log first 16 chars
-                "file_size": len(image_data),
-            },
-        )
+    with _TESSEROCR_APIS_LOCK:
+        if config not in _TESSEROCR_APIS:
+            psm, oem, variables = _parse_tesseract_config(config)
+            kwargs = {}
+            if psm is not None:
+                kwargs["psm"] = psm
+            if oem is not None:
+                kwargs["oem"] = oem
+            api = tesserocr.PyTessBaseAPI(**kwargs)  # type: ignore
+            for name, value in variables.items():
+                if not api.SetVariable(name, value):
+                    logger.warning(f"Tesseract ignored unknown variable '{name}'")
+            _TESSEROCR_APIS[config] = (api, threading.Lock())
+        return _TESSEROCR_APIS[config]
+
+
+async def _run_ocr_config_in_pool(image, config: str) -> Tuple[str, float]:
+    """
+    Run one tesseract configuration on the OCR pool, within OCR_PROCESSING_TIMEOUT.
 
-        return temp_path, file_hash
+    The timeout starts when a pool thread picks the run up, so time spent
+    queued behind other uploads does not count against it. Cancelling or
+    timing out drops a run that is still queued; a run that has started
+    cannot be interrupted and finishes in the background, holding its
+    thread (and tesserocr API lock) until then.
 
-    except Exception as e:
-        raise OCRError(
-            f"Failed to create secure temporary file: {str(e)}",
-            "TEMP_FILE_CREATION_ERROR",
-        )
+    Args:
+        image: Preprocessed PIL image
+        config: Tesseract configuration string
 
+    Returns:
+        Tuple of (extracted_text, average_confidence)
 
-def _cleanup_temp_file(file_path: str) -> None:
+    Raises:
+        asyncio.TimeoutError: If the run takes longer than OCR_PROCESSING_TIMEOUT
     """
-    Securely cleanup temporary file.
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
 
-    Args:
-        file_path: Path to temporary file
-    """
+    def run() -> Tuple[str, float]:
+        loop.call_soon_threadsafe(started.set)
+        return _run_ocr_config(image, config)
+
+    future = loop.run_in_executor(_OCR_EXECUTOR, run)
     try:
-        if os.path.exists(file_path):
-            # Overwrite file with zeros before deletion (basic secure deletion)
-            file_size = os.path.getsize(file_path)
-            with open(file_path, "wb") as f:
-                f.write(b"\x00" * file_size)
-                f.flush()
-                os.fsync(f.fileno())
+        await started.wait()
+        return await asyncio.wait_for(future, timeout=settings.OCR_PROCESSING_TIMEOUT)
+    finally:
+        future.cancel()
 
-            os.unlink(file_path)
 
-            logger.debug(f"Securely cleaned up temporary file: {file_path}")
-    except Exception as e:
-        logger.warning(f"Failed to cleanup temporary file {file_path}: {e}")
+def _run_ocr_config(image, config: str) -> Tuple[str, float]:
+    """
+    Run tesseract on an image with one configuration.
 
+    Blocking; called from the OCR thread pool. Uses the persistent tesserocr
+    API when available, otherwise one pytesseract image_to_data run for both
+    text and confidences.
 
-def _get_ingredient_names() -> List[str]:
-    """
-    Get ingredient names with caching.
+    Args:
+        image: Preprocessed PIL image
+        config: Tesseract configuration string
 
     Returns:
-        List of ingredient names
+        Tuple of (extracted_text, average_confidence)
     """
-    global _ingredient_names_cache, _cache_last_loaded
+    if TESSEROCR_AVAILABLE and tesserocr is not None:
+        api, lock = _get_tesserocr_api(config)
+        with lock:
+            api.SetImage(image)
+            extracted_text = api.GetUTF8Text()
+            confidences = api.AllWordConfidences()
+        return extracted_text, _average_confidence({"conf": confidences})
+
+    ocr_data = pytesseract.image_to_data(  # type: ignore
+        image,
+        output_type=pytesseract.Output.DICT,  # type: ignore
+        config=config,
+    )
+    return _text_from_ocr_data(ocr_data), _average_confidence(ocr_data)
+
+
+def _get_cached_ocr_result(file_hash: str) -> Optional[OCRTextResponse]:
+    """
+    Look up the OCR result of a previously processed image.
+
+    Args:
+        file_hash: Digest of the image bytes
 
-    current_time = time.time()
+    Returns:
+        Cached OCRTextResponse, or None if the image is not cached
+    """
+    cached = _OCR_RESULT_CACHE.get(file_hash)
+    if cached is not None:
+        _OCR_RESULT_CACHE.move_to_end(file_hash)
+    return cached
 
-    # Load from cache if available and not expired
-    if _ingredient_names_cache is not None and current_time - _cache_last_loaded < _cache_ttl:
-        return _ingredient_names_cache
 
-    # Load fresh data
-    _ingredient_names_cache = _load_ingredient_names_from_file()
-    _cache_last_loaded = current_time
+def _cache_ocr_result(file_hash: str, response: OCRTextResponse) -> None:
+    """
+    Store an OCR result, evicting the least recently used beyond OCR_RESULT_CACHE_SIZE.
 
-    return _ingredient_names_cache
+    Args:
+        file_hash: Digest of the image bytes
+        response: OCR result for the image
+    """
+    max_size = settings.OCR_RESULT_CACHE_SIZE
+    if max_size <= 0:
+        return
+    _OCR_RESULT_CACHE[file_hash] = response
+    _OCR_RESULT_CACHE.move_to_end(file_hash)
+    while len(_OCR_RESULT_CACHE) > max_size:
+        _OCR_RESULT_CACHE.popitem(last=False)
 
 
 class OCRError(Exception):
@@ -365,9 +1471,6 @@ class OCRService:
 
         # Configure tesseract path - try standard Docker/system locations
         if pytesseract:
-            import os
-            import shutil
-
             # Try to find tesseract in standard locations (Docker-friendly)
             tesseract_paths = [
                 shutil.which("tesseract"),  # PATH lookup (should work in Docker)
@@ -393,8 +1496,12 @@ class OCRService:
             "default": settings.OCR_DEFAULT_CONFIG,  # System default as last resort
         }
 
+        # One thread per tesseract process; configurations already run in parallel
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
         # Load ingredient names at initialization
-        self._ingredient_names = _get_ingredient_names()
+        self._ingredients = _get_ingredient_names()
+        self._ingredient_names = self._ingredients.names
         logger.info(f"OCR Service initialized with {len(self._ingredient_names)} ingredient names")
 
     async def _find_ingredient_suggestions(
@@ -418,10 +1525,10 @@ class OCRService:
 
         try:
             # Clean the item text for better matching
-            clean_text = re.sub(r"\s*\([^)]*\)\s*", " ", item_text)  # Remove parentheses content
-            clean_text = re.sub(r"\s*\$[\d.,]+\s*", " ", clean_text)  # Remove prices
-            clean_text = re.sub(r"[^\w\s]", " ", clean_text)  # Remove special chars
-            clean_text = re.sub(r"\s+", " ", clean_text).strip().lower()
+            clean_text = item_text
+            for pattern, replacement in _SUGGESTION_CLEANUP_SUBS:
+                clean_text = pattern.sub(replacement, clean_text)
+            clean_text = clean_text.strip().lower()
 
             if not clean_text:
                 return []
@@ -452,28 +1559,17 @@ class OCRService:
             # Method 2: Use local ingredient names file for fuzzy matching
             if len(suggestions) < max_suggestions and self._ingredient_names:
                 try:
-                    local_matches = []
-
-                    for ingredient_name in self._ingredient_names:
-                        similarity = _compute_similarity(clean_text, ingredient_name)
-                        if similarity >= similarity_threshold:
-                            local_matches.append((ingredient_name, similarity))
-
-                    # Sort by similarity and take the best matches
-                    local_matches.sort(key=lambda x: x[1], reverse=True)
+                    # Score and sort by similarity to take the best matches
+                    local_matches = _match_local_ingredients(
+                        clean_text, self._ingredients, similarity_threshold
+                    )
 
                     # Add local matches if we don't have enough suggestions
-                    for ingredient_name, similarity in local_matches[
-                        : max_suggestions - len(suggestions)
-                    ]:
-                        # Create a mock UUID for local matches
-                        from uuid import NAMESPACE_DNS, uuid5
-
-                        mock_id = uuid5(NAMESPACE_DNS, f"local-ingredient-{ingredient_name}")
-
+                    for index, similarity in local_matches[: max_suggestions - len(suggestions)]:
+                        # Local matches use precomputed mock UUIDs
                         suggestion = OCRItemSuggestion(
-                            ingredient_id=mock_id,
-                            ingredient_name=ingredient_name.title(),
+                            ingredient_id=self._ingredients.mock_ids[index],
+                            ingredient_name=self._ingredients.names_title[index],
                             confidence_score=similarity * 100,
                             detected_text=clean_text,
                         )
@@ -504,153 +1600,51 @@ class OCRService:
             OCRError: If OCR processing fails
         """
         start_time = time.time()
-        temp_file_path = None
 
         try:
             # Validate image security before processing
             _validate_image_security(image_data)
 
-            # Create secure temporary file for processing
-            temp_file_path, file_hash = _create_secure_temp_file(image_data)
-
-            logger.info(
-                "Starting secure OCR text extraction",
-                extra={
-                    "file_size": len(image_data),
-                    "file_hash": file_hash[:16],  # Only log first 16 chars
-                    "temp_file": temp_file_path,
-                },
-            )
-
-            # Convert bytes to PIL Image
-            if not Image:
-                raise OCRError("PIL not available", "OCR_DEPENDENCIES_MISSING")
-
-            image = Image.open(BytesIO(image_data))
-
-            # Preprocess image for better OCR accuracy
-            image = self._preprocess_image_for_ocr(image)
-
-            # Run OCR in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-
-            # Extract text with confidence data using optimized config
-            if not pytesseract:
-                raise OCRError("pytesseract not available", "OCR_DEPENDENCIES_MISSING")
-
-            # Try different OCR configurations for best results
-            configs = [
-                # Optimal configuration from comprehensive testing
-                self.optimal_config["primary"],
-                # Fallback configurations
-                self.optimal_config["fallback_psm_4"],
-                self.optimal_config["fallback_psm_11"],
-                self.optimal_config["default"],
-            ]
-
-            best_result = None
-            best_confidence = 0.0
-
-            for config in configs:
-                try:
-                    # Extract confidence data with timeout protection
-                    ocr_data = await asyncio.wait_for(
-                        loop.run_in_executor(
-                            None,
-                            lambda c=config: pytesseract.image_to_data(  # type: ignore
-                                image,
-                                output_type=pytesseract.Output.DICT,  # type: ignore
-                                config=c,
-                            ),
-                        ),
-                        timeout=settings.OCR_PROCESSING_TIMEOUT,
-                    )
-
-                    # Extract text
-                    extracted_text = await loop.run_in_executor(
-                        None,
-                        lambda c=config: pytesseract.image_to_string(  # type: ignore
-                            image, config=c
-                        ),
-                    )
-
-                    # Calculate average confidence
-                    confidences = [
-                        int(conf)
-                        for conf in ocr_data["conf"]
-                        if int(conf) > settings.OCR_MIN_CONFIDENCE_SCORE
-                    ]
-                    avg_confidence = (
-                        sum(confidences) / len(confidences)
-                        if confidences
-                        else settings.OCR_MIN_CONFIDENCE_SCORE
-                    )
-
-                    # Keep the best result
-                    if avg_confidence > best_confidence:
-                        best_confidence = avg_confidence
-                        best_result = extracted_text
-
-                except Exception as e:
-                    logger.warning(f"OCR config '{config}' failed: {e}")
-                    continue
-
-            # Fallback if all configs failed
-            if best_result is None:
-                ocr_data = await loop.run_in_executor(
-                    None,
-                    lambda: pytesseract.image_to_data(  # type: ignore
-                        image,
-                        output_type=pytesseract.Output.DICT,  # type: ignore
-                        config=settings.OCR_SIMPLE_CONFIG,
-                    ),
-                )
-
-                best_result = await loop.run_in_executor(
-                    None,
-                    lambda: pytesseract.image_to_string(  # type: ignore
-                        image, config=settings.OCR_SIMPLE_CONFIG
-                    ),
+            # The image is processed in memory; the hash identifies it in logs
+            # and in the result cache
+            file_hash = _image_digest(image_data)
+
+            cached = _get_cached_ocr_result(file_hash)
+            if cached is not None:
+                processing_time_ms = int((time.time() - start_time) * 1000)
+                logger.info(
+                    "OCR result served from cache",
+                    context={
+                        "file_hash": file_hash[:16],
+                        "processing_time_ms": processing_time_ms,
+                    },
                 )
-
-                confidences = [
-                    int(conf)
-                    for conf in ocr_data["conf"]
-                    if int(conf) > settings.OCR_MIN_CONFIDENCE_SCORE
-                ]
-                best_confidence = (
-                    sum(confidences) / len(confidences)
-                    if confidences
-                    else settings.OCR_MIN_CONFIDENCE_SCORE
+                return cached.model_copy(update={"processing_time_ms": processing_time_ms})
+
+            # Identical uploads arriving together (e.g. a retried request) share
+            # one OCR run. The run is shielded so it survives a cancelled caller.
+            task = _OCR_IN_FLIGHT.get(file_hash)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._extract_text_uncached(image_data, file_hash, start_time)
                 )
+                _OCR_IN_FLIGHT[file_hash] = task
+                task.add_done_callback(lambda _: _OCR_IN_FLIGHT.pop(file_hash, None))
+                return await asyncio.shield(task)
 
+            response = await asyncio.shield(task)
             processing_time_ms = int((time.time() - start_time) * 1000)
-
             logger.info(
-                "OCR text extraction completed",
+                "OCR result shared with a concurrent identical upload",
                 context={
+                    "file_hash": file_hash[:16],
                     "processing_time_ms": processing_time_ms,
-                    "confidence_score": best_confidence,
-                    "extracted_text_length": (len(best_result.strip()) if best_result else 0),
-                    "configs_tried": len(configs),
-                    "image_preprocessed": True,
-                },
-                data={
-                    "performance_metrics": {
-                        "processing_time_ms": processing_time_ms,
-                        "confidence_score": best_confidence,
-                        "text_extraction_success": best_result is not None,
-                        "fallback_used": best_result is None,
-                    }
                 },
             )
+            return response.model_copy(update={"processing_time_ms": processing_time_ms})
 
-            return OCRTextResponse(
-                extracted_text=best_result.strip() if best_result else "",
-                confidence=best_confidence,
-                processing_time_ms=processing_time_ms,
-            )
-
+        except OCRError:
+            raise  # Keep specific codes such as OCR_TIMEOUT
         except Exception as e:
             processing_time_ms = int((time.time() - start_time) * 1000)
             logger.error(
@@ -663,10 +1657,122 @@ class OCRService:
                 },
             )
             raise OCRError(f"Failed to process image: {str(e)}", "OCR_PROCESSING_FAILED")
+
+    async def _extract_text_uncached(
+        self, image_data: bytes, file_hash: str, start_time: float
+    ) -> OCRTextResponse:
+        """
+        Run OCR on a validated image and cache the result.
+
+        Args:
+            image_data: Raw image data as bytes
+            file_hash: Digest of the image bytes
+            start_time: time.time() when the request started
+
+        Returns:
+            OCRTextResponse with extracted text and metadata
+        """
+        logger.info(
+            "Starting secure OCR text extraction",
+            context={
+                "file_size": len(image_data),
+                "file_hash": file_hash[:16],  # Only log first 16 chars
+            },
+        )
+
+        # Convert bytes to PIL Image
+        if not Image:
+            raise OCRError("PIL not available", "OCR_DEPENDENCIES_MISSING")
+
+        # Extract text with confidence data using optimized config
+        if not pytesseract:
+            raise OCRError("pytesseract not available", "OCR_DEPENDENCIES_MISSING")
+
+        # Decode, preprocess and OCR in a thread pool to avoid blocking; PIL and
+        # tesseract release the GIL while they work
+        loop = asyncio.get_running_loop()
+
+        # Preprocess image for better OCR accuracy
+        image = await loop.run_in_executor(_OCR_EXECUTOR, self._load_image_for_ocr, image_data)
+
+        # Try different OCR configurations for best results
+        configs = [
+            # Optimal configuration from comprehensive testing
+            self.optimal_config["primary"],
+            # Fallback configurations
+            self.optimal_config["fallback_psm_4"],
+            self.optimal_config["fallback_psm_11"],
+            self.optimal_config["default"],
+        ]
+
+        async def run_config(index: int, config: str) -> Tuple[int, Optional[Tuple[str, float]]]:
+            try:
+                return index, await _run_ocr_config_in_pool(image, config)
+            except Exception as e:
+                logger.warning(f"OCR config '{config}' failed: {e}")
+                return index, None
+
+        # Run all configurations concurrently and stop waiting at the first
+        # result that is good enough. Configurations still queued are then
+        # dropped; ones already running finish in the background.
+        results: List[Optional[Tuple[str, float]]] = [None] * len(configs)
+        tasks = [
+            asyncio.ensure_future(run_config(index, config)) for index, config in enumerate(configs)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                results[index] = result
+                if result is not None and result[1] >= settings.OCR_GOOD_ENOUGH_CONFIDENCE:
+                    break
         finally:
-            # Always cleanup temporary file
-            if temp_file_path:
-                _cleanup_temp_file(temp_file_path)
+            for task in tasks:
+                task.cancel()
+
+        # Keep the best result; ties go to the earlier configuration
+        best_result = None
+        best_confidence = 0.0
+        for result in results:
+            if result is not None and result[1] > best_confidence:
+                best_result, best_confidence = result
+
+        # Fallback if all configs failed
+        if best_result is None:
+            try:
+                best_result, best_confidence = await _run_ocr_config_in_pool(
+                    image, settings.OCR_SIMPLE_CONFIG
+                )
+            except asyncio.TimeoutError:
+                raise OCRError("OCR processing timed out", "OCR_TIMEOUT")
+
+        processing_time_ms = int((time.time() - start_time) * 1000)
+
+        logger.info(
+            "OCR text extraction completed",
+            context={
+                "processing_time_ms": processing_time_ms,
+                "confidence_score": best_confidence,
+                "extracted_text_length": (len(best_result.strip()) if best_result else 0),
+                "configs_tried": len(configs),
+                "image_preprocessed": True,
+            },
+            data={
+                "performance_metrics": {
+                    "processing_time_ms": processing_time_ms,
+                    "confidence_score": best_confidence,
+                    "text_extraction_success": best_result is not None,
+                    "fallback_used": best_result is None,
+                }
+            },
+        )
+
+        response = OCRTextResponse(
+            extracted_text=best_result.strip() if best_result else "",
+            confidence=best_confidence,
+            processing_time_ms=processing_time_ms,
+        )
+        _cache_ocr_result(file_hash, response)
+        return response
 
     def _extract_receipt_items(self, text: str) -> List[str]:
         """
@@ -681,287 +1787,64 @@ class OCRService:
         lines = text.split("\n")
         items = []
 
-        # Enhanced patterns to identify product lines
-        skip_patterns = [
-            # Store info patterns
-            r"^(fresh|market|grocery|store|shop|supermarket)",
-            r"^\d{1,3}\s+(main|street|ave|avenue|road|rd|st|drive|dr)",
-            r"^(anytown|city|town)",
-            r"^tel[:\s]*\(?[\d\s\-\)]+",
-            r"^phone[:\s]*\(?[\d\s\-\)]+",
-            # Receipt metadata patterns
-            r"^receipt\s*[#:]",
-            r"^date[:\s]*\d",
-            r"^time[:\s]*\d",
-            r"^cashier[:\s]*",
-            r"^clerk[:\s]*",
-            r"^register[:\s]*",
-            # Total/summary patterns - improved
-            r"^(sub)?total[:\s]*",
-            r"^tax[:\s]*\(?[\d\.%]+",
-            r"^change[:\s]*\$",
-            r"^payment[:\s]*",
-            r"^card[:\s]*",
-            r"^cash[:\s]*",
-            r"^subtott",  # OCR error for "subtotal"
-            r"^tot[:\s]*",  # OCR error for "total"
-            r"^tout[:\s]*",  # OCR error for "total"
-            # Footer patterns
-            r"^thank\s+you",
-            r"^have\s+a",
-            r"^visit\s+us",
-            r"^www\.",
-            r"^[\*\-=]{3,}",  # separators
-            # Standalone prices or numbers
-            r"^\$?\d+[.,]\d{2}$",
-            r"^\d{1,2}[:/]\d{1,2}[:/]\d{2,4}",  # dates
-        ]
-
-        # Enhanced patterns that indicate a product line
-        product_indicators = [
-            # Quantity patterns - more flexible for OCR errors
-            r"\(\d+\s*(lbs?|lb|pounds?|kg|g|oz|ounces?|bags?|count|ct|pcs?|pieces?|gallon|l|ml)\)",
-            r"\(\d+\s*(its|ibs|ib|be|bs|1b|11b|2b|ts|bults|butte|goz|cound|container|tresh|fresh)\)",  # OCR errors
-            r"\d+\s*x\s*",  # quantity multiplier
-            r"@\s*\$\d+[.,]\d{2}",  # unit price
-            r"\$\d+[.,]\d{2}\s*$",  # price at end of line
-            r"\$\d+[.,]\d{1,2}[.,]?\s*$",  # price with OCR errors
-            # Common quantity indicators without parentheses
-            r"\d+\s*(lbs?|lb|pounds?|kg|g|oz|ounces?|bags?|count|gallon|l|ml)\s",
-            r"\d+\s*(its|ibs|ib|be|bs|1b|11b|2b|ts|container)\s",  # OCR errors
-        ]
-
         # Pre-process lines to fix common OCR errors
         corrected_lines = []
         for line in lines:
-            # Fix common OCR errors in units
-            corrected_line = line
-            corrected_line = re.sub(r"\b(its|ibs)\b", "lbs", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(r"\b(ib|1b|11b)\b", "lb", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(r"\b(be|bs)\b", "lbs", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(r"\b(ts)\b", "lbs", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(r"\b(goz)\b", "8oz", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(r"\b(cound)\b", "count", corrected_line, flags=re.IGNORECASE)
-            corrected_line = re.sub(
-                r"\b(bults|butte)\b", "bulbs", corrected_line, flags=re.IGNORECASE
-            )
-            corrected_line = re.sub(r"\b(tresh)\b", "fresh", corrected_line, flags=re.IGNORECASE)
-
-            # Fix price formatting OCR errors
-            corrected_line = re.sub(
-                r"\$(\d+)(\d{2})([,.]?)", r"$\1.\2", corrected_line
-            )  # $398 -> $3.98
-            corrected_line = re.sub(
-                r"\$(\d+)[.,](\d{1})(\d{1})([,.]?)", r"$\1.\2\3", corrected_line
-            )  # $1.2.9 -> $1.29
+            # Blank, separator and number-only lines can never become product
+            # lines (the fixes below do not add letters), so drop them first
+            if not _ANY_LETTER_RE.search(line):
+                continue
 
+            # Fix common OCR errors in units and price formatting
+            corrected_line = _OCR_UNIT_FIX_RE.sub(_fix_ocr_unit, line)
+            for pattern, replacement in _PRICE_FIX_SUBS:
+                corrected_line = pattern.sub(replacement, corrected_line)
             corrected_lines.append(corrected_line)
 
         for line in corrected_lines:
             line = line.strip()
-            if not line or len(line) < 3:
+            if not _is_candidate_line(line):
                 continue
 
             # Skip lines matching skip patterns
-            if any(re.search(pattern, line.lower()) for pattern in skip_patterns):
-                continue
-
-            # Look for lines that contain alphabetic characters (potential product names)
-            if not re.search(r"[a-zA-Z]{2,}", line):
+            line_lower = line.lower()
+            if _SKIP_RE.search(line_lower):
                 continue
 
             # Check if line has product indicators or looks like a product line
-            has_product_indicator = any(
-                re.search(pattern, line, re.IGNORECASE) for pattern in product_indicators
-            )
-            has_letters_and_price = re.search(r"[a-zA-Z].*\$\d+[.,]\d{1,2}", line)
+            has_product_indicator = _PRODUCT_INDICATOR_RE.search(line)
+            has_letters_and_price = _LETTERS_AND_PRICE_RE.search(line)
 
             # Additional check: line starts with a food-related word
-            food_start_words = [
-                "tomato",
-                "onion",
-                "garlic",
-                "pepper",
-                "carrot",
-                "potato",
-                "spinach",
-                "banana",
-                "apple",
-                "orange",
-                "lemon",
-                "lime",
-                "berry",
-                "grape",
-                "chicken",
-                "beef",
-                "pork",
-                "fish",
-                "salmon",
-                "tuna",
-                "turkey",
-                "milk",
-                "cheese",
-                "egg",
-                "butter",
-                "yogurt",
-                "cream",
-                "bread",
-                "rice",
-                "pasta",
-                "flour",
-                "cereal",
-                "oat",
-                "oil",
-                "salt",
-                "pepper",
-                "spice",
-                "herb",
-                "basil",
-                "oregano",
-                "bean",
-                "lentil",
-                "nut",
-                "almond",
-                "walnut",
-                "lettuce",
-                "cabbage",
-                "broccoli",
-                "cauliflower",
-                "mushroom",
-                # Common variations and OCR errors
-                "tomatnes",
-                "onions",
-                "garlie",
-                "bellpeppers",
-                "cancts",
-                "bananas",
-                "apples",
-                "ground",
-                "salmon",
-                "fillet",
-                "mitk",
-                "imtik",
-                "eggs",
-                "fggs",
-                "cheddar",
-                "chesidar",
-                "pasa",
-                "otiweoit",
-                "otiveoil",
-                "basilfresh",
-            ]
-
-            starts_with_food = any(line.lower().startswith(word) for word in food_start_words)
+            starts_with_food = _FOOD_START_RE.match(line_lower) is not None
 
             if has_product_indicator or has_letters_and_price or starts_with_food:
                 # Advanced cleaning pipeline
                 cleaned_line = line
-
-                # Remove trailing prices (more flexible patterns)
-                cleaned_line = re.sub(r"\s*\$\d+[.,]\d{1,2}[.,]?\s*$", "", cleaned_line)
-                cleaned_line = re.sub(r"\s*\$\d+[.,]\d{1,2}\s*,?\s*$", "", cleaned_line)
-
-                # Remove trailing quantities and unit prices
-                cleaned_line = re.sub(r"\s*\d+\s*x\s*$", "", cleaned_line)
-                cleaned_line = re.sub(r"\s*@\s*\$\d+[.,]\d{1,2}\s*$", "", cleaned_line)
-
-                # Remove quantity indicators in parentheses but keep the text before
-                cleaned_line = re.sub(
-                    r"\s*\(\d+\s*(lbs?|lb|pounds?|kg|g|oz|ounces?|bags?|count|ct|pcs?|pieces?|gallon|l|ml)\)\s*",
-                    " ",
-                    cleaned_line,
-                )
-
-                # Remove trailing quantity without parentheses
-                cleaned_line = re.sub(
-                    r"\s*\(\d+\s*(its|ibs|ib|be|bs|1b|11b|2b|ts|bults|butte|goz|cound|container|tresh|fresh)\)\s*",
-                    " ",
-                    cleaned_line,
-                )
-                cleaned_line = re.sub(
-                    r"\s+\d+\s*(lbs?|lb|pounds?|kg|g|oz|ounces?|bags?|count|gallon|l|ml)\s*$",
-                    "",
-                    cleaned_line,
-                )
-
-                # Clean up extra whitespace and OCR artifacts
-                cleaned_line = re.sub(r"\s+", " ", cleaned_line)  # normalize whitespace
-                cleaned_line = re.sub(
-                    r"[^\w\s\-\']", " ", cleaned_line
-                )  # remove special chars except useful ones
+                for pattern, replacement in _ITEM_CLEANUP_SUBS:
+                    cleaned_line = pattern.sub(replacement, cleaned_line)
                 cleaned_line = cleaned_line.strip()
 
                 # Fix common product name OCR errors
-                cleaned_line = re.sub(
-                    r"\btomatnes\b", "tomatoes", cleaned_line, flags=re.IGNORECASE
-                )
-                cleaned_line = re.sub(r"\bgarlie\b", "garlic", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(
-                    r"\bbellpeppers\b",
-                    "bell peppers",
-                    cleaned_line,
-                    flags=re.IGNORECASE,
-                )
-                cleaned_line = re.sub(r"\bcancts\b", "carrots", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(r"\bmitk|imtik\b", "milk", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(r"\bfggs\b", "eggs", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(r"\bchesidar\b", "cheddar", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(r"\bpasa\b", "pasta", cleaned_line, flags=re.IGNORECASE)
-                cleaned_line = re.sub(
-                    r"\botiweoit|otiveoil\b",
-                    "olive oil",
-                    cleaned_line,
-                    flags=re.IGNORECASE,
-                )
-                cleaned_line = re.sub(
-                    r"\bbasilfresh\b", "basil fresh", cleaned_line, flags=re.IGNORECASE
-                )
+                cleaned_line = _PRODUCT_NAME_FIX_RE.sub(_fix_product_name, cleaned_line)
 
                 if cleaned_line and len(cleaned_line) >= 3:
-                    # Use dynamic ingredient names from the loaded file
-                    # This replaces the hardcoded food keywords with the comprehensive ingredient list
-                    food_keywords = (
-                        self._ingredient_names
-                        if self._ingredient_names
-                        else [
-                            # Fallback basic keywords if ingredient file loading failed
-                            "tomato",
-                            "onion",
-                            "garlic",
-                            "pepper",
-                            "carrot",
-                            "potato",
-                            "chicken",
-                            "beef",
-                            "pork",
-                            "fish",
-                            "milk",
-                            "cheese",
-                            "egg",
-                            "bread",
-                            "rice",
-                            "pasta",
-                            "oil",
-                            "salt",
-                            "pepper",
-                            "apple",
-                            "banana",
-                        ]
-                    )
-
-                    # Check if the item contains food-related keywords
-                    contains_food_keyword = any(
-                        keyword in cleaned_line.lower() for keyword in food_keywords
-                    )
+                    # Check if the item contains a known ingredient name, or one of
+                    # the basic keywords if the ingredient file could not be loaded
+                    cleaned_lower = cleaned_line.lower()
+                    if self._ingredients:
+                        contains_food_keyword = self._ingredients.contains_name_in(cleaned_lower)
+                    else:
+                        contains_food_keyword = any(
+                            keyword in cleaned_lower for keyword in _FALLBACK_FOOD_KEYWORDS
+                        )
 
                     # More lenient acceptance criteria
                     is_likely_product = (
                         contains_food_keyword
                         or len(cleaned_line.split()) <= 5  # Slightly longer items allowed
                         or starts_with_food
-                        or re.search(
-                            r"^[A-Z][a-z]+", cleaned_line
-                        )  # Capitalized words often products
+                        or _CAPITALIZED_RE.search(cleaned_line)  # Capitalized words often products
                     )
 
                     if is_likely_product:
@@ -971,6 +1854,33 @@ class OCRService:
 
         return items
 
+    async def process_receipts_batch(self, images: List[bytes]) -> List[OCRProcessedResponse]:
+        """
+        Process several receipt images with one service instance.
+
+        The batch reuses the loaded ingredient names, the persistent
+        tesseract APIs and the result cache instead of paying their setup
+        per receipt. At most OCR_BATCH_CONCURRENCY images run at a time, so
+        a large batch does not fill the shared OCR pool's queue ahead of
+        other users' uploads.
+
+        Args:
+            images: Raw image data of each receipt
+
+        Returns:
+            OCRProcessedResponse per image, in input order
+
+        Raises:
+            OCRError: If processing any of the images fails
+        """
+        semaphore = asyncio.Semaphore(settings.OCR_BATCH_CONCURRENCY)
+
+        async def process(image_data: bytes) -> OCRProcessedResponse:
+            async with semaphore:
+                return await self.process_receipt_without_suggestions(image_data)
+
+        return list(await asyncio.gather(*(process(image_data) for image_data in images)))
+
     async def process_receipt_without_suggestions(self, image_data: bytes) -> OCRProcessedResponse:
         """
         Process receipt image and extract items without database suggestions.
@@ -1000,9 +1910,8 @@ class OCRService:
                 quantity, unit, price = self._extract_quantity_and_price(item_text)
 
                 # Clean product name
-                clean_name = re.sub(r"\s*\$\d+[.,]\d{2}\s*$", "", item_text)  # remove price
-                clean_name = re.sub(r"\s*\(\d+.*?\)\s*", " ", clean_name)  # remove quantity info
-                clean_name = re.sub(r"\s+", " ", clean_name).strip()  # normalize whitespace
+                clean_name = _ITEM_NAME_NOISE_RE.sub(" ", item_text)
+                clean_name = _WHITESPACE_RE.sub(" ", clean_name).strip()
 
                 receipt_item = ReceiptItem(
                     detected_text=clean_name,
@@ -1050,6 +1959,18 @@ class OCRService:
             logger.error(f"Receipt processing failed: {str(e)}")
             raise OCRError(f"Failed to process receipt: {str(e)}", "RECEIPT_PROCESSING_FAILED")
 
+    def _load_image_for_ocr(self, image_data: bytes):
+        """
+        Decode image bytes and preprocess them for OCR.
+
+        Args:
+            image_data: Raw image data as bytes
+
+        Returns:
+            Preprocessed PIL Image
+        """
+        return self._preprocess_image_for_ocr(Image.open(BytesIO(image_data)))
+
     def _preprocess_image_for_ocr(self, image):
         """
         Preprocess image to improve OCR accuracy with optimal configuration.
@@ -1059,23 +1980,35 @@ class OCRService:
             image: PIL Image object
 
         Returns:
-            Preprocessed PIL Image
+            Preprocessed grayscale PIL Image
         """
         try:
-            # Convert to RGB if needed
-            if image.mode != "RGB":
-                image = image.convert("RGB")
+            # Convert to grayscale for better OCR performance, directly from any mode
+            gray_image = image if image.mode == "L" else image.convert("L")
 
-            # Convert to grayscale for better OCR performance
-            gray_image = image.convert("L")
+            # Step 0: Downscale large photos (tesseract time grows with pixel count),
+            # without letting the short side drop below the upscale minimum below
+            min_dimension = 800  # Reasonable minimum for good OCR
+            width, height = gray_image.size
+            scale_factor = max(
+                settings.OCR_MAX_IMAGE_DIMENSION / max(width, height),
+                min_dimension / min(width, height),
+            )
+            if scale_factor < 1:
+                new_width = int(width * scale_factor)
+                new_height = int(height * scale_factor)
+                gray_image = gray_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                logger.info(f"Downscaled image from {width}x{height} to {new_width}x{new_height}")
 
             # Optimal image enhancement pipeline based on testing results
             from PIL import ImageEnhance, ImageFilter
 
             # Step 1: OPTIMAL - Contrast enhancement (best performer in tests)
             # This setting showed the highest item detection rates across all test images
-            contrast_enhancer = ImageEnhance.Contrast(gray_image)
-            enhanced_image = contrast_enhancer.enhance(1.5)  # Optimal contrast boost from testing
+            # Applied as a lookup table, which gives the same result as ImageEnhance.Contrast
+            enhanced_image = gray_image.point(
+                _contrast_lut(gray_image.histogram(), 1.5)  # Optimal contrast boost from testing
+            )
 
             # Step 2: Light sharpening (supporting enhancement)
             sharpness_enhancer = ImageEnhance.Sharpness(enhanced_image)
@@ -1091,9 +2024,13 @@ class OCRService:
                 ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3)
             )
 
-            # Step 5: Scale image if it's too small (tesseract works better with larger images)
+            # Step 5: Optional Otsu binarization, so tesseract gets clean black text on white
+            if settings.OCR_BINARIZE_ENABLED:
+                threshold = _otsu_threshold(final_sharp.histogram())
+                final_sharp = final_sharp.point(lambda value: 255 if value > threshold else 0)
+
+            # Step 6: Scale image if it's too small (tesseract works better with larger images)
             width, height = final_sharp.size
-            min_dimension = 800  # Reasonable minimum for good OCR
 
             if width < min_dimension or height < min_dimension:
                 # Calculate scale factor
@@ -1122,11 +2059,10 @@ class OCRService:
                         final_sharp = final_sharp.resize((new_width, new_height))
                 logger.info(f"Upscaled image from {width}x{height} to {new_width}x{new_height}")
 
-            # Convert back to RGB for tesseract compatibility
-            processed_image = final_sharp.convert("RGB")
-
+            # Tesseract reads 8-bit grayscale as is; converting back to RGB would
+            # only triple the buffer it has to encode or copy
             logger.info("Image preprocessing completed successfully")
-            return processed_image
+            return final_sharp
 
         except Exception as e:
             logger.warning(f"Image preprocessing failed, using basic preprocessing: {str(e)}")
@@ -1159,142 +2095,21 @@ class OCRService:
         Returns:
             Tuple of (quantity, unit, price)
         """
-        quantity = None
-        unit = None
-        price = None
-
         try:
-            # Step 1: Advanced price extraction with OCR error patterns
-            price = self._extract_price_from_text(item_text)
-
-            # Step 2: Advanced quantity and unit extraction
-            quantity, unit = self._extract_quantity_and_unit_from_text(item_text)
-
+            return _parse_receipt_line(item_text)
         except Exception as e:
             logger.debug(f"Error extracting quantity/price from '{item_text}': {e}")
-
-        return quantity, unit, price
+            return None, None, None
 
     def _extract_price_from_text(self, text: str) -> Optional[float]:
-        """
-        Extract price with advanced OCR error correction.
-
-        Args:
-            text: Receipt line text
-
-        Returns:
-            Extracted price as float or None
-        """
-        # Multiple price patterns with OCR error tolerance
-        price_patterns = [
-            # Standard patterns
-            r"\$(\d+[.,]\d{2})",  # $12.34
-            r"\$(\d+[.,]\d{1,2})",  # $12.3 or $12.34
-            r"\$(\d+)",  # $12 (no cents)
-            # OCR error patterns - concatenated digits
-            r"\$(\d{1,2})(\d{2})(?![.,]\d)",  # $1234 -> $12.34
-            r"\$(\d{1,3})(\d{2})(?![.,]\d)",  # $12345 -> $123.45
-            # OCR error patterns - missing decimal point
-            r"\$(\d+)\s*(\d{2})\s*$",  # $12 34 -> $12.34
-            r"\$(\d+)(\d{2})\s*,?\s*$",  # $1234, -> $12.34
-            # European style (comma as decimal)
-            r"\$(\d+),(\d{1,2})",  # $12,34
-            # Space separated
-            r"\$\s*(\d+)[.,]?(\d{0,2})",  # $ 12.34 or $ 12 34
-            # Without dollar sign at end
-            r"(\d+[.,]\d{2})\s*$",  # 12.34 at end
-            r"(\d+)\s+(\d{2})\s*$",  # 12 34 at end
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if len(match.groups()) == 1:
-                        # Single group - standard price
-                        price_str = match.group(1).replace(",", ".")
-                        price = float(price_str)
-                        if (
-                            settings.OCR_MIN_PRICE <= price <= settings.OCR_MAX_PRICE
-                        ):  # Reasonable price range
-                            return price
-                    else:
-                        # Two groups - dollars and cents
-                        dollars = int(match.group(1))
-                        cents = int(match.group(2)) if match.group(2) else 0
-
-                        # Handle OCR concatenation errors
-                        if len(match.group(1)) >= 3 and match.group(2):
-                            # Likely concatenated: $1234 -> $12.34
-                            price_str = match.group(1) + match.group(2)
-                            if len(price_str) >= 3:
-                                dollars = int(price_str[:-2])
-                                cents = int(price_str[-2:])
-
-                        price = dollars + (cents / 100.0)
-                        if (
-                            settings.OCR_MIN_PRICE <= price <= settings.OCR_MAX_PRICE
-                        ):  # Reasonable price range
-                            return price
-                except (ValueError, IndexError):
-                    continue
-
-        return None
+        """Extract price with advanced OCR error correction."""
+        return _parse_price(text)
 
     def _extract_quantity_and_unit_from_text(
         self, text: str
     ) -> Tuple[Optional[float], Optional[str]]:
-        """
-        Extract quantity and unit with advanced pattern matching and OCR correction.
-
-        Args:
-            text: Receipt line text
-
-        Returns:
-            Tuple of (quantity, unit)
-        """
-        quantity = None
-        unit = None
-
-        # Enhanced quantity patterns with OCR error tolerance
-        quantity_patterns = [
-            # Standard parentheses patterns
-            r"\(([0-9.,]+)\s*([a-zA-Z]+)\)",  # (500 g)
-            r"\(([0-9.,]+)\s*x\s*([0-9.,]+)\s*([a-zA-Z]+)\)",  # (2 x 500 g)
-            # Standard space patterns
-            r"([0-9.,]+)\s*([a-zA-ZÄÖÜäöü]+)\b",  # 500 g, 2 Stück
-            r"([0-9.,]+)\s*x\s*([0-9.,]+)\s*([a-zA-Z]+)",  # 2 x 500 g
-            # Handle OCR common errors: 0->O, l->I, etc.
-            r"([O0-9.,I1l]+)\s*([a-zA-ZÄÖÜäöü]+)\b",
-        ]
-
-        for pattern in quantity_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                try:
-                    # Handle different match group structures
-                    if len(matches[0]) == 2:  # (quantity, unit)
-                        qty_str, unit_str = matches[0]
-                        # Simple quantity parsing with OCR correction
-                        qty_str = qty_str.replace("O", "0").replace("I", "1").replace("l", "1")
-                        quantity = float(qty_str.replace(",", "."))
-                        unit = unit_str.strip()
-                    elif len(matches[0]) == 3:  # (multiplier, quantity, unit)
-                        mult_str, qty_str, unit_str = matches[0]
-                        # Simple parsing with OCR correction
-                        mult_str = mult_str.replace("O", "0").replace("I", "1").replace("l", "1")
-                        qty_str = qty_str.replace("O", "0").replace("I", "1").replace("l", "1")
-                        multiplier = float(mult_str.replace(",", "."))
-                        base_qty = float(qty_str.replace(",", "."))
-                        quantity = multiplier * base_qty
-                        unit = unit_str.strip()
-
-                    if quantity and unit:
-                        return quantity, unit
-                except (ValueError, IndexError):
-                    continue
-
-        return None, None
+        """Extract quantity and unit with advanced pattern matching and OCR correction."""
+        return _parse_quantity_and_unit(text)
 
 
 # Enhanced standalone functions for better security
@@ -1342,3 +2157,32 @@ async def process_receipt_image(image_data: bytes) -> OCRProcessedResponse:
 
     ocr_service = OCRService()
     return await ocr_service.process_receipt_without_suggestions(image_data)
+
+
+async def process_receipt_images(images: List[bytes]) -> List[OCRProcessedResponse]:
+    """
+    Secure standalone function to process a batch of receipt images.
+
+    Args:
+        images: Raw image bytes of each receipt
+
+    Returns:
+        OCRProcessedResponse per image, in input order
+
+    Raises:
+        OCRError: If processing fails or the batch exceeds OCR_MAX_BATCH_SIZE
+    """
+    if not OCR_AVAILABLE:
+        raise OCRError(
+            "OCR service is not available. Please check tesseract installation.",
+            "OCR_SERVICE_UNAVAILABLE",
+        )
+
+    if len(images) > settings.OCR_MAX_BATCH_SIZE:
+        raise OCRError(
+            f"Cannot process more than {settings.OCR_MAX_BATCH_SIZE} receipt images at once",
+            "BATCH_TOO_LARGE",
+        )
+
+    ocr_service = OCRService()
+    return await ocr_service.process_receipts_batch(images)
@@ -21,14 +21,17 @@ from .schemas import (
     PantryCategoryStatsApiResponse,
     PantryExpiryApiResponse,
     PantryLowStockApiResponse,
+    PantryDashboardApiResponse,
 )
 from .services import (
     PantryItemError,
     PantryItemNotFoundError,
     PantryItemValidationError,
     create_pantry_item,
+    create_pantry_items,
     delete_pantry_item,
     get_pantry_item_by_id,
+    get_pantry_items_by_ids,
     get_user_pantry_items,
     update_pantry_item,
     # Bulk operations
@@ -40,6 +43,7 @@ from .services import (
     get_pantry_category_stats,
     get_pantry_expiry_report,
     get_pantry_low_stock_report,
+    get_pantry_dashboard,
 )
 
 # Router is available but not imported by default to avoid circular imports
@@ -64,10 +68,13 @@ __all__ = [
     "PantryCategoryStatsApiResponse",
     "PantryExpiryApiResponse",
     "PantryLowStockApiResponse",
+    "PantryDashboardApiResponse",
     # Services
     "get_user_pantry_items",
     "get_pantry_item_by_id",
+    "get_pantry_items_by_ids",
     "create_pantry_item",
+    "create_pantry_items",
     "update_pantry_item",
     "delete_pantry_item",
     # Bulk services
@@ -79,6 +86,7 @@ __all__ = [
     "get_pantry_category_stats",
     "get_pantry_expiry_report",
     "get_pantry_low_stock_report",
+    "get_pantry_dashboard",
     # Exceptions
     "PantryItemError",
     "PantryItemNotFoundError",
@@ -3,16 +3,19 @@ FastAPI Routes for Pantry Items Domain.
 Provides HTTP endpoints for user pantry management.
 """
 
-import math
+import hashlib
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
-from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from supabase._sync.client import SyncClient
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from supabase._async.client import AsyncClient
 
-from core.dependencies import get_db
+from core.config import settings
+from core.dependencies import get_async_db
+from core.error_handlers import get_request_id
 from core.logging import get_logger
 from middleware.security import get_current_user
 
@@ -21,7 +24,6 @@ from .schemas import (
     PantryItemApiResponse,
     PantryItemCreate,
     PantryItemListApiResponse,
-    PantryItemListResponse,
     PantryItemResponse,
     PantryItemUpdate,
     PantryItemConsume,
@@ -40,15 +42,21 @@ from .schemas import (
     PantryExpiryReport,
     PantryLowStockApiResponse,
     PantryLowStockReport,
+    PantryDashboardApiResponse,
+    PantryDashboard,
 )
 from .services import (
+    PantryItemData,
     PantryItemError,
     PantryItemNotFoundError,
     PantryItemValidationError,
     create_pantry_item,
+    decode_pantry_cursor,
     delete_pantry_item,
+    encode_pantry_cursor,
     get_pantry_item_by_id,
     get_user_pantry_items,
+    iter_user_pantry_items,
     update_pantry_item,
     consume_pantry_item,
     # Bulk operations
@@ -60,12 +68,111 @@ from .services import (
     get_pantry_category_stats,
     get_pantry_expiry_report,
     get_pantry_low_stock_report,
+    get_pantry_dashboard,
 )
 
 logger = get_logger(__name__)
 
-# Create router for pantry item endpoints
-router = APIRouter(prefix="/pantry", tags=["Pantry Items"])
+# Create router for pantry item endpoints; orjson encodes the (possibly large)
+# item lists, including UUIDs and dates, natively
+router = APIRouter(
+    prefix="/pantry",
+    tags=["Pantry Items"],
+    default_response_class=ORJSONResponse,
+)
+
+
+# Fields shared by the placeholder responses of bulk-deleted items
+_DELETED_ITEM_PLACEHOLDER = {
+    "name": "Deleted Item",
+    "quantity": 0.0,
+    "unit": "",
+    "category": None,
+    "expiry_date": None,
+}
+
+# Status code and log method for each pantry error; other subclasses of
+# PantryItemError fall back to the base entry
+_PANTRY_ERROR_RESPONSES = {
+    PantryItemNotFoundError: (status.HTTP_404_NOT_FOUND, logger.warning),
+    PantryItemValidationError: (status.HTTP_422_UNPROCESSABLE_ENTITY, logger.warning),
+    PantryItemError: (status.HTTP_500_INTERNAL_SERVER_ERROR, logger.error),
+}
+
+
+async def pantry_item_error_handler(request: Request, exc: PantryItemError) -> ORJSONResponse:
+    """Handle pantry item errors raised by any pantry route."""
+    status_code, log = _PANTRY_ERROR_RESPONSES.get(
+        type(exc), _PANTRY_ERROR_RESPONSES[PantryItemError]
+    )
+    request_id = get_request_id(request)
+    log(
+        f"Pantry error on {request.method} {request.url.path} (Request ID: {request_id}): {exc.message}",
+    )
+
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "error": "http_error",
+            "message": exc.message,
+            "request_id": request_id,
+            "status_code": status_code,
+        },
+    )
+
+
+# Validates a whole list of service items in one pydantic-core call
+_PANTRY_ITEM_LIST_ADAPTER = TypeAdapter(List[PantryItemResponse])
+
+
+def _to_response(item: PantryItemData) -> PantryItemResponse:
+    """Build the response model of a service item."""
+    return PantryItemResponse.model_validate(item, from_attributes=True)
+
+
+def _to_responses(items: List[PantryItemData]) -> List[PantryItemResponse]:
+    """Build the response models of service items."""
+    return _PANTRY_ITEM_LIST_ADAPTER.validate_python(items, from_attributes=True)
+
+
+def _json_response(payload: BaseModel, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """Encode a response model directly, skipping FastAPI's response re-validation."""
+    return ORJSONResponse(payload.model_dump(mode="json"), status_code=status_code)
+
+
+def _conditional_response(
+    request: Request, payload: Union[BaseModel, Dict[str, Any]], max_age: int = 0
+) -> Response:
+    """
+    Encode a GET response with an ETag of its body.
+
+    Clients sending that ETag back in If-None-Match get an empty 304 instead
+    of the same body again.
+
+    Args:
+        request: Incoming request
+        payload: Response model to send, or the same data as a JSON-ready dict
+        max_age: Seconds the client may reuse the response without asking
+            again; 0 leaves out the Cache-Control header
+
+    Returns:
+        304 response if the client's copy is current, else the encoded payload
+    """
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    response = ORJSONResponse(payload)
+    headers = {"ETag": f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'}
+    if max_age > 0:
+        headers["Cache-Control"] = (
+            f"private, max-age={max_age}, stale-while-revalidate={2 * max_age}"
+        )
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if headers["ETag"] in client_etags or "*" in client_etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return response
 
 
 @router.get(
@@ -76,70 +183,85 @@ router = APIRouter(prefix="/pantry", tags=["Pantry Items"])
     description="Retrieve all pantry items for the authenticated user with pagination and filtering options",
 )
 async def list_user_pantry_items(
+    request: Request,
     page: int = Query(1, description="Page number (1-based)", ge=1),
     per_page: int = Query(50, description="Items per page", ge=1, le=100),
     category: Optional[str] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search in item names"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor of the previous page; continues after it instead of using page",
+    ),
+    with_count: bool = Query(
+        False, description="Include total_count and total_pages (costs an extra query)"
+    ),
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get all pantry items for the authenticated user."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry items list")
+    logger.info(f"User {current_user.id} requesting pantry items list")
+
+    items, total_count, has_next = await get_user_pantry_items(
+        user_id=current_user.id,
+        supabase=supabase,
+        page=page,
+        per_page=per_page,
+        category=category,
+        search=search,
+        after=decode_pantry_cursor(cursor) if cursor is not None else None,
+        with_count=with_count,
+    )
+
+    total_pages = None
+    if total_count is not None:
+        total_pages = (total_count + per_page - 1) // per_page if total_count > 0 else 1
+
+    # The items go through PantryItemResponse in one TypeAdapter call and the
+    # envelope is left a dict; the body has the shape of PantryItemListApiResponse
+    return _conditional_response(
+        request,
+        {
+            "success": True,
+            "message": f"Retrieved {len(items)} pantry items",
+            "data": {
+                "items": _PANTRY_ITEM_LIST_ADAPTER.dump_python(_to_responses(items), mode="json"),
+                "total_count": total_count,
+                "page": page,
+                "per_page": per_page,
+                "total_pages": total_pages,
+                "has_next": has_next,
+                "next_cursor": encode_pantry_cursor(items[-1]) if has_next else None,
+            },
+        },
+    )
+
 
-        items, total_count = await get_user_pantry_items(
+@router.get(
+    "/items/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Stream user's pantry items",
+    description="Stream all pantry items for the authenticated user as newline-delimited JSON",
+    response_class=StreamingResponse,
+)
+async def stream_user_pantry_items(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    search: Optional[str] = Query(None, description="Search in item names"),
+    current_user=Depends(get_current_user),
+    supabase: AsyncClient = Depends(get_async_db),
+):
+    """Stream all pantry items for the authenticated user, one JSON object per line."""
+    logger.info(f"User {current_user.id} streaming pantry items")
+
+    async def encode_items():
+        async for item in iter_user_pantry_items(
             user_id=current_user.id,
             supabase=supabase,
-            page=page,
-            per_page=per_page,
             category=category,
             search=search,
-        )
-
-        # Convert to response objects
-        item_responses = [
-            PantryItemResponse(
-                id=item.id,
-                user_id=item.user_id,
-                name=item.name,
-                quantity=item.quantity,
-                unit=item.unit,
-                category=item.category,
-                expiry_date=item.expiry_date,
-                added_at=item.added_at,
-                ingredient_id=item.ingredient_id,
-            )
-            for item in items
-        ]
-
-        total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
-
-        list_response = PantryItemListResponse(
-            items=item_responses,
-            total_count=total_count,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-        )
-
-        return PantryItemListApiResponse(
-            success=True,
-            message=f"Retrieved {len(items)} pantry items",
-            data=list_response,
-        )
+        ):
+            yield _to_response(item).model_dump_json().encode() + b"\n"
 
-    except PantryItemError as e:
-        logger.error(f"Error listing pantry items for user {current_user.id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error listing pantry items: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+    return StreamingResponse(encode_items(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -150,56 +272,30 @@ async def list_user_pantry_items(
     description="Retrieve a specific pantry item by its ID (user can only access their own items)",
 )
 async def get_pantry_item(
+    request: Request,
     item_id: UUID,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get a specific pantry item by ID."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry item {item_id}")
+    logger.info(f"User {current_user.id} requesting pantry item {item_id}")
 
-        item = await get_pantry_item_by_id(
-            item_id=item_id,
-            user_id=current_user.id,
-            supabase=supabase,
-        )
+    item = await get_pantry_item_by_id(
+        item_id=item_id,
+        user_id=current_user.id,
+        supabase=supabase,
+    )
 
-        item_response = PantryItemResponse(
-            id=item.id,
-            user_id=item.user_id,
-            name=item.name,
-            quantity=item.quantity,
-            unit=item.unit,
-            category=item.category,
-            expiry_date=item.expiry_date,
-            added_at=item.added_at,
-            ingredient_id=item.ingredient_id,
-        )
+    item_response = _to_response(item)
 
-        return PantryItemApiResponse(
+    return _conditional_response(
+        request,
+        PantryItemApiResponse(
             success=True,
             message="Pantry item retrieved successfully",
             data=item_response,
-        )
-
-    except PantryItemNotFoundError as e:
-        logger.warning(f"Pantry item {item_id} not found for user {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except PantryItemError as e:
-        logger.error(f"Error getting pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error getting pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
 
 
 @router.post(
@@ -212,54 +308,27 @@ async def get_pantry_item(
 async def create_new_pantry_item(
     item_data: PantryItemCreate,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Create a new pantry item for the authenticated user."""
-    try:
-        logger.info(f"User {current_user.id} creating pantry item '{item_data.name}'")
+    logger.info(f"User {current_user.id} creating pantry item '{item_data.name}'")
 
-        item = await create_pantry_item(
-            user_id=current_user.id,
-            item_data=item_data,
-            supabase=supabase,
-        )
+    item = await create_pantry_item(
+        user_id=current_user.id,
+        item_data=item_data,
+        supabase=supabase,
+    )
 
-        item_response = PantryItemResponse(
-            id=item.id,
-            user_id=item.user_id,
-            name=item.name,
-            quantity=item.quantity,
-            unit=item.unit,
-            category=item.category,
-            expiry_date=item.expiry_date,
-            added_at=item.added_at,
-            ingredient_id=item.ingredient_id,
-        )
+    item_response = _to_response(item)
 
-        return PantryItemApiResponse(
+    return _json_response(
+        PantryItemApiResponse(
             success=True,
             message="Pantry item created successfully",
             data=item_response,
-        )
-
-    except PantryItemValidationError as e:
-        logger.warning(f"Validation error creating pantry item: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
-        )
-    except PantryItemError as e:
-        logger.error(f"Error creating pantry item: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error creating pantry item: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.put(
@@ -273,61 +342,27 @@ async def update_existing_pantry_item(
     item_id: UUID,
     item_data: PantryItemUpdate,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Update an existing pantry item."""
-    try:
-        logger.info(f"User {current_user.id} updating pantry item {item_id}")
+    logger.info(f"User {current_user.id} updating pantry item {item_id}")
 
-        item = await update_pantry_item(
-            item_id=item_id,
-            user_id=current_user.id,
-            item_data=item_data,
-            supabase=supabase,
-        )
+    item = await update_pantry_item(
+        item_id=item_id,
+        user_id=current_user.id,
+        item_data=item_data,
+        supabase=supabase,
+    )
 
-        item_response = PantryItemResponse(
-            id=item.id,
-            user_id=item.user_id,
-            name=item.name,
-            quantity=item.quantity,
-            unit=item.unit,
-            category=item.category,
-            expiry_date=item.expiry_date,
-            added_at=item.added_at,
-            ingredient_id=item.ingredient_id,
-        )
+    item_response = _to_response(item)
 
-        return PantryItemApiResponse(
+    return _json_response(
+        PantryItemApiResponse(
             success=True,
             message="Pantry item updated successfully",
             data=item_response,
-        )
-
-    except PantryItemNotFoundError as e:
-        logger.warning(f"Pantry item {item_id} not found for user {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except PantryItemValidationError as e:
-        logger.warning(f"Validation error updating pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
-        )
-    except PantryItemError as e:
-        logger.error(f"Error updating pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error updating pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
 
 
 @router.delete(
@@ -340,41 +375,23 @@ async def update_existing_pantry_item(
 async def delete_existing_pantry_item(
     item_id: UUID,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Delete a pantry item."""
-    try:
-        logger.info(f"User {current_user.id} deleting pantry item {item_id}")
+    logger.info(f"User {current_user.id} deleting pantry item {item_id}")
 
-        await delete_pantry_item(
-            item_id=item_id,
-            user_id=current_user.id,
-            supabase=supabase,
-        )
+    await delete_pantry_item(
+        item_id=item_id,
+        user_id=current_user.id,
+        supabase=supabase,
+    )
 
-        return MessageResponse(
+    return _json_response(
+        MessageResponse(
             success=True,
             message="Pantry item deleted successfully",
-        )
-
-    except PantryItemNotFoundError as e:
-        logger.warning(f"Pantry item {item_id} not found for user {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except PantryItemError as e:
-        logger.error(f"Error deleting pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error deleting pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
 
 
 # Bulk Operations Routes
@@ -388,54 +405,35 @@ async def delete_existing_pantry_item(
 async def bulk_create_pantry_items_endpoint(
     bulk_data: PantryItemBulkCreate,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Create multiple pantry items in bulk."""
-    try:
-        logger.info(f"User {current_user.id} bulk creating {len(bulk_data.items)} pantry items")
-
-        successful_items, failed_items = await bulk_create_pantry_items(
-            user_id=current_user.id,
-            items_data=bulk_data.items,
-            supabase=supabase,
-        )
-
-        # Convert successful items to response format
-        successful_responses = [
-            PantryItemResponse(
-                id=item.id,
-                user_id=item.user_id,
-                name=item.name,
-                quantity=item.quantity,
-                unit=item.unit,
-                category=item.category,
-                expiry_date=item.expiry_date,
-                added_at=item.added_at,
-                ingredient_id=item.ingredient_id,
-            )
-            for item in successful_items
-        ]
-
-        bulk_response = PantryItemBulkResponse(
-            successful=successful_responses,
-            failed=failed_items,
-            total_processed=len(bulk_data.items),
-            success_count=len(successful_items),
-            failure_count=len(failed_items),
-        )
-
-        return PantryItemBulkApiResponse(
+    logger.info(f"User {current_user.id} bulk creating {len(bulk_data.items)} pantry items")
+
+    successful_items, failed_items = await bulk_create_pantry_items(
+        user_id=current_user.id,
+        items_data=bulk_data.items,
+        supabase=supabase,
+    )
+
+    successful_responses = _to_responses(successful_items)
+
+    bulk_response = PantryItemBulkResponse(
+        successful=successful_responses,
+        failed=failed_items,
+        total_processed=len(bulk_data.items),
+        success_count=len(successful_items),
+        failure_count=len(failed_items),
+    )
+
+    return _json_response(
+        PantryItemBulkApiResponse(
             success=True,
             message=f"Bulk create completed: {len(successful_items)} successful, {len(failed_items)} failed",
             data=bulk_response,
-        )
-
-    except Exception as e:
-        logger.error(f"Error in bulk create pantry items: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.put(
@@ -448,54 +446,34 @@ async def bulk_create_pantry_items_endpoint(
 async def bulk_update_pantry_items_endpoint(
     bulk_data: PantryItemBulkUpdate,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Update multiple pantry items in bulk."""
-    try:
-        logger.info(f"User {current_user.id} bulk updating {len(bulk_data.updates)} pantry items")
-
-        successful_items, failed_items = await bulk_update_pantry_items(
-            user_id=current_user.id,
-            updates=bulk_data.updates,
-            supabase=supabase,
-        )
-
-        # Convert successful items to response format
-        successful_responses = [
-            PantryItemResponse(
-                id=item.id,
-                user_id=item.user_id,
-                name=item.name,
-                quantity=item.quantity,
-                unit=item.unit,
-                category=item.category,
-                expiry_date=item.expiry_date,
-                added_at=item.added_at,
-                ingredient_id=item.ingredient_id,
-            )
-            for item in successful_items
-        ]
-
-        bulk_response = PantryItemBulkResponse(
-            successful=successful_responses,
-            failed=failed_items,
-            total_processed=len(bulk_data.updates),
-            success_count=len(successful_items),
-            failure_count=len(failed_items),
-        )
-
-        return PantryItemBulkApiResponse(
+    logger.info(f"User {current_user.id} bulk updating {len(bulk_data.updates)} pantry items")
+
+    successful_items, failed_items = await bulk_update_pantry_items(
+        user_id=current_user.id,
+        updates=bulk_data.updates,
+        supabase=supabase,
+    )
+
+    successful_responses = _to_responses(successful_items)
+
+    bulk_response = PantryItemBulkResponse(
+        successful=successful_responses,
+        failed=failed_items,
+        total_processed=len(bulk_data.updates),
+        success_count=len(successful_items),
+        failure_count=len(failed_items),
+    )
+
+    return _json_response(
+        PantryItemBulkApiResponse(
             success=True,
             message=f"Bulk update completed: {len(successful_items)} successful, {len(failed_items)} failed",
             data=bulk_response,
-        )
-
-    except Exception as e:
-        logger.error(f"Error in bulk update pantry items: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
 
 
 @router.delete(
@@ -508,54 +486,46 @@ async def bulk_update_pantry_items_endpoint(
 async def bulk_delete_pantry_items_endpoint(
     bulk_data: PantryItemBulkDelete,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Delete multiple pantry items in bulk."""
-    try:
-        logger.info(f"User {current_user.id} bulk deleting {len(bulk_data.item_ids)} pantry items")
-
-        successful_ids, failed_items = await bulk_delete_pantry_items(
+    logger.info(f"User {current_user.id} bulk deleting {len(bulk_data.item_ids)} pantry items")
+
+    successful_ids, failed_items = await bulk_delete_pantry_items(
+        user_id=current_user.id,
+        item_ids=bulk_data.item_ids,
+        supabase=supabase,
+    )
+
+    # Create mock successful responses for deleted items from a shared
+    # placeholder, skipping validation (its empty unit would not pass it)
+    now = datetime.now()
+    successful_responses = [
+        PantryItemResponse.model_construct(
+            id=item_id,
             user_id=current_user.id,
-            item_ids=bulk_data.item_ids,
-            supabase=supabase,
-        )
-
-        # Create mock successful responses for deleted items
-        successful_responses = [
-            PantryItemResponse(
-                id=item_id,
-                user_id=current_user.id,
-                name="Deleted Item",
-                quantity=0,
-                unit="",
-                category=None,
-                expiry_date=None,
-                added_at=datetime.now(),
-                ingredient_id=item_id,  # Placeholder
-            )
-            for item_id in successful_ids
-        ]
-
-        bulk_response = PantryItemBulkResponse(
-            successful=successful_responses,
-            failed=failed_items,
-            total_processed=len(bulk_data.item_ids),
-            success_count=len(successful_ids),
-            failure_count=len(failed_items),
-        )
-
-        return PantryItemBulkApiResponse(
+            added_at=now,
+            ingredient_id=item_id,  # Placeholder
+            **_DELETED_ITEM_PLACEHOLDER,
+        )
+        for item_id in successful_ids
+    ]
+
+    bulk_response = PantryItemBulkResponse(
+        successful=successful_responses,
+        failed=failed_items,
+        total_processed=len(bulk_data.item_ids),
+        success_count=len(successful_ids),
+        failure_count=len(failed_items),
+    )
+
+    return _json_response(
+        PantryItemBulkApiResponse(
             success=True,
             message=f"Bulk delete completed: {len(successful_ids)} successful, {len(failed_items)} failed",
             data=bulk_response,
-        )
-
-    except Exception as e:
-        logger.error(f"Error in bulk delete pantry items: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
 
 
 # Statistics and Analytics Routes
@@ -567,38 +537,29 @@ async def bulk_delete_pantry_items_endpoint(
     description="Get comprehensive statistics about the user's pantry",
 )
 async def get_pantry_statistics(
+    request: Request,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get pantry overview statistics."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry statistics")
+    logger.info(f"User {current_user.id} requesting pantry statistics")
 
-        stats_data = await get_pantry_stats_overview(
-            user_id=current_user.id,
-            supabase=supabase,
-        )
+    stats_data = await get_pantry_stats_overview(
+        user_id=current_user.id,
+        supabase=supabase,
+    )
 
-        stats_response = PantryStatsOverview(**stats_data)
+    stats_response = PantryStatsOverview(**stats_data)
 
-        return PantryStatsApiResponse(
+    return _conditional_response(
+        request,
+        PantryStatsApiResponse(
             success=True,
             message="Pantry statistics retrieved successfully",
             data=stats_response,
-        )
-
-    except PantryItemError as e:
-        logger.error(f"Error getting pantry statistics for user {current_user.id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error getting pantry statistics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+        max_age=settings.PANTRY_STATS_MAX_AGE_SECONDS,
+    )
 
 
 @router.get(
@@ -609,38 +570,29 @@ async def get_pantry_statistics(
     description="Get breakdown of pantry items by category",
 )
 async def get_pantry_category_statistics(
+    request: Request,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get pantry category statistics."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry category statistics")
+    logger.info(f"User {current_user.id} requesting pantry category statistics")
 
-        stats_data = await get_pantry_category_stats(
-            user_id=current_user.id,
-            supabase=supabase,
-        )
+    stats_data = await get_pantry_category_stats(
+        user_id=current_user.id,
+        supabase=supabase,
+    )
 
-        stats_response = PantryCategoryStats(**stats_data)
+    stats_response = PantryCategoryStats(**stats_data)
 
-        return PantryCategoryStatsApiResponse(
+    return _conditional_response(
+        request,
+        PantryCategoryStatsApiResponse(
             success=True,
             message="Category statistics retrieved successfully",
             data=stats_response,
-        )
-
-    except PantryItemError as e:
-        logger.error(f"Error getting category statistics for user {current_user.id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error getting category statistics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+        max_age=settings.PANTRY_STATS_MAX_AGE_SECONDS,
+    )
 
 
 @router.get(
@@ -651,38 +603,29 @@ async def get_pantry_category_statistics(
     description="Get report of items by expiry status (expired, expiring soon, fresh)",
 )
 async def get_pantry_expiry_report_endpoint(
+    request: Request,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get pantry expiry report."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry expiry report")
+    logger.info(f"User {current_user.id} requesting pantry expiry report")
 
-        report_data = await get_pantry_expiry_report(
-            user_id=current_user.id,
-            supabase=supabase,
-        )
+    report_data = await get_pantry_expiry_report(
+        user_id=current_user.id,
+        supabase=supabase,
+    )
 
-        report_response = PantryExpiryReport(**report_data)
+    report_response = PantryExpiryReport(**report_data)
 
-        return PantryExpiryApiResponse(
+    return _conditional_response(
+        request,
+        PantryExpiryApiResponse(
             success=True,
             message="Expiry report retrieved successfully",
             data=report_response,
-        )
-
-    except PantryItemError as e:
-        logger.error(f"Error getting expiry report for user {current_user.id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error getting expiry report: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+        max_age=settings.PANTRY_STATS_MAX_AGE_SECONDS,
+    )
 
 
 @router.get(
@@ -693,40 +636,68 @@ async def get_pantry_expiry_report_endpoint(
     description="Get report of items with low stock levels",
 )
 async def get_pantry_low_stock_report_endpoint(
+    request: Request,
     threshold: float = Query(1.0, description="Quantity threshold for low stock", ge=0, le=10),
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Get pantry low stock report."""
-    try:
-        logger.info(f"User {current_user.id} requesting pantry low stock report with threshold {threshold}")
+    logger.info(
+        f"User {current_user.id} requesting pantry low stock report with threshold {threshold}"
+    )
 
-        report_data = await get_pantry_low_stock_report(
-            user_id=current_user.id,
-            supabase=supabase,
-            threshold=threshold,
-        )
+    report_data = await get_pantry_low_stock_report(
+        user_id=current_user.id,
+        supabase=supabase,
+        threshold=threshold,
+    )
 
-        report_response = PantryLowStockReport(**report_data)
+    report_response = PantryLowStockReport(**report_data)
 
-        return PantryLowStockApiResponse(
+    return _conditional_response(
+        request,
+        PantryLowStockApiResponse(
             success=True,
             message="Low stock report retrieved successfully",
             data=report_response,
-        )
+        ),
+        max_age=settings.PANTRY_STATS_MAX_AGE_SECONDS,
+    )
 
-    except PantryItemError as e:
-        logger.error(f"Error getting low stock report for user {current_user.id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error getting low stock report: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+
+@router.get(
+    "/dashboard",
+    response_model=PantryDashboardApiResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get pantry dashboard",
+    description="Get overview, category, expiry and low stock statistics in one request",
+)
+async def get_pantry_dashboard_endpoint(
+    request: Request,
+    threshold: float = Query(1.0, description="Quantity threshold for low stock", ge=0, le=10),
+    current_user=Depends(get_current_user),
+    supabase: AsyncClient = Depends(get_async_db),
+):
+    """Get all pantry statistics for a dashboard."""
+    logger.info(f"User {current_user.id} requesting pantry dashboard")
+
+    dashboard_data = await get_pantry_dashboard(
+        user_id=current_user.id,
+        supabase=supabase,
+        threshold=threshold,
+    )
+
+    dashboard_response = PantryDashboard(**dashboard_data)
+
+    return _conditional_response(
+        request,
+        PantryDashboardApiResponse(
+            success=True,
+            message="Pantry dashboard retrieved successfully",
+            data=dashboard_response,
+        ),
+        max_age=settings.PANTRY_STATS_MAX_AGE_SECONDS,
+    )
 
 
 @router.post(
@@ -740,67 +711,37 @@ async def consume_existing_pantry_item(
     item_id: UUID,
     consume_data: PantryItemConsume,
     current_user=Depends(get_current_user),
-    supabase: SyncClient = Depends(get_db),
+    supabase: AsyncClient = Depends(get_async_db),
 ):
     """Consume/reduce quantity of a pantry item."""
-    try:
-        logger.info(f"User {current_user.id} consuming {consume_data.quantity} from pantry item {item_id}")
-
-        item = await consume_pantry_item(
-            item_id=item_id,
-            user_id=current_user.id,
-            consume_quantity=consume_data.quantity,
-            supabase=supabase,
-        )
-
-        # If item is None, it means the item was completely consumed and deleted
-        if item is None:
-            return PantryItemApiResponse(
+    logger.info(
+        f"User {current_user.id} consuming {consume_data.quantity} from pantry item {item_id}"
+    )
+
+    item = await consume_pantry_item(
+        item_id=item_id,
+        user_id=current_user.id,
+        consume_quantity=consume_data.quantity,
+        supabase=supabase,
+    )
+
+    # If item is None, it means the item was completely consumed and deleted
+    if item is None:
+        return _json_response(
+            PantryItemApiResponse(
                 success=True,
                 message=f"Successfully consumed {consume_data.quantity}. Item was completely used up and removed from pantry.",
                 data=None,
-            )
-
-        # Item still exists with remaining quantity
-        item_response = PantryItemResponse(
-            id=item.id,
-            user_id=item.user_id,
-            name=item.name,
-            quantity=item.quantity,
-            unit=item.unit,
-            category=item.category,
-            expiry_date=item.expiry_date,
-            added_at=item.added_at,
-            ingredient_id=item.ingredient_id,
+            ),
         )
 
-        return PantryItemApiResponse(
+    # Item still exists with remaining quantity
+    item_response = _to_response(item)
+
+    return _json_response(
+        PantryItemApiResponse(
             success=True,
             message=f"Successfully consumed {consume_data.quantity} {item.unit}. Remaining: {item.quantity} {item.unit}",
             data=item_response,
-        )
-
-    except PantryItemNotFoundError as e:
-        logger.warning(f"Pantry item {item_id} not found for user {current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except PantryItemValidationError as e:
-        logger.warning(f"Validation error consuming from pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e),
-        )
-    except PantryItemError as e:
-        logger.error(f"Error consuming from pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Unexpected error consuming from pantry item {item_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
-        )
+        ),
+    )
@@ -4,36 +4,25 @@ Defines request/response models for the pantry items API.
 """
 
 from datetime import date, datetime
-from typing import List, Optional, Dict
+from typing import Annotated, List, Optional, Dict
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
+
+# Stripped by pydantic-core before the length checks, so blank values fail min_length
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
 
 
 class PantryItemBase(BaseModel):
     """Base schema for pantry item data."""
     
-    name: str = Field(..., description="Name of the pantry item", min_length=1, max_length=255)
+    name: _StrippedStr = Field(..., description="Name of the pantry item", min_length=1, max_length=255)
     quantity: float = Field(..., description="Quantity of the item", gt=0)
-    unit: str = Field(..., description="Unit of measurement", min_length=1, max_length=50)
+    unit: _StrippedStr = Field(..., description="Unit of measurement", min_length=1, max_length=50)
     category: Optional[str] = Field(None, description="Category of the item", max_length=100)
     expiry_date: Optional[date] = Field(None, description="Expiry date of the item")
     ingredient_id: UUID = Field(..., description="ID of the ingredient from master table")
 
-    @field_validator("quantity")
-    @classmethod
-    def validate_quantity(cls, v):
-        if v <= 0:
-            raise ValueError("Quantity must be greater than 0")
-        return v
-
-    @field_validator("name", "unit")
-    @classmethod
-    def validate_not_empty(cls, v):
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty")
-        return v.strip()
-
 
 class PantryItemCreate(PantryItemBase):
     """Schema for creating a new pantry item."""
@@ -55,39 +44,18 @@ class PantryItemBulkCreate(BaseModel):
 class PantryItemUpdate(BaseModel):
     """Schema for updating a pantry item."""
     
-    name: Optional[str] = Field(None, description="Name of the pantry item", min_length=1, max_length=255)
+    name: Optional[_StrippedStr] = Field(None, description="Name of the pantry item", min_length=1, max_length=255)
     quantity: Optional[float] = Field(None, description="Quantity of the item", gt=0)
-    unit: Optional[str] = Field(None, description="Unit of measurement", min_length=1, max_length=50)
+    unit: Optional[_StrippedStr] = Field(None, description="Unit of measurement", min_length=1, max_length=50)
     category: Optional[str] = Field(None, description="Category of the item", max_length=100)
     expiry_date: Optional[date] = Field(None, description="Expiry date of the item")
     ingredient_id: Optional[UUID] = Field(None, description="ID of the ingredient from master table")
 
-    @field_validator("quantity")
-    @classmethod
-    def validate_quantity(cls, v):
-        if v is not None and v <= 0:
-            raise ValueError("Quantity must be greater than 0")
-        return v
-
-    @field_validator("name", "unit")
-    @classmethod
-    def validate_not_empty(cls, v):
-        if v is not None and (not v or not v.strip()):
-            raise ValueError("Field cannot be empty")
-        return v.strip() if v else v
-
 
 class PantryItemConsume(BaseModel):
     """Schema for consuming/reducing quantity of a pantry item."""
     
     quantity: float = Field(..., description="Quantity to consume (positive value)", gt=0)
-    
-    @field_validator("quantity")
-    @classmethod
-    def validate_quantity(cls, v):
-        if v <= 0:
-            raise ValueError("Consume quantity must be greater than 0")
-        return v
 
 
 class PantryItemBatchConsume(BaseModel):
@@ -167,10 +135,12 @@ class PantryItemListResponse(BaseModel):
     """Schema for pantry item list response."""
     
     items: List[PantryItemResponse] = Field(..., description="List of pantry items")
-    total_count: int = Field(..., description="Total number of items")
+    total_count: Optional[int] = Field(None, description="Total number of items, only when requested with with_count")
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages, only when requested with with_count")
+    has_next: bool = Field(False, description="Whether there is a next page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there is one")
 
 
 class PantryItemApiResponse(BaseModel):
@@ -318,3 +288,20 @@ class PantryLowStockApiResponse(BaseModel):
     success: bool = Field(True, description="Operation success status")
     message: str = Field(..., description="Response message")
     data: Optional[PantryLowStockReport] = Field(None, description="Low stock report data")
+
+
+class PantryDashboard(BaseModel):
+    """All pantry statistics for a dashboard."""
+    
+    overview: PantryStatsOverview = Field(..., description="Overview statistics")
+    categories: PantryCategoryStats = Field(..., description="Category statistics")
+    expiry: PantryExpiryReport = Field(..., description="Expiry report")
+    low_stock: PantryLowStockReport = Field(..., description="Low stock report")
+
+
+class PantryDashboardApiResponse(BaseModel):
+    """API response wrapper for the pantry dashboard."""
+    
+    success: bool = Field(True, description="Operation success status")
+    message: str = Field(..., description="Response message")
+    data: Optional[PantryDashboard] = Field(None, description="Dashboard data")
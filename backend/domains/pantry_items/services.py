@@ -3,12 +3,23 @@ Business Logic for Pantry Items Domain.
 Handles all pantry item operations and database interactions.
 """
 
-from datetime import date, datetime, timedelta
-from typing import List, Optional, Dict, Tuple
+import asyncio
+import base64
+import functools
+import hashlib
+import hmac
+import inspect
+import itertools
+import struct
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, List, Optional, Dict, Tuple
 from uuid import UUID
 
-from supabase._sync.client import SyncClient
+from supabase._async.client import AsyncClient
 
+from core.config import settings
 from core.logging import get_logger
 
 from .schemas import PantryItemCreate, PantryItemUpdate
@@ -42,6 +53,27 @@ class PantryItemData:
 logger = get_logger(__name__)
 
 
+# List cursors: microseconds since the epoch of added_at and the item id,
+# followed by a signature
+_CURSOR_FORMAT = struct.Struct(">q16s")
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Statistics and list results per user, least recently used user first. Each
+# user maps (report, parameters) to (expiry time, result).
+_STATS_CACHE: "OrderedDict[str, Dict[tuple, Tuple[float, Dict]]]" = OrderedDict()
+
+# Generation of each user's pantry, renewed on every invalidation, least
+# recently written user first. A read only stores its result if the
+# generation it started under is still current.
+_STATS_GENERATIONS: "OrderedDict[str, int]" = OrderedDict()
+_STATS_GENERATION_COUNTER = itertools.count(1)
+
+# By-id lookups waiting to be sent as one query, per (user, client), and the
+# tasks sending them
+_PENDING_ITEM_LOOKUPS: Dict[Tuple[str, int], List[Tuple[UUID, "asyncio.Future[Optional[Dict]]"]]] = {}
+_ITEM_LOOKUP_TASKS: "set[asyncio.Task]" = set()
+
+
 class PantryItemError(Exception):
     """Base exception for pantry item operations."""
     
@@ -64,72 +96,375 @@ class PantryItemValidationError(PantryItemError):
         super().__init__(message)
 
 
+async def _run_bulk(
+    operations: List[Tuple[Hashable, Callable[[], Awaitable[Any]]]],
+) -> List[Any]:
+    """
+    Run bulk item operations concurrently, at most DB_BULK_CONCURRENCY at a time.
+    
+    Operations sharing a key run one after another, so e.g. two items for
+    the same ingredient still merge instead of racing to insert.
+    
+    Args:
+        operations: (key, operation) pairs, in input order
+        
+    Returns:
+        Each operation's result or raised exception, in input order
+    """
+    semaphore = asyncio.Semaphore(settings.DB_BULK_CONCURRENCY)
+    results: List[Any] = [None] * len(operations)
+    groups: Dict[Hashable, List[int]] = {}
+    for index, (key, _) in enumerate(operations):
+        groups.setdefault(key, []).append(index)
+
+    async def run_group(indices: List[int]) -> None:
+        async with semaphore:
+            for index in indices:
+                try:
+                    results[index] = await operations[index][1]()
+                except Exception as e:
+                    results[index] = e
+
+    await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+    return results
+
+
+def _lookup_pantry_item_row(
+    item_id: UUID,
+    user_id: UUID,
+    supabase: AsyncClient,
+) -> "asyncio.Future[Optional[Dict]]":
+    """
+    Look up one of a user's pantry item rows, batched with concurrent lookups.
+    
+    Lookups for the same user made while the event loop runs the other ready
+    requests are sent together as a single id IN (...) query.
+    
+    Args:
+        item_id: ID of the pantry item
+        user_id: ID of the user (for authorization)
+        supabase: Supabase client
+        
+    Returns:
+        Future of the row, or of None if the user has no such item
+    """
+    loop = asyncio.get_running_loop()
+    key = (str(user_id), id(supabase))
+    batch = _PENDING_ITEM_LOOKUPS.get(key)
+    if batch is None:
+        batch = _PENDING_ITEM_LOOKUPS[key] = []
+        task = loop.create_task(_flush_item_lookups(key, user_id, supabase))
+        _ITEM_LOOKUP_TASKS.add(task)
+        task.add_done_callback(_ITEM_LOOKUP_TASKS.discard)
+    
+    future = loop.create_future()
+    batch.append((item_id, future))
+    return future
+
+
+async def _flush_item_lookups(key: Tuple[str, int], user_id: UUID, supabase: AsyncClient) -> None:
+    """Send a user's pending item lookups as one query and resolve their futures."""
+    # Let the other ready requests queue their lookups first
+    await asyncio.sleep(0)
+    batch = _PENDING_ITEM_LOOKUPS.pop(key)
+    try:
+        rows = await _fetch_pantry_item_rows([item_id for item_id, _ in batch], user_id, supabase)
+        for item_id, future in batch:
+            if not future.done():
+                future.set_result(rows.get(item_id))
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        for _, future in batch:
+            future.cancel()
+
+
+async def _fetch_pantry_item_rows(
+    item_ids: List[UUID],
+    user_id: UUID,
+    supabase: AsyncClient,
+) -> Dict[UUID, Dict]:
+    """Fetch a user's pantry item rows by id in one id IN (...) query."""
+    response = await (
+        supabase.table("pantry_items")
+        .select("*")
+        .eq("user_id", str(user_id))
+        .in_("id", [str(item_id) for item_id in dict.fromkeys(item_ids)])
+        .execute()
+    )
+    return {UUID(str(row["id"])): row for row in response.data or []}
+
+
+def _invalidate_stats(user_id: UUID) -> None:
+    """Drop the cached statistics of a user after their pantry changed."""
+    user_key = str(user_id)
+    _STATS_CACHE.pop(user_key, None)
+    _STATS_GENERATIONS[user_key] = next(_STATS_GENERATION_COUNTER)
+    _STATS_GENERATIONS.move_to_end(user_key)
+    while len(_STATS_GENERATIONS) > settings.PANTRY_STATS_CACHE_SIZE:
+        _STATS_GENERATIONS.popitem(last=False)
+
+
+def _cached_stats(report: str, ttl_setting: str = "PANTRY_STATS_CACHE_TTL_SECONDS"):
+    """
+    Cache a statistics function's result per user for a TTL from the settings.
+    
+    Arguments may be passed positionally or by keyword; the cache key holds
+    every argument after supabase with defaults filled in, so equivalent
+    calls share an entry. Results are kept per process, for at most
+    PANTRY_STATS_CACHE_SIZE users.
+    Pantry writes through this module invalidate the user's entries, and a
+    read that was in flight during a write does not store its result; the
+    TTL bounds how stale other workers' copies can get. Expired entries of a
+    user are dropped whenever a new one is stored for them.
+    
+    Every caller gets the same cached object, so results must not be
+    mutated.
+    
+    Args:
+        report: Name of the report, part of the cache key
+        ttl_setting: Name of the setting holding the TTL in seconds
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            ttl = getattr(settings, ttl_setting)
+            if ttl <= 0:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            user_id, _, *params = bound.arguments.values()
+            user_key = str(user_id)
+            key = (report, *params)
+            entries = _STATS_CACHE.get(user_key)
+            if entries is not None:
+                _STATS_CACHE.move_to_end(user_key)
+                cached = entries.get(key)
+                if cached is not None and cached[0] > time.monotonic():
+                    return cached[1]
+
+            generation = _STATS_GENERATIONS.get(user_key)
+            result = await func(*bound.args, **bound.kwargs)
+            if _STATS_GENERATIONS.get(user_key) != generation:
+                return result
+
+            now = time.monotonic()
+            entries = {
+                entry_key: entry
+                for entry_key, entry in _STATS_CACHE.get(user_key, {}).items()
+                if entry[0] > now
+            }
+            entries[key] = (now + ttl, result)
+            _STATS_CACHE[user_key] = entries
+            _STATS_CACHE.move_to_end(user_key)
+            while len(_STATS_CACHE) > settings.PANTRY_STATS_CACHE_SIZE:
+                _STATS_CACHE.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _user_pantry_items_query(
+    user_id: UUID,
+    supabase: AsyncClient,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    count: Optional[str] = None,
+    head: bool = False,
+):
+    """
+    Build the query for a user's pantry items, with optional filters.
+    
+    count="exact" has PostgREST count the matching rows; with head, only that
+    count is returned, without any rows.
+    """
+    query = (
+        supabase.table("pantry_items")
+        .select("id" if head else "*", count=count, head=head)
+        .eq("user_id", str(user_id))
+    )
+    
+    if category:
+        query = query.eq("category", category)
+    
+    if search:
+        query = query.ilike("name", f"%{search}%")
+    
+    return query
+
+
+@_cached_stats("item_count")
+async def _count_user_pantry_items(
+    user_id: UUID,
+    supabase: AsyncClient,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+) -> int:
+    """Count a user's pantry items matching the list filters."""
+    response = await _user_pantry_items_query(
+        user_id, supabase, category, search, count="exact", head=True
+    ).execute()
+    return response.count or 0
+
+
+def _order_and_continue(query, after: Optional[Tuple[datetime, UUID]]):
+    """
+    Order a pantry items query newest first and continue after a position.
+    
+    The id breaks ties between equal timestamps, so (added_at, id) is a
+    unique position a keyset filter can continue from.
+    """
+    query = query.order("added_at", desc=True).order("id", desc=True)
+    if after is not None:
+        added_at, item_id = after
+        timestamp = f'"{added_at.isoformat()}"'
+        query = query.or_(
+            f"added_at.lt.{timestamp},and(added_at.eq.{timestamp},id.lt.{item_id})"
+        )
+    return query
+
+
+@_cached_stats("items", ttl_setting="PANTRY_LIST_CACHE_TTL_SECONDS")
 async def get_user_pantry_items(
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
     page: int = 1,
     per_page: int = 50,
     category: Optional[str] = None,
     search: Optional[str] = None,
-) -> tuple[List[PantryItemData], int]:
+    after: Optional[Tuple[datetime, UUID]] = None,
+    with_count: bool = False,
+) -> tuple[List[PantryItemData], Optional[int], bool]:
     """
     Get all pantry items for a specific user with pagination and filtering.
     
+    Pages are cached per user and parameters for PANTRY_LIST_CACHE_TTL_SECONDS,
+    so a client polling the list mostly hits the cache. Cached items are
+    shared between callers and must not be mutated.
+    
     Args:
         user_id: ID of the user
         supabase: Supabase client
-        page: Page number (1-based)
+        page: Page number (1-based), ignored when after is given
         per_page: Items per page
         category: Filter by category (optional)
         search: Search in item names (optional)
+        after: (added_at, id) of the last item of the previous page (optional).
+            Continues after it with a keyset filter instead of an offset, so
+            deep pages cost the same as the first one
+        with_count: Whether to count all matching items. Offset pages get the
+            count in the same request; cursor pages need an extra count
+            query unless a recent count is cached
         
     Returns:
-        Tuple of (items_list, total_count)
+        Tuple of (items_list, total_count, has_next); total_count is None
+        unless with_count is set
     """
     try:
         logger.info(f"Fetching pantry items for user {user_id}, page {page}, per_page {per_page}")
         
-        # Build query
-        query = supabase.table("pantry_items").select("*").eq("user_id", str(user_id))
-        
-        # Add filters
-        if category:
-            query = query.eq("category", category)
-        
-        if search:
-            query = query.ilike("name", f"%{search}%")
+        # Offset pages have PostgREST count the matching rows in the same
+        # request. The keyset filter of a cursor page would narrow that
+        # count, so those use a separate count, cached across pages
+        count_in_query = with_count and after is None
+        query = _user_pantry_items_query(
+            user_id, supabase, category, search, count="exact" if count_in_query else None
+        )
         
-        # Get total count first
-        count_response = query.execute()
-        total_count = len(count_response.data) if count_response.data else 0
+        total_count = None
+        if with_count and after is not None:
+            total_count = await _count_user_pantry_items(
+                user_id, supabase, category=category, search=search
+            )
         
-        # Apply pagination and ordering
-        offset = (page - 1) * per_page
-        query = query.order("added_at", desc=True).range(offset, offset + per_page - 1)
+        # Apply pagination and ordering; one row past the page tells whether
+        # there is a next page without counting
+        query = _order_and_continue(query, after)
+        if after is not None:
+            query = query.limit(per_page + 1)
+        else:
+            offset = (page - 1) * per_page
+            query = query.range(offset, offset + per_page)
         
-        response = query.execute()
+        response = await query.execute()
+        if count_in_query:
+            total_count = response.count or 0
         
         if not response.data:
             logger.info(f"No pantry items found for user {user_id}")
-            return [], 0
+            return [], total_count, False
+        
+        rows = response.data
+        has_next = len(rows) > per_page
         
         # Convert to PantryItemData objects
         items = []
-        for item_data in response.data:
+        for item_data in rows[:per_page]:
             items.append(_dict_to_pantry_item_data(item_data))
         
         logger.info(f"Retrieved {len(items)} pantry items for user {user_id}")
-        return items, total_count
+        return items, total_count, has_next
         
     except Exception as e:
         logger.error(f"Error fetching pantry items for user {user_id}: {str(e)}")
         raise PantryItemError(f"Failed to fetch pantry items: {str(e)}")
 
 
+async def iter_user_pantry_items(
+    user_id: UUID,
+    supabase: AsyncClient,
+    category: Optional[str] = None,
+    search: Optional[str] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[PantryItemData]:
+    """
+    Iterate over all pantry items of a user, newest first.
+    
+    Items are fetched in keyset-paginated batches, so only one batch is held
+    in memory at a time and no total count is computed.
+    
+    Args:
+        user_id: ID of the user
+        supabase: Supabase client
+        category: Filter by category (optional)
+        search: Search in item names (optional)
+        batch_size: Items fetched per query
+        
+    Yields:
+        PantryItemData objects
+    """
+    logger.info(f"Streaming pantry items for user {user_id}")
+    
+    after = None
+    while True:
+        try:
+            query = _user_pantry_items_query(user_id, supabase, category, search)
+            response = await _order_and_continue(query, after).limit(batch_size).execute()
+        except Exception as e:
+            logger.error(f"Error streaming pantry items for user {user_id}: {str(e)}")
+            raise PantryItemError(f"Failed to fetch pantry items: {str(e)}")
+        
+        rows = response.data or []
+        for row in rows:
+            item = _dict_to_pantry_item_data(row)
+            yield item
+        
+        if len(rows) < batch_size:
+            return
+        after = (item.added_at, item.id)
+
+
 async def get_pantry_item_by_id(
     item_id: UUID,
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> PantryItemData:
     """
     Get a specific pantry item by ID (user can only access their own items).
@@ -145,13 +480,13 @@ async def get_pantry_item_by_id(
     try:
         logger.info(f"Fetching pantry item {item_id} for user {user_id}")
         
-        response = supabase.table("pantry_items").select("*").eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
+        row = await _lookup_pantry_item_row(item_id, user_id, supabase)
         
-        if not response.data:
+        if row is None:
             logger.warning(f"Pantry item {item_id} not found for user {user_id}")
             raise PantryItemNotFoundError(f"Pantry item with ID {item_id} not found")
         
-        item = _dict_to_pantry_item_data(response.data[0])
+        item = _dict_to_pantry_item_data(row)
         logger.info(f"Retrieved pantry item {item_id} for user {user_id}")
         return item
         
@@ -162,10 +497,57 @@ async def get_pantry_item_by_id(
         raise PantryItemError(f"Failed to fetch pantry item: {str(e)}")
 
 
+async def get_pantry_items_by_ids(
+    item_ids: List[UUID],
+    user_id: UUID,
+    supabase: AsyncClient,
+) -> Dict[UUID, PantryItemData]:
+    """
+    Get several pantry items by ID in a single query (user can only access their own items).
+    
+    Args:
+        item_ids: IDs of the pantry items
+        user_id: ID of the user (for authorization)
+        supabase: Supabase client
+        
+    Returns:
+        Dictionary mapping the IDs of found items to their PantryItemData;
+        missing IDs and other users' items are left out
+    """
+    if not item_ids:
+        return {}
+    
+    try:
+        logger.info(f"Fetching {len(item_ids)} pantry items for user {user_id}")
+        
+        rows = await _fetch_pantry_item_rows(item_ids, user_id, supabase)
+        
+        logger.info(f"Retrieved {len(rows)} of {len(item_ids)} pantry items for user {user_id}")
+        return {item_id: _dict_to_pantry_item_data(row) for item_id, row in rows.items()}
+        
+    except Exception as e:
+        logger.error(f"Error fetching pantry items for user {user_id}: {str(e)}")
+        raise PantryItemError(f"Failed to fetch pantry items: {str(e)}")
+
+
+def _pantry_item_insert_row(user_id: UUID, item_data: PantryItemCreate, added_at: str) -> Dict:
+    """Build the pantry_items row inserted for a new item."""
+    return {
+        "user_id": str(user_id),
+        "name": item_data.name,
+        "quantity": item_data.quantity,
+        "unit": item_data.unit,
+        "category": item_data.category,
+        "expiry_date": item_data.expiry_date.isoformat() if item_data.expiry_date else None,
+        "added_at": added_at,
+        "ingredient_id": str(item_data.ingredient_id),
+    }
+
+
 async def create_pantry_item(
     user_id: UUID,
     item_data: PantryItemCreate,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> PantryItemData:
     """
     Create a new pantry item for a user or update quantity if item already exists.
@@ -182,7 +564,7 @@ async def create_pantry_item(
         logger.info(f"Creating/updating pantry item '{item_data.name}' for user {user_id}")
         
         # Check if item already exists with same ingredient_id, unit and user_id
-        existing_response = supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).eq("ingredient_id", str(item_data.ingredient_id)).eq("unit", item_data.unit).execute()
+        existing_response = await supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).eq("ingredient_id", str(item_data.ingredient_id)).eq("unit", item_data.unit).execute()
         
         if existing_response.data:
             # Item exists - update quantity
@@ -203,7 +585,7 @@ async def create_pantry_item(
             if item_data.expiry_date:
                 update_data["expiry_date"] = item_data.expiry_date.isoformat()
             
-            response = supabase.table("pantry_items").update(update_data).eq("id", existing_item["id"]).execute()
+            response = await supabase.table("pantry_items").update(update_data).eq("id", existing_item["id"]).execute()
             
             if not response.data:
                 logger.error(f"Failed to update existing pantry item for user {user_id}")
@@ -218,18 +600,9 @@ async def create_pantry_item(
             logger.info(f"Item doesn't exist - creating new pantry item")
             
             # Prepare data for insertion
-            insert_data = {
-                "user_id": str(user_id),
-                "name": item_data.name,
-                "quantity": item_data.quantity,
-                "unit": item_data.unit,
-                "category": item_data.category,
-                "expiry_date": item_data.expiry_date.isoformat() if item_data.expiry_date else None,
-                "added_at": datetime.utcnow().isoformat(),
-                "ingredient_id": str(item_data.ingredient_id),
-            }
+            insert_data = _pantry_item_insert_row(user_id, item_data, datetime.utcnow().isoformat())
             
-            response = supabase.table("pantry_items").insert(insert_data).execute()
+            response = await supabase.table("pantry_items").insert(insert_data).execute()
             
             if not response.data:
                 logger.error(f"Failed to create pantry item for user {user_id}")
@@ -242,13 +615,65 @@ async def create_pantry_item(
     except Exception as e:
         logger.error(f"Error creating/updating pantry item for user {user_id}: {str(e)}")
         raise PantryItemError(f"Failed to create/update pantry item: {str(e)}")
+    finally:
+        _invalidate_stats(user_id)
+
+
+async def create_pantry_items(
+    user_id: UUID,
+    items_data: List[PantryItemCreate],
+    supabase: AsyncClient,
+) -> List[PantryItemData]:
+    """
+    Create several new pantry items with a single multi-row insert.
+    
+    Unlike create_pantry_item, quantities are not merged into existing items
+    of the same ingredient and unit; every item becomes a new row. The insert
+    runs in one transaction, so either all items are created or none.
+    
+    Args:
+        user_id: ID of the user
+        items_data: Pantry item creation data
+        supabase: Supabase client
+        
+    Returns:
+        Created PantryItemData objects, in input order
+    """
+    if not items_data:
+        return []
+    
+    try:
+        logger.info(f"Creating {len(items_data)} pantry items for user {user_id}")
+        
+        added_at = datetime.utcnow().isoformat()
+        insert_rows = [
+            _pantry_item_insert_row(user_id, item_data, added_at) for item_data in items_data
+        ]
+        
+        response = await supabase.table("pantry_items").insert(insert_rows).execute()
+        
+        if not response.data:
+            logger.error(f"Failed to create pantry items for user {user_id}")
+            raise PantryItemError("Failed to create pantry items")
+        
+        items = [_dict_to_pantry_item_data(row) for row in response.data]
+        logger.info(f"Created {len(items)} pantry items for user {user_id}")
+        return items
+        
+    except PantryItemError:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating pantry items for user {user_id}: {str(e)}")
+        raise PantryItemError(f"Failed to create pantry items: {str(e)}")
+    finally:
+        _invalidate_stats(user_id)
 
 
 async def update_pantry_item(
     item_id: UUID,
     user_id: UUID,
     item_data: PantryItemUpdate,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> PantryItemData:
     """
     Update a pantry item (user can only update their own items).
@@ -261,13 +686,14 @@ async def update_pantry_item(
         
     Returns:
         Updated PantryItemData object
+        
+    Raises:
+        PantryItemNotFoundError: If item doesn't exist or doesn't belong to user
+        PantryItemValidationError: If no fields are set
     """
     try:
         logger.info(f"Updating pantry item {item_id} for user {user_id}")
         
-        # First check if item exists and belongs to user
-        await get_pantry_item_by_id(item_id, user_id, supabase)
-        
         # Prepare update data (only include fields that are not None)
         update_data = {}
         if item_data.name is not None:
@@ -287,11 +713,13 @@ async def update_pantry_item(
             logger.warning(f"No update data provided for pantry item {item_id}")
             raise PantryItemValidationError("No update data provided")
         
-        response = supabase.table("pantry_items").update(update_data).eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
+        # The id and user_id filters only match the user's own item, so no
+        # returned row means it does not exist or belongs to someone else
+        response = await supabase.table("pantry_items").update(update_data).eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
         
         if not response.data:
-            logger.error(f"Failed to update pantry item {item_id}")
-            raise PantryItemError("Failed to update pantry item")
+            logger.warning(f"Pantry item {item_id} not found for user {user_id}")
+            raise PantryItemNotFoundError(f"Pantry item with ID {item_id} not found")
         
         item = _dict_to_pantry_item_data(response.data[0])
         logger.info(f"Updated pantry item {item_id} for user {user_id}")
@@ -302,12 +730,14 @@ async def update_pantry_item(
     except Exception as e:
         logger.error(f"Error updating pantry item {item_id}: {str(e)}")
         raise PantryItemError(f"Failed to update pantry item: {str(e)}")
+    finally:
+        _invalidate_stats(user_id)
 
 
 async def delete_pantry_item(
     item_id: UUID,
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> bool:
     """
     Delete a pantry item (user can only delete their own items).
@@ -319,18 +749,19 @@ async def delete_pantry_item(
         
     Returns:
         True if deletion was successful
+        
+    Raises:
+        PantryItemNotFoundError: If item doesn't exist or doesn't belong to user
     """
     try:
         logger.info(f"Deleting pantry item {item_id} for user {user_id}")
         
-        # First check if item exists and belongs to user
-        await get_pantry_item_by_id(item_id, user_id, supabase)
-        
-        response = supabase.table("pantry_items").delete().eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
+        # No deleted row means the user has no such item
+        response = await supabase.table("pantry_items").delete().eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
         
         if not response.data:
-            logger.error(f"Failed to delete pantry item {item_id}")
-            raise PantryItemError("Failed to delete pantry item")
+            logger.warning(f"Pantry item {item_id} not found for user {user_id}")
+            raise PantryItemNotFoundError(f"Pantry item with ID {item_id} not found")
         
         logger.info(f"Deleted pantry item {item_id} for user {user_id}")
         return True
@@ -340,13 +771,15 @@ async def delete_pantry_item(
     except Exception as e:
         logger.error(f"Error deleting pantry item {item_id}: {str(e)}")
         raise PantryItemError(f"Failed to delete pantry item: {str(e)}")
+    finally:
+        _invalidate_stats(user_id)
 
 
 # Bulk Operations
 async def bulk_create_pantry_items(
     user_id: UUID,
     items_data: List[PantryItemCreate],
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Tuple[List[PantryItemData], List[Dict]]:
     """
     Create multiple pantry items in bulk.
@@ -364,17 +797,24 @@ async def bulk_create_pantry_items(
     successful_items = []
     failed_items = []
     
-    for idx, item_data in enumerate(items_data):
-        try:
-            item = await create_pantry_item(user_id, item_data, supabase)
-            successful_items.append(item)
-        except Exception as e:
-            logger.error(f"Failed to create item {idx}: {str(e)}")
+    results = await _run_bulk([
+        (
+            (item_data.ingredient_id, item_data.unit),
+            lambda item_data=item_data: create_pantry_item(user_id, item_data, supabase),
+        )
+        for item_data in items_data
+    ])
+    
+    for idx, (item_data, result) in enumerate(zip(items_data, results)):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to create item {idx}: {str(result)}")
             failed_items.append({
                 "index": idx,
                 "item_data": item_data.model_dump(),
-                "error": str(e)
+                "error": str(result)
             })
+        else:
+            successful_items.append(result)
     
     logger.info(f"Bulk create completed: {len(successful_items)} successful, {len(failed_items)} failed")
     return successful_items, failed_items
@@ -383,7 +823,7 @@ async def bulk_create_pantry_items(
 async def bulk_update_pantry_items(
     user_id: UUID,
     updates: Dict[UUID, PantryItemUpdate],
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Tuple[List[PantryItemData], List[Dict]]:
     """
     Update multiple pantry items in bulk.
@@ -401,17 +841,26 @@ async def bulk_update_pantry_items(
     successful_items = []
     failed_items = []
     
-    for item_id, update_data in updates.items():
-        try:
-            item = await update_pantry_item(item_id, user_id, update_data, supabase)
-            successful_items.append(item)
-        except Exception as e:
-            logger.error(f"Failed to update item {item_id}: {str(e)}")
+    results = await _run_bulk([
+        (
+            item_id,
+            lambda item_id=item_id, update_data=update_data: update_pantry_item(
+                item_id, user_id, update_data, supabase
+            ),
+        )
+        for item_id, update_data in updates.items()
+    ])
+    
+    for (item_id, update_data), result in zip(updates.items(), results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to update item {item_id}: {str(result)}")
             failed_items.append({
                 "item_id": str(item_id),
                 "update_data": update_data.model_dump(exclude_none=True),
-                "error": str(e)
+                "error": str(result)
             })
+        else:
+            successful_items.append(result)
     
     logger.info(f"Bulk update completed: {len(successful_items)} successful, {len(failed_items)} failed")
     return successful_items, failed_items
@@ -420,11 +869,14 @@ async def bulk_update_pantry_items(
 async def bulk_delete_pantry_items(
     user_id: UUID,
     item_ids: List[UUID],
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Tuple[List[UUID], List[Dict]]:
     """
     Delete multiple pantry items in bulk.
     
+    All items are deleted with a single request; ids that matched none of the
+    user's items (or repeat an earlier id) are reported as not found.
+    
     Args:
         user_id: ID of the user
         item_ids: List of item IDs to delete
@@ -438,15 +890,30 @@ async def bulk_delete_pantry_items(
     successful_ids = []
     failed_items = []
     
+    try:
+        response = await (
+            supabase.table("pantry_items")
+            .delete()
+            .eq("user_id", str(user_id))
+            .in_("id", [str(item_id) for item_id in dict.fromkeys(item_ids)])
+            .execute()
+        )
+    except Exception as e:
+        logger.error(f"Failed to bulk delete pantry items for user {user_id}: {str(e)}")
+        error = f"Failed to delete pantry item: {str(e)}"
+        return [], [{"item_id": str(item_id), "error": error} for item_id in item_ids]
+    finally:
+        _invalidate_stats(user_id)
+    
+    deleted_ids = {UUID(str(row["id"])) for row in response.data or []}
     for item_id in item_ids:
-        try:
-            await delete_pantry_item(item_id, user_id, supabase)
+        if item_id in deleted_ids:
+            deleted_ids.discard(item_id)
             successful_ids.append(item_id)
-        except Exception as e:
-            logger.error(f"Failed to delete item {item_id}: {str(e)}")
+        else:
             failed_items.append({
                 "item_id": str(item_id),
-                "error": str(e)
+                "error": "Pantry item not found"
             })
     
     logger.info(f"Bulk delete completed: {len(successful_ids)} successful, {len(failed_items)} failed")
@@ -454,9 +921,10 @@ async def bulk_delete_pantry_items(
 
 
 # Statistics and Analytics
+@_cached_stats("overview")
 async def get_pantry_stats_overview(
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Dict:
     """
     Get overview statistics for user's pantry.
@@ -472,7 +940,7 @@ async def get_pantry_stats_overview(
         logger.info(f"Generating pantry stats overview for user {user_id}")
         
         # Get all pantry items for the user
-        response = supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).execute()
+        response = await supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).execute()
         
         if not response.data:
             return {
@@ -535,9 +1003,10 @@ async def get_pantry_stats_overview(
         raise PantryItemError(f"Failed to generate pantry statistics: {str(e)}")
 
 
+@_cached_stats("categories")
 async def get_pantry_category_stats(
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Dict:
     """
     Get category breakdown statistics for user's pantry.
@@ -552,7 +1021,7 @@ async def get_pantry_category_stats(
     try:
         logger.info(f"Generating pantry category stats for user {user_id}")
         
-        response = supabase.table("pantry_items").select("category").eq("user_id", str(user_id)).execute()
+        response = await supabase.table("pantry_items").select("category").eq("user_id", str(user_id)).execute()
         
         if not response.data:
             return {
@@ -597,9 +1066,10 @@ async def get_pantry_category_stats(
         raise PantryItemError(f"Failed to generate category statistics: {str(e)}")
 
 
+@_cached_stats("expiry")
 async def get_pantry_expiry_report(
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Dict:
     """
     Get expiry report for user's pantry items.
@@ -614,7 +1084,7 @@ async def get_pantry_expiry_report(
     try:
         logger.info(f"Generating pantry expiry report for user {user_id}")
         
-        response = supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).is_("expiry_date", "not.null").execute()
+        response = await supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).is_("expiry_date", "not.null").execute()
         
         if not response.data:
             return {
@@ -673,9 +1143,10 @@ async def get_pantry_expiry_report(
         raise PantryItemError(f"Failed to generate expiry report: {str(e)}")
 
 
+@_cached_stats("low_stock")
 async def get_pantry_low_stock_report(
     user_id: UUID,
-    supabase: SyncClient,
+    supabase: AsyncClient,
     threshold: float = 1.0,
 ) -> Dict:
     """
@@ -692,7 +1163,7 @@ async def get_pantry_low_stock_report(
     try:
         logger.info(f"Generating pantry low stock report for user {user_id} with threshold {threshold}")
         
-        response = supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).lte("quantity", threshold).execute()
+        response = await supabase.table("pantry_items").select("*").eq("user_id", str(user_id)).lte("quantity", threshold).execute()
         
         if not response.data:
             return {
@@ -732,32 +1203,134 @@ async def get_pantry_low_stock_report(
         raise PantryItemError(f"Failed to generate low stock report: {str(e)}")
 
 
+async def get_pantry_dashboard(
+    user_id: UUID,
+    supabase: AsyncClient,
+    threshold: float = 1.0,
+) -> Dict:
+    """
+    Get all pantry statistics for a dashboard in one call.
+    
+    The overview, category, expiry and low stock queries are independent,
+    so they run concurrently.
+    
+    Args:
+        user_id: ID of the user
+        supabase: Supabase client
+        threshold: Quantity threshold for the low stock report
+        
+    Returns:
+        Dictionary with overview, categories, expiry and low_stock entries
+    """
+    logger.info(f"Generating pantry dashboard for user {user_id}")
+    
+    overview, categories, expiry, low_stock = await asyncio.gather(
+        get_pantry_stats_overview(user_id, supabase),
+        get_pantry_category_stats(user_id, supabase),
+        get_pantry_expiry_report(user_id, supabase),
+        get_pantry_low_stock_report(user_id, supabase, threshold=threshold),
+    )
+    
+    return {
+        "overview": overview,
+        "categories": categories,
+        "expiry": expiry,
+        "low_stock": low_stock,
+    }
+
+
+def _sign_cursor_position(position: bytes) -> bytes:
+    """Sign a packed cursor position with SESSION_SECRET_KEY."""
+    return hashlib.blake2b(
+        position, key=settings.SESSION_SECRET_KEY.encode()[:64], digest_size=16
+    ).digest()
+
+
+def encode_pantry_cursor(item: PantryItemData) -> str:
+    """
+    Encode the position of a pantry item as an opaque, signed list cursor.
+    
+    The position is carried by the cursor itself, so any worker can continue
+    the list. Naive timestamps are taken as UTC.
+    
+    Args:
+        item: Last item of a page
+        
+    Returns:
+        URL-safe cursor string for get_user_pantry_items' after argument
+    """
+    added_at = item.added_at
+    if added_at.tzinfo is None:
+        added_at = added_at.replace(tzinfo=timezone.utc)
+    microseconds = (added_at - _CURSOR_EPOCH) // timedelta(microseconds=1)
+    position = _CURSOR_FORMAT.pack(microseconds, item.id.bytes)
+    cursor = position + _sign_cursor_position(position)
+    return base64.urlsafe_b64encode(cursor).decode().rstrip("=")
+
+
+def decode_pantry_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a list cursor created by encode_pantry_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        Tuple of (added_at, item_id)
+        
+    Raises:
+        PantryItemValidationError: If the cursor is malformed or was not
+            signed by this server
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except ValueError as e:
+        raise PantryItemValidationError(f"Invalid cursor: {str(e)}")
+    
+    position, signature = data[:_CURSOR_FORMAT.size], data[_CURSOR_FORMAT.size:]
+    if len(position) != _CURSOR_FORMAT.size or not hmac.compare_digest(
+        signature, _sign_cursor_position(position)
+    ):
+        raise PantryItemValidationError("Invalid cursor")
+    
+    microseconds, item_id = _CURSOR_FORMAT.unpack(position)
+    return _CURSOR_EPOCH + timedelta(microseconds=microseconds), UUID(bytes=item_id)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_uuid(value: str) -> UUID:
+    """Parse a UUID that repeats across rows, like a user or ingredient id."""
+    return UUID(value)
+
+
 def _dict_to_pantry_item_data(data: dict) -> PantryItemData:
     """Convert dictionary data to PantryItemData object."""
     
     # Handle date parsing
-    expiry_date = None
-    if data.get("expiry_date"):
-        if isinstance(data["expiry_date"], str):
-            expiry_date = datetime.fromisoformat(data["expiry_date"]).date()
-        else:
-            expiry_date = data["expiry_date"]
+    expiry_date = data.get("expiry_date")
+    if isinstance(expiry_date, str):
+        expiry_date = date.fromisoformat(expiry_date[:10])
+    elif not expiry_date:
+        expiry_date = None
     
-    # Handle datetime parsing
+    # Handle datetime parsing; fromisoformat accepts a "Z" suffix
     added_at = data["added_at"]
     if isinstance(added_at, str):
-        added_at = datetime.fromisoformat(added_at.replace("Z", "+00:00"))
+        added_at = datetime.fromisoformat(added_at)
     
+    item_id = data["id"]
+    user_id = data["user_id"]
+    ingredient_id = data["ingredient_id"]
     return PantryItemData(
-        item_id=UUID(data["id"]) if isinstance(data["id"], str) else data["id"],
-        user_id=UUID(data["user_id"]) if isinstance(data["user_id"], str) else data["user_id"],
+        item_id=UUID(item_id) if isinstance(item_id, str) else item_id,
+        user_id=_cached_uuid(user_id) if isinstance(user_id, str) else user_id,
         name=data["name"],
         quantity=float(data["quantity"]),
         unit=data["unit"],
         category=data["category"],
         expiry_date=expiry_date,
         added_at=added_at,
-        ingredient_id=UUID(data["ingredient_id"]) if isinstance(data["ingredient_id"], str) else data["ingredient_id"],
+        ingredient_id=_cached_uuid(ingredient_id) if isinstance(ingredient_id, str) else ingredient_id,
     )
 
 
@@ -765,7 +1338,7 @@ async def consume_pantry_item(
     item_id: UUID,
     user_id: UUID,
     consume_quantity: float,
-    supabase: SyncClient,
+    supabase: AsyncClient,
 ) -> Optional[PantryItemData]:
     """
     Consume/reduce quantity of a pantry item.
@@ -806,7 +1379,7 @@ async def consume_pantry_item(
         # If quantity becomes 0, delete the item completely
         if new_quantity == 0:
             logger.info(f"Item quantity is 0 after consumption, deleting pantry item {item_id}")
-            response = supabase.table("pantry_items").delete().eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
+            response = await supabase.table("pantry_items").delete().eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
             
             if not response.data:
                 logger.error(f"Failed to delete pantry item {item_id} after full consumption")
@@ -816,7 +1389,7 @@ async def consume_pantry_item(
             return None  # Item was deleted
         else:
             # Update the item with new quantity
-            response = supabase.table("pantry_items").update({
+            response = await supabase.table("pantry_items").update({
                 "quantity": float(new_quantity)
             }).eq("id", str(item_id)).eq("user_id", str(user_id)).execute()
             
@@ -837,3 +1410,5 @@ async def consume_pantry_item(
     except Exception as e:
         logger.error(f"Error consuming from pantry item {item_id}: {str(e)}")
         raise PantryItemError(f"Failed to consume from pantry item: {str(e)}")
+    finally:
+        _invalidate_stats(user_id)
@@ -200,14 +200,13 @@ class IngredientNamesManager:
             if not self.file_path.exists():
                 return []
 
-            ingredient_names = []
-
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith("#"):
-                        ingredient_names.append(line)
+            lines = self.file_path.read_text(encoding="utf-8").split("\n")
+            ingredient_names = [
+                line
+                for line in map(str.strip, lines)
+                # Skip empty lines and comments
+                if line and not line.startswith("#")
+            ]
 
             logger.info(f"Loaded {len(ingredient_names)} ingredients from file")
             return ingredient_names
@@ -6,6 +6,7 @@ from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Core imports
 from core.config import settings
@@ -16,7 +17,9 @@ from domains.auth.routes import router as auth_router
 from domains.health.routes import router as health_router
 from domains.ingredients.routes import router as ingredients_router
 from domains.ocr.routes import router as receipt_router
+from domains.pantry_items.routes import pantry_item_error_handler
 from domains.pantry_items.routes import router as pantry_items_router
+from domains.pantry_items.services import PantryItemError
 from domains.update.routes import router as update_router
 
 # Middleware imports
@@ -50,12 +53,14 @@ def create_application() -> FastAPI:
         docs_url=settings.DOCS_URL,
         redoc_url=settings.REDOC_URL,
         openapi_url="/openapi.json" if settings.DOCS_URL else None,
+        default_response_class=ORJSONResponse,
     )
 
     # Setup error handlers
     from core.error_handlers import setup_error_handlers
 
     setup_error_handlers(application)
+    application.add_exception_handler(PantryItemError, pantry_item_error_handler)
 
     # Add CORS middleware (should be early in the stack)
     application.add_middleware(
@@ -118,13 +123,23 @@ async def on_startup() -> None:
     logger.info(f"CORS origins: {settings.CORS_ORIGINS}")
     logger.info(f"Cache enabled: {settings.ENABLE_USER_CACHE}")
     logger.info(f"Security headers enabled: {settings.SECURITY_HEADERS_ENABLED}")
+    if settings.session_secret_key_generated:
+        logger.warning(
+            "⚠️ SESSION_SECRET_KEY is not set - using a per-process random key; "
+            "pantry pagination cursors will not survive restarts or work across workers"
+        )
     logger.info("Application startup completed")
 
 
 async def on_shutdown() -> None:
     """Application shutdown handler."""
     logger.info("Application shutdown initiated")
-    # Cleanup tasks here if needed
+
+    if settings.OCR_PATTERN_STATS_ENABLED:
+        from domains.ocr.services import log_pattern_hits
+
+        log_pattern_hits()
+
     logger.info("Application shutdown completed")
 
 
@@ -376,7 +376,8 @@ class OCRRateLimitMiddleware(BaseHTTPMiddleware):
         try:
             import magic
 
-            mime_type = magic.from_buffer(image_content, mime=True)
+            # The image header is enough for libmagic to identify the type
+            mime_type = magic.from_buffer(image_content[:4096], mime=True)
             if not mime_type.startswith("image/"):
                 self.logger.warning(
                     "Non-image MIME type detected",
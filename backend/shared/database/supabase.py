@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from supabase import Client, create_client
+from supabase import AsyncClient, Client, create_client
 
 from core.config import settings
 
@@ -11,6 +11,7 @@ class SupabaseService:
 
     def __init__(self):
         self._client: Optional[Client] = None
+        self._async_client: Optional[AsyncClient] = None
 
     @property
     def client(self) -> Client:
@@ -19,6 +20,13 @@ class SupabaseService:
             self._client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
         return self._client
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """Lazy loading of the async Supabase client, for awaiting queries."""
+        if self._async_client is None:
+            self._async_client = AsyncClient(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+        return self._async_client
+
     def get_client(self) -> Client:
         """Returns the Supabase client."""
         return self.client
@@ -185,3 +193,8 @@ supabase_service = SupabaseService()
 def get_supabase_client() -> Client:
     """Get the Supabase client instance."""
     return supabase_service.client
+
+
+def get_async_supabase_client() -> AsyncClient:
+    """Get the async Supabase client instance."""
+    return supabase_service.async_client
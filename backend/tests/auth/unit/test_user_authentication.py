@@ -242,3 +242,72 @@ class TestUserAuthentication(AuthTestBase):
 
                     with pytest.raises(AuthenticationError):
                         await service.authenticate_user(scenario["credentials"])
+
+    @staticmethod
+    def make_token(expires_in: int) -> str:
+        """Build an unsigned JWT-shaped token whose exp claim is expires_in seconds away."""
+        import base64
+        import json
+        import time
+
+        claims = json.dumps({"exp": int(time.time()) + expires_in}).encode()
+        return f"header.{base64.urlsafe_b64encode(claims).decode().rstrip('=')}.signature"
+
+    @pytest.mark.asyncio
+    async def test_token_verified_on_every_request_by_default(self):
+        """Test that without the opt-in cache every request asks Supabase."""
+        from unittest.mock import AsyncMock
+
+        token = self.make_token(3600)
+        user_data = {"id": str(uuid4()), "email": "test@example.com", "email_confirmed_at": None}
+
+        with MockContextManager(success_responses=True):
+            service = AuthService()
+            with (
+                patch.object(service, "verify_supabase_token", AsyncMock(return_value=user_data)) as verify,
+                patch.object(service, "_get_user_profile_by_id", AsyncMock(return_value=None)),
+            ):
+                await service.get_user_from_token(token)
+                await service.get_user_from_token(token)
+        assert verify.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_token_rejected_without_supabase(self):
+        """Test that a token past its exp claim is rejected locally."""
+        from unittest.mock import AsyncMock
+
+        with MockContextManager(success_responses=True):
+            service = AuthService()
+            with patch.object(service, "verify_supabase_token", AsyncMock()) as verify:
+                with pytest.raises(AuthenticationError) as exc_info:
+                    await service.get_user_from_token(self.make_token(-60))
+        assert exc_info.value.error_code == "TOKEN_EXPIRED"
+        verify.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_verified_token_user_cached_until_logout(self):
+        """Test that with the opt-in cache a token's user is reused until logout."""
+        from unittest.mock import AsyncMock
+
+        from domains.auth import services
+
+        token = self.make_token(3600)
+        user_data = {"id": str(uuid4()), "email": "test@example.com", "email_confirmed_at": None}
+
+        with (
+            MockContextManager(success_responses=True),
+            patch.object(services.settings, "AUTH_VERIFIED_USER_CACHE_ENABLED", True),
+        ):
+            service = AuthService()
+            with (
+                patch.object(service, "verify_supabase_token", AsyncMock(return_value=user_data)) as verify,
+                patch.object(service, "_get_user_profile_by_id", AsyncMock(return_value=None)),
+            ):
+                first = await service.get_user_from_token(token)
+                second = await service.get_user_from_token(token)
+                assert second is first
+                assert verify.await_count == 1
+
+                await service.logout_user(token)
+                await service.get_user_from_token(token)
+                assert verify.await_count == 2
@@ -0,0 +1,208 @@
+"""
+Receipt Item Parsing Tests.
+
+This module covers the text-only parts of the OCR pipeline: receipt line
+extraction and quantity/unit/price parsing. No tesseract binary is needed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from domains.ocr.services import IngredientNames, OCRService
+
+pytestmark = [pytest.mark.unit, pytest.mark.ocr]
+
+
+@pytest.fixture
+def ocr_service():
+    """Create an OCR service with a small, fixed ingredient list."""
+    with patch(
+        "domains.ocr.services._get_ingredient_names",
+        return_value=IngredientNames.from_names(
+            ["tomatoes", "onions", "garlic", "milk", "ground beef"]
+        ),
+    ):
+        yield OCRService()
+
+
+class TestReceiptItemExtraction:
+    """Tests for extracting product lines from raw receipt text."""
+
+    def test_extracts_products_and_skips_metadata(self, ocr_service):
+        """Product lines are kept, store/total lines are dropped."""
+        text = """
+        FRESH MARKET GROCERY
+        123 Main Street
+        Tomatoes (2 lbs)      $3.98
+        Onions (1 lb)         $1.49
+        Total:               $5.47
+        """
+        assert ocr_service._extract_receipt_items(text) == ["Tomatoes", "Onions"]
+
+    def test_corrects_common_ocr_errors(self, ocr_service):
+        """OCR misreads of units and product names are corrected."""
+        text = "Tomatnes (2 its) $398\nGarlie (3 bults) $2,25\nMitk (1 gallon) $3.29"
+        assert ocr_service._extract_receipt_items(text) == [
+            "Tomatoes",
+            "Garlic  3 Bulbs",
+            "Milk",
+        ]
+
+    def test_product_name_fixes_match_whole_words(self):
+        """Product name misreads are fixed case-insensitively, only as whole words."""
+        from domains.ocr.services import _PRODUCT_NAME_FIX_RE, _fix_product_name
+
+        text = "FGGS pasa Pasadena imtik Otiveoil"
+        assert _PRODUCT_NAME_FIX_RE.sub(_fix_product_name, text) == (
+            "eggs pasta Pasadena milk olive oil"
+        )
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("onions 2", True),
+            ("basilfresh", True),
+            ("fillets", True),
+            ("on", False),
+            ("sale", False),
+        ],
+    )
+    def test_food_start_words_match_as_prefix(self, line, expected):
+        """Lines starting with any food word, plural or misread, are recognised."""
+        from domains.ocr.services import _FOOD_START_RE
+
+        assert (_FOOD_START_RE.match(line) is not None) is expected
+
+    def test_removes_trailing_bare_quantity(self, ocr_service):
+        """A trailing quantity without parentheses is stripped from the name."""
+        assert ocr_service._extract_receipt_items("Ground Beef 1 lb $5.99") == ["Ground Beef"]
+
+
+class TestQuantityAndPriceExtraction:
+    """Tests for quantity, unit and price parsing of single receipt lines."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Tomatoes (2 lbs) $3.98", 3.98),
+            ("Cheese $12345", 12.34),
+            ("Oil $ 12 34", 12.0),
+            ("Milk 1L 2.50", 2.50),
+            ("Bananas 3 lbs", None),
+        ],
+    )
+    def test_price_extraction(self, ocr_service, text, expected):
+        """Prices are parsed including common OCR formatting errors."""
+        assert ocr_service._extract_price_from_text(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Tomatoes (2 lbs) $3.98", (2.0, "lbs")),
+            ("Reis (2 x 500 g) $1.99", (1000.0, "g")),
+            ("Käse 200 Gramm 3,49", (200.0, "Gramm")),
+            ("Beans O5 Stück", (5.0, "Stück")),
+            ("random line ok", (None, None)),
+        ],
+    )
+    def test_quantity_and_unit_extraction(self, ocr_service, text, expected):
+        """Quantities and units are parsed from parenthesised and bare forms."""
+        assert ocr_service._extract_quantity_and_unit_from_text(text) == expected
+
+    def test_pattern_hits_counted_when_enabled(self, ocr_service):
+        """Pattern hit counting is opt-in and keyed by parser and pattern index."""
+        from domains.ocr import services
+
+        services._PATTERN_HITS.clear()
+        ocr_service._extract_quantity_and_price("Tomatoes (2 lbs) $3.98")
+        assert not services._PATTERN_HITS
+
+        with patch.object(services.settings, "OCR_PATTERN_STATS_ENABLED", True):
+            ocr_service._extract_quantity_and_price("Tomatoes (2 lbs) $3.98")
+        assert services._PATTERN_HITS == {("price", 0): 1, ("quantity", 0): 1}
+
+        # Lines without "$" only try the undollared patterns, under their own index
+        with patch.object(services.settings, "OCR_PATTERN_STATS_ENABLED", True):
+            ocr_service._extract_price_from_text("Milk 1L 2.50")
+        assert services._PATTERN_HITS["price", 9] == 1
+        services._PATTERN_HITS.clear()
+
+
+class TestIngredientSuggestions:
+    """Tests for local ingredient suggestions."""
+
+    def test_ingredient_names_precomputed_in_one_pass(self):
+        """Derived lists line up index by index with the original names."""
+        ingredients = IngredientNames.from_names(["Ground beef", "milk"])
+        assert ingredients.names_lower == ["ground beef", "milk"]
+        assert ingredients.names_title == ["Ground Beef", "Milk"]
+        assert len(ingredients.mock_ids) == len(ingredients) == 2
+
+    @pytest.mark.asyncio
+    async def test_local_suggestions_use_precomputed_values(self, ocr_service):
+        """Local matches return title-cased names and stable mock ids."""
+        from uuid import NAMESPACE_DNS, uuid5
+
+        with patch("domains.ocr.services.INGREDIENT_SEARCH_AVAILABLE", False):
+            suggestions = await ocr_service._find_ingredient_suggestions("Garlic (3 bulbs) $2.25")
+        assert suggestions[0].ingredient_name == "Garlic"
+        assert suggestions[0].ingredient_id == uuid5(NAMESPACE_DNS, "local-ingredient-garlic")
+        assert suggestions[0].confidence_score == 100.0
+
+    def test_ingredient_names_reloaded_only_when_file_changes(self, tmp_path):
+        """The ingredient list is cached until the source file's mtime changes."""
+        import os
+
+        from domains.ocr import services
+
+        ingredient_file = tmp_path / "ingredient_names.txt"
+        ingredient_file.write_text("# header\nMilk\nEggs\n", encoding="utf-8")
+
+        with (
+            patch.object(services, "INGREDIENT_CACHE_AVAILABLE", False),
+            patch.object(services, "_INGREDIENT_NAMES_FILE", ingredient_file),
+            patch.object(
+                services.settings,
+                "UPDATE_INGREDIENT_CACHE_FILE_PATH",
+                str(tmp_path / "missing.txt"),
+            ),
+        ):
+            services._load_ingredient_names_cached.cache_clear()
+            first = services._get_ingredient_names()
+            assert first.names == ["milk", "eggs"]
+            assert services._get_ingredient_names() is first
+
+            ingredient_file.write_text("Milk\nEggs\nRice\n", encoding="utf-8")
+            os.utime(ingredient_file, ns=(0, ingredient_file.stat().st_mtime_ns + 10**9))
+            assert services._get_ingredient_names().names == ["milk", "eggs", "rice"]
+        services._load_ingredient_names_cached.cache_clear()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("milk", {1: 1.0, 2: 0.9}),
+            ("ilk", {1: 0.9, 2: 0.9}),
+            ("fresh milk 1l", {1: 0.9}),
+            ("rice", {}),
+        ],
+    )
+    def test_substring_scores(self, text, expected):
+        """Exact and substring hits match a per-name containment check."""
+        ingredients = IngredientNames.from_names(["Eggs", "Milk", "Milk Powder"])
+        assert ingredients.substring_scores(text) == expected
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [("fresh whole milk", True), ("powder", False), ("eg", False), ("", False)],
+    )
+    def test_contains_name_in(self, text, expected):
+        """A text contains a name when any lowercase name is a substring of it."""
+        ingredients = IngredientNames.from_names(["Eggs", "Milk", "Milk Powder"])
+        assert ingredients.contains_name_in(text) is expected
+
+    def test_fuzzy_candidates_pruned_by_length(self):
+        """Names too short or too long to reach the threshold are not scored."""
+        ingredients = IngredientNames.from_names(["a", "salt", "sea salt", "x" * 40])
+        assert sorted(ingredients.fuzzy_candidates("salts", 0.5)) == [1, 2]
+        assert sorted(ingredients.fuzzy_candidates("salts", 0.0)) == [0, 1, 2, 3]
@@ -0,0 +1,383 @@
+"""
+OCR Text Extraction Tests.
+
+This module covers image preprocessing and how extract_text_from_image runs
+and picks between the tesseract configurations. Tesseract itself is mocked.
+"""
+
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from domains.ocr.services import IngredientNames, OCRService
+
+pytestmark = [pytest.mark.unit, pytest.mark.ocr]
+
+
+@pytest.fixture
+def ocr_service():
+    """Create an OCR service without loading the ingredient file."""
+    with patch(
+        "domains.ocr.services._get_ingredient_names",
+        return_value=IngredientNames.from_names([]),
+    ):
+        yield OCRService()
+
+
+@pytest.fixture(autouse=True)
+def clear_ocr_result_cache():
+    """Keep cached OCR results from leaking between tests."""
+    from domains.ocr import services
+
+    services._OCR_RESULT_CACHE.clear()
+    yield
+    services._OCR_RESULT_CACHE.clear()
+
+
+@pytest.fixture
+def image_data():
+    """A plain PNG receipt stand-in."""
+    buffer = BytesIO()
+    Image.new("RGB", (400, 600), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def ocr_data(words, conf):
+    """Build an image_to_data dict from (block, paragraph, line, word) tuples."""
+    return {
+        "block_num": [block for block, _, _, _ in words],
+        "par_num": [par for _, par, _, _ in words],
+        "line_num": [line for _, _, line, _ in words],
+        "text": [word for _, _, _, word in words],
+        "conf": [conf if word.strip() else -1 for _, _, _, word in words],
+    }
+
+
+def mock_tesseract(confidences):
+    """Mock pytesseract, returning the config's confidence and its psm as text."""
+    tesseract = MagicMock()
+    tesseract.image_to_data.side_effect = lambda image, output_type, config: ocr_data(
+        [(1, 1, 1, ""), (1, 1, 1, "psm"), (1, 1, 1, config.split()[1])], confidences[config]
+    )
+    return tesseract
+
+
+class TestTextExtraction:
+    """Tests for choosing the OCR result across tesseract configurations."""
+
+    @pytest.mark.asyncio
+    async def test_highest_confidence_config_wins(self, ocr_service, image_data):
+        """Without a good-enough result every config runs and the best is kept."""
+        configs = ocr_service.optimal_config
+        confidences = {
+            configs["primary"]: 50,
+            configs["fallback_psm_4"]: 70,
+            configs["fallback_psm_11"]: 40,
+            configs["default"]: 60,
+        }
+        tesseract = mock_tesseract(confidences)
+
+        with patch("domains.ocr.services.pytesseract", tesseract):
+            response = await ocr_service.extract_text_from_image(image_data)
+
+        assert response.extracted_text == "psm 4"
+        assert response.confidence == 70.0
+        assert tesseract.image_to_data.call_count == 4
+        tesseract.image_to_string.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_good_enough_result_is_returned(self, ocr_service, image_data):
+        """A config reaching OCR_GOOD_ENOUGH_CONFIDENCE is accepted."""
+        configs = ocr_service.optimal_config
+        confidences = {config: 40 for config in configs.values()}
+        confidences[configs["fallback_psm_11"]] = 95
+        tesseract = mock_tesseract(confidences)
+
+        with patch("domains.ocr.services.pytesseract", tesseract):
+            response = await ocr_service.extract_text_from_image(image_data)
+
+        assert response.extracted_text == "psm 11"
+        assert response.confidence == 95.0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_image_served_from_cache(self, ocr_service, image_data):
+        """Re-uploading the same image reuses the cached result instead of re-running OCR."""
+        confidences = {config: 95 for config in ocr_service.optimal_config.values()}
+        tesseract = mock_tesseract(confidences)
+
+        with patch("domains.ocr.services.pytesseract", tesseract):
+            first = await ocr_service.extract_text_from_image(image_data)
+            calls = tesseract.image_to_data.call_count
+            second = await ocr_service.extract_text_from_image(image_data)
+
+        assert second.extracted_text == first.extracted_text
+        assert second.confidence == first.confidence
+        assert tesseract.image_to_data.call_count == calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_uploads_share_one_run(self, ocr_service, image_data):
+        """Identical uploads processed at the same time run OCR only once."""
+        import asyncio
+
+        from domains.ocr import services
+
+        confidences = {config: 50 for config in ocr_service.optimal_config.values()}
+        tesseract = mock_tesseract(confidences)
+
+        with patch("domains.ocr.services.pytesseract", tesseract):
+            first, second = await asyncio.gather(
+                ocr_service.extract_text_from_image(image_data),
+                ocr_service.extract_text_from_image(image_data),
+            )
+
+        assert first.extracted_text == second.extracted_text
+        assert tesseract.image_to_data.call_count == len(confidences)
+        assert not services._OCR_IN_FLIGHT
+
+    @pytest.mark.asyncio
+    async def test_preprocessing_runs_off_the_event_loop(self, ocr_service, image_data):
+        """Decoding and preprocessing run on the OCR thread pool."""
+        import threading
+
+        threads = []
+        preprocess = ocr_service._preprocess_image_for_ocr
+
+        def record_thread(image):
+            threads.append(threading.current_thread().name)
+            return preprocess(image)
+
+        confidences = {config: 95 for config in ocr_service.optimal_config.values()}
+        with (
+            patch("domains.ocr.services.pytesseract", mock_tesseract(confidences)),
+            patch.object(ocr_service, "_preprocess_image_for_ocr", side_effect=record_thread),
+        ):
+            await ocr_service.extract_text_from_image(image_data)
+
+        assert len(threads) == 1 and threads[0].startswith("ocr")
+
+    @pytest.mark.asyncio
+    async def test_queued_runs_not_timed_out(self):
+        """The processing timeout starts when a run leaves the pool queue."""
+        import asyncio
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from domains.ocr import services
+
+        def slow_run(image, config):
+            time.sleep(0.1)
+            return config, 50.0
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            patch.object(services, "_OCR_EXECUTOR", executor),
+            patch.object(services, "_run_ocr_config", slow_run),
+            patch.object(services, "settings", SimpleNamespace(OCR_PROCESSING_TIMEOUT=0.15)),
+        ):
+            results = await asyncio.gather(
+                *(services._run_ocr_config_in_pool(None, str(index)) for index in range(3))
+            )
+
+        assert results == [("0", 50.0), ("1", 50.0), ("2", 50.0)]
+
+    @pytest.mark.asyncio
+    async def test_slow_run_times_out(self):
+        """A run taking longer than OCR_PROCESSING_TIMEOUT raises a timeout."""
+        import asyncio
+        import time
+
+        from domains.ocr import services
+
+        with (
+            patch.object(services, "_run_ocr_config", lambda image, config: time.sleep(0.1)),
+            patch.object(services, "settings", SimpleNamespace(OCR_PROCESSING_TIMEOUT=0.01)),
+        ):
+            with pytest.raises(asyncio.TimeoutError):
+                await services._run_ocr_config_in_pool(None, "--psm 6")
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout_surfaces_as_ocr_timeout(self, ocr_service, image_data):
+        """A timeout of the fallback run reaches the caller as OCR_TIMEOUT."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from domains.ocr import services
+        from domains.ocr.services import OCRError
+
+        timed_out = AsyncMock(side_effect=asyncio.TimeoutError)
+        with patch.object(services, "_run_ocr_config_in_pool", timed_out):
+            with pytest.raises(OCRError) as exc_info:
+                await ocr_service.extract_text_from_image(image_data)
+
+        assert exc_info.value.error_code == "OCR_TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_receipts_batch_keeps_input_order(self, ocr_service, image_data):
+        """A batch returns one processed response per image, in input order."""
+        configs = ocr_service.optimal_config
+        confidences = {config: 50 for config in configs.values()}
+        confidences[configs["primary"]] = 99
+        buffer = BytesIO()
+        Image.new("RGB", (500, 700), "white").save(buffer, format="PNG")
+
+        with patch("domains.ocr.services.pytesseract", mock_tesseract(confidences)):
+            responses = await ocr_service.process_receipts_batch([image_data, buffer.getvalue()])
+
+        assert len(responses) == 2
+        assert all(response.raw_text == "psm 6" for response in responses)
+
+    @pytest.mark.asyncio
+    async def test_receipts_batch_limits_concurrent_images(self, ocr_service):
+        """A batch processes at most OCR_BATCH_CONCURRENCY images at a time."""
+        import asyncio
+
+        running = []
+        peak = 0
+
+        async def process(image_data):
+            nonlocal peak
+            running.append(image_data)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(image_data)
+            return image_data
+
+        with patch.object(ocr_service, "process_receipt_without_suggestions", side_effect=process):
+            responses = await ocr_service.process_receipts_batch([b"a", b"b", b"c"])
+
+        assert responses == [b"a", b"b", b"c"]
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_rejected(self):
+        """The public batch function refuses more than OCR_MAX_BATCH_SIZE images."""
+        from domains.ocr import services
+
+        images = [b""] * (services.settings.OCR_MAX_BATCH_SIZE + 1)
+        with patch.object(services, "OCR_AVAILABLE", True):
+            with pytest.raises(services.OCRError) as error:
+                await services.process_receipt_images(images)
+        assert error.value.error_code == "BATCH_TOO_LARGE"
+
+    def test_result_cache_evicts_least_recently_used(self):
+        """The cache holds at most OCR_RESULT_CACHE_SIZE results."""
+        from domains.ocr import services
+        from domains.ocr.schemas import OCRTextResponse
+
+        with patch.object(services.settings, "OCR_RESULT_CACHE_SIZE", 2):
+            for file_hash in ("a", "b"):
+                services._cache_ocr_result(file_hash, OCRTextResponse(extracted_text=file_hash))
+            services._get_cached_ocr_result("a")
+            services._cache_ocr_result("c", OCRTextResponse(extracted_text="c"))
+
+        assert list(services._OCR_RESULT_CACHE) == ["a", "c"]
+
+    def test_text_rebuilt_from_ocr_data(self):
+        """Words are grouped into lines, with a blank line between paragraphs."""
+        from domains.ocr.services import _text_from_ocr_data
+
+        data = ocr_data(
+            [
+                (1, 0, 0, ""),
+                (1, 1, 1, "Milk"),
+                (1, 1, 1, "$1.29"),
+                (1, 1, 2, "Eggs"),
+                (2, 1, 1, "Total"),
+                (2, 1, 1, " "),
+            ],
+            90,
+        )
+        assert _text_from_ocr_data(data) == "Milk $1.29\nEggs\n\nTotal"
+
+    def test_tesserocr_api_reused_per_config(self, image_data):
+        """With tesserocr, each configuration gets one persistent API instance."""
+        from domains.ocr import services
+
+        tesserocr = MagicMock()
+        api = tesserocr.PyTessBaseAPI.return_value
+        api.GetUTF8Text.return_value = "Milk $1.29\n"
+        api.AllWordConfidences.return_value = [90, 80, 10]
+        config = "--psm 6 --oem 1 -c tessedit_char_whitelist=abc"
+
+        with (
+            patch.object(services, "TESSEROCR_AVAILABLE", True),
+            patch.object(services, "tesserocr", tesserocr),
+            patch.dict(services._TESSEROCR_APIS, clear=True),
+        ):
+            image = Image.open(BytesIO(image_data))
+            first = services._run_ocr_config(image, config)
+            second = services._run_ocr_config(image, config)
+
+        assert first == second == ("Milk $1.29\n", 85.0)
+        tesserocr.PyTessBaseAPI.assert_called_once_with(psm=6, oem=1)
+        api.SetVariable.assert_called_once_with("tessedit_char_whitelist", "abc")
+
+    def test_binarization_is_opt_in(self, ocr_service):
+        """Otsu binarization only runs when OCR_BINARIZE_ENABLED is set."""
+        from domains.ocr import services
+
+        image = Image.new("L", (900, 900), 200)
+        image.paste(60, (100, 100, 400, 400))
+
+        default = ocr_service._preprocess_image_for_ocr(image)
+        assert len(set(default.convert("L").getdata())) > 2
+
+        with patch.object(services.settings, "OCR_BINARIZE_ENABLED", True):
+            binarized = ocr_service._preprocess_image_for_ocr(image)
+        assert set(binarized.convert("L").getdata()) == {0, 255}
+
+    @pytest.mark.parametrize(
+        "size, expected",
+        [((4032, 3024), (2000, 1500)), ((1200, 1600), (1200, 1600)), ((4000, 1000), (3200, 800))],
+    )
+    def test_large_images_downscaled(self, ocr_service, size, expected):
+        """Images beyond OCR_MAX_IMAGE_DIMENSION shrink, keeping the short side >= 800."""
+        processed = ocr_service._preprocess_image_for_ocr(Image.new("RGB", size, "white"))
+        assert processed.size == expected
+        assert processed.mode == "L"
+
+    @pytest.mark.parametrize("factor", [0.7, 1.5])
+    def test_contrast_lut_matches_image_enhance(self, factor):
+        """The contrast lookup table reproduces ImageEnhance.Contrast exactly."""
+        from PIL import ImageEnhance
+
+        from domains.ocr.services import _contrast_lut
+
+        image = Image.new("L", (64, 64))
+        image.putdata([(x * 37) % 200 + 20 for x in range(64 * 64)])
+
+        expected = ImageEnhance.Contrast(image).enhance(factor)
+        actual = image.point(_contrast_lut(image.histogram(), factor))
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    @pytest.mark.parametrize(
+        "conf, expected",
+        [(["96", "-1", 80, 10.0], 88.0), ([-1, 20], 30.0), ([], 30.0)],
+    )
+    def test_average_confidence(self, use_numpy, conf, expected):
+        """Confidences at or below the minimum are ignored, with or without numpy."""
+        from domains.ocr import services
+
+        with patch.object(services, "NUMPY_AVAILABLE", use_numpy):
+            assert services._average_confidence({"conf": conf}) == expected
+
+
+class TestImageSecurity:
+    """Tests for the raw upload checks run before OCR."""
+
+    @pytest.mark.parametrize("use_re2", [True, False])
+    def test_suspicious_content_rejected(self, image_data, use_re2):
+        """Script content anywhere in the upload is rejected."""
+        from domains.ocr import services
+
+        search = services._SUSPICIOUS_RE if use_re2 else None
+        with patch.object(services, "_SUSPICIOUS_RE", search):
+            assert services._find_suspicious_pattern(image_data) is None
+            payload = image_data[:100] + b"<?php echo 1; ?>" + image_data[100:]
+            with pytest.raises(services.OCRError) as error:
+                services._validate_image_security(payload)
+        assert error.value.error_code == "MALICIOUS_CONTENT"
@@ -558,3 +558,127 @@ class TestPantryAPIEndpoints(PantryTestBase):
                 # All should succeed if no rate limiting, or some should be rate limited
                 # This test documents the expected behavior
                 assert all(code in [200, 201, 429] for code in responses)
+
+
+class TestPantryConditionalResponses(PantryTestBase):
+    """Test ETag handling of pantry GET endpoints."""
+
+    def test_main_functionality(self):
+        """Required by PantryTestBase - tests basic ETag functionality."""
+        self.test_matching_etag_returns_not_modified()
+
+    @staticmethod
+    def create_request(if_none_match=None):
+        """Create a bare request, optionally with an If-None-Match header."""
+        from starlette.requests import Request
+
+        headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+        return Request({"type": "http", "method": "GET", "path": "/api/pantry/items", "headers": headers})
+
+    def test_matching_etag_returns_not_modified(self):
+        """Test that a current ETag gets an empty 304 and a stale one the full body."""
+        from main import app  # noqa: F401 - the routes import cleanly once the app is loaded
+        from domains.pantry_items.routes import _conditional_response
+        from domains.pantry_items.schemas import MessageResponse
+
+        payload = MessageResponse(message="Pantry statistics retrieved successfully")
+        response = _conditional_response(self.create_request(), payload)
+        etag = response.headers["etag"]
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.body) == payload.model_dump(mode="json")
+
+        not_modified = _conditional_response(self.create_request(f'"stale", W/{etag}'), payload)
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.body == b""
+
+        changed = MessageResponse(message="Pantry statistics changed")
+        assert _conditional_response(self.create_request(etag), changed).status_code == status.HTTP_200_OK
+
+    def test_list_items_encoded_through_response_model(self):
+        """Test that listed service items are normalized by the response schema."""
+        from datetime import datetime, timezone
+        from uuid import uuid4
+
+        from main import app  # noqa: F401 - the routes import cleanly once the app is loaded
+        from domains.pantry_items.routes import (
+            _PANTRY_ITEM_LIST_ADAPTER,
+            _conditional_response,
+            _to_responses,
+        )
+        from domains.pantry_items.schemas import PantryItemListApiResponse
+        from domains.pantry_items.services import PantryItemData
+
+        items = [
+            PantryItemData(
+                item_id=uuid4(),
+                user_id=uuid4(),
+                name="  Bananas ",
+                quantity=6.0,
+                unit="pieces",
+                category=None,
+                expiry_date=None,
+                added_at=datetime(2025, 6, 28, 12, 0, tzinfo=timezone.utc),
+                ingredient_id=uuid4(),
+            )
+        ]
+        data = {
+            "items": _PANTRY_ITEM_LIST_ADAPTER.dump_python(_to_responses(items), mode="json"),
+            "total_count": None,
+            "page": 1,
+            "per_page": 50,
+            "total_pages": None,
+            "has_next": False,
+            "next_cursor": None,
+        }
+
+        response = _conditional_response(
+            self.create_request(), {"success": True, "message": "Retrieved 1 pantry items", "data": data}
+        )
+        expected = PantryItemListApiResponse(
+            message="Retrieved 1 pantry items",
+            data={**data, "items": [vars(item) for item in items]},
+        )
+        assert json.loads(response.body) == expected.model_dump(mode="json")
+        assert json.loads(response.body)["data"]["items"][0]["name"] == "Bananas"
+
+    def test_statistics_cacheable_by_client(self):
+        """Test that max_age adds a private Cache-Control header, also on 304s."""
+        from main import app  # noqa: F401 - the routes import cleanly once the app is loaded
+        from domains.pantry_items.routes import _conditional_response
+        from domains.pantry_items.schemas import MessageResponse
+
+        payload = MessageResponse(message="Pantry statistics retrieved successfully")
+        assert "cache-control" not in _conditional_response(self.create_request(), payload).headers
+
+        response = _conditional_response(self.create_request(), payload, max_age=30)
+        expected = "private, max-age=30, stale-while-revalidate=60"
+        assert response.headers["cache-control"] == expected
+
+        not_modified = _conditional_response(
+            self.create_request(response.headers["etag"]), payload, max_age=30
+        )
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["cache-control"] == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error, expected_status",
+        [
+            ("PantryItemNotFoundError", status.HTTP_404_NOT_FOUND),
+            ("PantryItemValidationError", status.HTTP_422_UNPROCESSABLE_ENTITY),
+            ("PantryItemError", status.HTTP_500_INTERNAL_SERVER_ERROR),
+        ],
+    )
+    async def test_pantry_errors_mapped_to_status(self, error, expected_status):
+        """Test that the shared handler maps each pantry error to its status code."""
+        from main import app  # noqa: F401 - the routes import cleanly once the app is loaded
+        from domains.pantry_items import services
+        from domains.pantry_items.routes import pantry_item_error_handler
+
+        response = await pantry_item_error_handler(
+            self.create_request(), getattr(services, error)("Pantry item not available")
+        )
+
+        assert response.status_code == expected_status
+        assert json.loads(response.body)["message"] == "Pantry item not available"
@@ -238,3 +238,49 @@ class TestPantryBasicFunctionality(PantryTestBase):
         # Integer as float
         item = PantryItemCreate(quantity=5, **base_data)
         assert item.quantity == 5.0
+
+    def test_response_built_from_service_data(self):
+        """Test that responses are read straight from service data attributes."""
+        from datetime import datetime
+
+        from domains.pantry_items.services import PantryItemData
+
+        item = PantryItemData(
+            item_id=uuid4(),
+            user_id=uuid4(),
+            name=" Bananas ",
+            quantity=6.0,
+            unit="pieces",
+            category="produce",
+            expiry_date=date(2025, 7, 2),
+            added_at=datetime(2025, 6, 28, 12, 0),
+            ingredient_id=uuid4(),
+        )
+
+        response = PantryItemResponse.model_validate(item)
+        assert response.id == item.id
+        assert response.name == "Bananas"
+        assert response.expiry_date == item.expiry_date
+        assert response.ingredient_id == item.ingredient_id
+
+    def test_constructed_response_matches_validated_response(self):
+        """Test that skipping validation for service data gives the same response."""
+        from datetime import datetime
+
+        from domains.pantry_items.services import PantryItemData
+
+        item = PantryItemData(
+            item_id=uuid4(),
+            user_id=uuid4(),
+            name="Bananas",
+            quantity=6.0,
+            unit="pieces",
+            category=None,
+            expiry_date=None,
+            added_at=datetime(2025, 6, 28, 12, 0),
+            ingredient_id=uuid4(),
+        )
+
+        constructed = PantryItemResponse.model_construct(**vars(item))
+        validated = PantryItemResponse.model_validate(item)
+        assert constructed.model_dump(mode="json") == validated.model_dump(mode="json")
@@ -374,3 +374,133 @@ class TestPantryBulkOperations(PantryTestBase):
             # Should complete within performance threshold
             assert execution_time < self.config.PANTRY_MAX_BULK_TIME_MS
             assert result.success_count == 20
+
+
+class TestPantryBulkConcurrency(PantryTestBase):
+    """Test concurrent execution of bulk operations."""
+
+    @pytest.mark.asyncio
+    async def test_main_functionality(self):
+        """Required by PantryTestBase - tests basic bulk concurrency."""
+        await self.test_bulk_create_runs_items_concurrently()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_runs_items_concurrently(self):
+        """Test that distinct items overlap while same-ingredient items stay sequential."""
+        import asyncio
+
+        shared_ingredient = uuid4()
+        items = [
+            PantryTestDataGenerator.generate_pantry_item_create(name="Milk A", ingredient_id=shared_ingredient),
+            PantryTestDataGenerator.generate_pantry_item_create(name="Eggs"),
+            PantryTestDataGenerator.generate_pantry_item_create(name="Milk B", ingredient_id=shared_ingredient),
+            PantryTestDataGenerator.generate_pantry_item_create(name="Rice"),
+        ]
+        running = set()
+        running_at_start = {}
+
+        async def fake_create(user_id, item_data, supabase):
+            running_at_start[item_data.name] = set(running)
+            running.add(item_data.name)
+            await asyncio.sleep(0.01)
+            running.discard(item_data.name)
+            if item_data.name == "Rice":
+                raise PantryItemError("Database error")
+            return item_data.name
+
+        with patch("domains.pantry_items.services.create_pantry_item", side_effect=fake_create):
+            successful, failed = await bulk_create_pantry_items(UUID(TEST_USER_ID), items, Mock())
+
+        assert successful == ["Milk A", "Eggs", "Milk B"]
+        assert [failure["index"] for failure in failed] == [3]
+        assert running_at_start["Rice"] == {"Milk A", "Eggs"}
+        assert "Milk A" not in running_at_start["Milk B"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_uses_one_request(self):
+        """Test that bulk delete removes all items at once and reports unmatched ids."""
+        deleted, missing = uuid4(), uuid4()
+        supabase, query = PantryMockFactory.create_query_mock([{"id": str(deleted)}])
+
+        successful, failed = await bulk_delete_pantry_items(
+            UUID(TEST_USER_ID), [deleted, missing, deleted], supabase
+        )
+
+        assert successful == [deleted]
+        assert [failure["item_id"] for failure in failed] == [str(missing), str(deleted)]
+        query.in_.assert_called_once_with("id", [str(deleted), str(missing)])
+        assert query.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_missing_item_one_request(self):
+        """Test that updating a missing item fails on the update itself, without a lookup first."""
+        supabase, query = PantryMockFactory.create_query_mock([])
+        missing = uuid4()
+
+        successful, failed = await bulk_update_pantry_items(
+            UUID(TEST_USER_ID), {missing: PantryItemUpdate(quantity=2.0)}, supabase
+        )
+
+        assert successful == []
+        assert failed[0]["item_id"] == str(missing)
+        assert "not found" in failed[0]["error"]
+        assert query.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self):
+        """Test that concurrent by-id lookups of a user are sent as one query."""
+        import asyncio
+
+        from domains.pantry_items.services import PantryItemNotFoundError, get_pantry_item_by_id
+
+        rows = [PantryMockFactory.create_pantry_item_db_row(name=name) for name in ("Milk", "Eggs")]
+        supabase, query = PantryMockFactory.create_query_mock(rows)
+        item_ids = [UUID(row["id"]) for row in rows]
+        user_id = UUID(TEST_USER_ID)
+
+        milk, eggs, missing = await asyncio.gather(
+            get_pantry_item_by_id(item_ids[0], user_id, supabase),
+            get_pantry_item_by_id(item_ids[1], user_id, supabase),
+            get_pantry_item_by_id(uuid4(), user_id, supabase),
+            return_exceptions=True,
+        )
+
+        assert (milk.name, eggs.name) == ("Milk", "Eggs")
+        assert isinstance(missing, PantryItemNotFoundError)
+        assert query.execute.await_count == 1
+        assert query.in_.call_args.args[1][:2] == [str(item_id) for item_id in item_ids]
+
+    @pytest.mark.asyncio
+    async def test_items_fetched_by_ids_in_one_query(self):
+        """Test that several items are fetched with one id IN (...) query."""
+        from domains.pantry_items.services import get_pantry_items_by_ids
+
+        row = PantryMockFactory.create_pantry_item_db_row(name="Milk")
+        supabase, query = PantryMockFactory.create_query_mock([row])
+        found, missing = UUID(row["id"]), uuid4()
+
+        items = await get_pantry_items_by_ids([found, missing, found], UUID(TEST_USER_ID), supabase)
+
+        assert list(items) == [found]
+        assert items[found].name == "Milk"
+        query.in_.assert_called_once_with("id", [str(found), str(missing)])
+        assert query.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_items_uses_one_insert(self):
+        """Test that several new items are created with one multi-row insert."""
+        from domains.pantry_items.services import create_pantry_items
+
+        items_data = [
+            PantryTestDataGenerator.generate_pantry_item_create(name=name) for name in ("Milk", "Eggs")
+        ]
+        rows = [PantryMockFactory.create_pantry_item_db_row(name=item.name) for item in items_data]
+        supabase, query = PantryMockFactory.create_query_mock(rows)
+
+        items = await create_pantry_items(UUID(TEST_USER_ID), items_data, supabase)
+
+        assert [item.name for item in items] == ["Milk", "Eggs"]
+        insert_rows = query.insert.call_args.args[0]
+        assert [row["name"] for row in insert_rows] == ["Milk", "Eggs"]
+        assert all(row["user_id"] == TEST_USER_ID for row in insert_rows)
+        assert query.execute.await_count == 1
@@ -0,0 +1,155 @@
+"""
+Unit Tests for the Pantry Dashboard.
+
+This module tests combining all pantry statistics into one dashboard, and
+caching of the statistics it is built from.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from domains.pantry_items.schemas import PantryDashboard
+from domains.pantry_items.services import get_pantry_category_stats, get_pantry_dashboard
+from tests.pantry.config import TEST_USER_ID, PantryTestBase
+from tests.pantry.utils.test_data import PantryMockFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    """Keep cached statistics from leaking between tests."""
+    from domains.pantry_items import services
+
+    services._STATS_CACHE.clear()
+    yield
+    services._STATS_CACHE.clear()
+
+
+class TestPantryDashboard(PantryTestBase):
+    """Test the combined pantry dashboard."""
+
+    @pytest.mark.asyncio
+    async def test_main_functionality(self):
+        """Required by PantryTestBase - tests basic dashboard functionality."""
+        await self.test_dashboard_combines_all_statistics()
+
+    @pytest.mark.asyncio
+    async def test_dashboard_combines_all_statistics(self):
+        """Test that the dashboard holds every statistics report."""
+        overview = {
+            "total_items": 2,
+            "total_categories": 1,
+            "items_expiring_soon": 0,
+            "expired_items": 0,
+            "low_stock_items": 1,
+            "estimated_total_value": 0.0,
+            "most_common_category": "dairy",
+        }
+        categories = {"categories": [], "uncategorized_count": 0}
+        expiry = {"expiring_soon": [], "expired": [], "fresh": []}
+        low_stock = {"low_stock_items": [], "threshold_used": 2.5}
+        user_id = UUID(TEST_USER_ID)
+        supabase = Mock()
+
+        low_stock_report = AsyncMock(return_value=low_stock)
+
+        with (
+            patch(
+                "domains.pantry_items.services.get_pantry_stats_overview",
+                AsyncMock(return_value=overview),
+            ),
+            patch(
+                "domains.pantry_items.services.get_pantry_category_stats",
+                AsyncMock(return_value=categories),
+            ),
+            patch(
+                "domains.pantry_items.services.get_pantry_expiry_report",
+                AsyncMock(return_value=expiry),
+            ),
+            patch("domains.pantry_items.services.get_pantry_low_stock_report", low_stock_report),
+        ):
+            dashboard = await get_pantry_dashboard(user_id, supabase, threshold=2.5)
+
+        low_stock_report.assert_awaited_once_with(user_id, supabase, threshold=2.5)
+        response = PantryDashboard(**dashboard)
+        assert response.overview.most_common_category == "dairy"
+        assert response.low_stock.threshold_used == 2.5
+
+
+class TestPantryStatsCache(PantryTestBase):
+    """Test caching of pantry statistics."""
+
+    @pytest.mark.asyncio
+    async def test_main_functionality(self):
+        """Required by PantryTestBase - tests basic statistics caching."""
+        await self.test_repeated_statistics_served_from_cache()
+
+    @pytest.mark.asyncio
+    async def test_repeated_statistics_served_from_cache(self):
+        """Test that repeated requests reuse the result until it expires."""
+        supabase, query = PantryMockFactory.create_query_mock(
+            [{"category": "dairy"}, {"category": None}]
+        )
+        user_id = UUID(TEST_USER_ID)
+
+        first = await get_pantry_category_stats(user_id=user_id, supabase=supabase)
+        second = await get_pantry_category_stats(user_id, supabase)
+        assert second == first
+        assert query.execute.await_count == 1
+
+        with patch("domains.pantry_items.services.time.monotonic", return_value=float("inf")):
+            await get_pantry_category_stats(user_id, supabase)
+        assert query.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pantry_writes_invalidate_cached_statistics(self):
+        """Test that changing the pantry drops the user's cached statistics."""
+        from domains.pantry_items.services import PantryItemNotFoundError, delete_pantry_item
+
+        supabase, query = PantryMockFactory.create_query_mock([])
+        user_id = UUID(TEST_USER_ID)
+
+        await get_pantry_category_stats(user_id, supabase)
+        with pytest.raises(PantryItemNotFoundError):
+            await delete_pantry_item(uuid4(), user_id, supabase)
+        await get_pantry_category_stats(user_id, supabase)
+
+        # Stats, the delete, and stats again
+        assert query.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_dropped_on_store(self):
+        """Test that storing a result drops the user's expired entries."""
+        from domains.pantry_items import services
+
+        supabase, _ = PantryMockFactory.create_query_mock([])
+        user_id = UUID(TEST_USER_ID)
+
+        with patch("domains.pantry_items.services.time.monotonic", return_value=0.0):
+            await get_pantry_category_stats(user_id, supabase)
+        with patch("domains.pantry_items.services.time.monotonic", return_value=10_000.0):
+            await services.get_pantry_expiry_report(user_id, supabase)
+
+        assert [key[0] for key in services._STATS_CACHE[str(user_id)]] == ["expiry"]
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_write_not_cached(self):
+        """Test that a read in flight while the pantry changes does not store its result."""
+        from domains.pantry_items import services
+
+        supabase, query = PantryMockFactory.create_query_mock([{"category": "dairy"}])
+        user_id = UUID(TEST_USER_ID)
+
+        async def execute_during_write():
+            services._invalidate_stats(user_id)
+            return Mock(data=[{"category": "dairy"}])
+
+        query.execute.side_effect = execute_during_write
+        await get_pantry_category_stats(user_id, supabase)
+        assert str(user_id) not in services._STATS_CACHE
+
+        query.execute.side_effect = None
+        await get_pantry_category_stats(user_id, supabase)
+        await get_pantry_category_stats(user_id, supabase)
+        assert query.execute.await_count == 2
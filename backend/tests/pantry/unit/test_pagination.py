@@ -0,0 +1,212 @@
+"""
+Unit Tests for Pantry Items List Pagination.
+
+This module tests offset and cursor pagination of the pantry items list.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from domains.pantry_items.services import (
+    PantryItemValidationError,
+    decode_pantry_cursor,
+    encode_pantry_cursor,
+    get_user_pantry_items,
+)
+from tests.pantry.config import TEST_USER_ID, PantryTestBase
+from tests.pantry.utils.test_data import PantryMockFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    """Keep cached pages and item counts from leaking between tests."""
+    from domains.pantry_items import services
+
+    services._STATS_CACHE.clear()
+    yield
+    services._STATS_CACHE.clear()
+
+
+class TestPantryPagination(PantryTestBase):
+    """Test offset and cursor pagination of pantry items."""
+
+    def test_main_functionality(self):
+        """Required by PantryTestBase - tests basic pagination functionality."""
+        self.test_cursor_round_trip()
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position of the item it was built from."""
+        from domains.pantry_items.services import _dict_to_pantry_item_data
+
+        item = _dict_to_pantry_item_data(
+            PantryMockFactory.create_pantry_item_db_row(added_at="2025-06-28T12:00:00.123456+00:00")
+        )
+        added_at, item_id = decode_pantry_cursor(encode_pantry_cursor(item))
+        assert added_at == datetime(2025, 6, 28, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        assert item_id == item.id
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "WzFd"])
+    def test_invalid_cursor_rejected(self, cursor):
+        """Test that malformed cursors raise a validation error."""
+        with pytest.raises(PantryItemValidationError):
+            decode_pantry_cursor(cursor)
+
+    def test_tampered_cursor_rejected(self):
+        """Test that a cursor whose position was changed fails its signature check."""
+        import base64
+
+        from domains.pantry_items.services import _dict_to_pantry_item_data
+
+        item = _dict_to_pantry_item_data(PantryMockFactory.create_pantry_item_db_row())
+        cursor = encode_pantry_cursor(item)
+        data = bytearray(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        data[7] ^= 1
+        with pytest.raises(PantryItemValidationError):
+            decode_pantry_cursor(base64.urlsafe_b64encode(bytes(data)).decode())
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_keyset_filter(self):
+        """Test that a cursor continues with a keyset filter instead of an offset."""
+        supabase, query = PantryMockFactory.create_query_mock(
+            [PantryMockFactory.create_pantry_item_db_row()]
+        )
+        item_id = uuid4()
+        added_at = datetime(2025, 6, 28, 12, 0, tzinfo=timezone.utc)
+
+        items, _, has_next = await get_user_pantry_items(
+            user_id=UUID(TEST_USER_ID),
+            supabase=supabase,
+            per_page=20,
+            after=(added_at, item_id),
+        )
+
+        assert len(items) == 1
+        assert has_next is False
+        query.range.assert_not_called()
+        query.limit.assert_called_once_with(21)
+        timestamp = '"2025-06-28T12:00:00+00:00"'
+        query.or_.assert_called_once_with(
+            f"added_at.lt.{timestamp},and(added_at.eq.{timestamp},id.lt.{item_id})"
+        )
+
+    @pytest.mark.asyncio
+    async def test_page_uses_offset(self):
+        """Test that without a cursor the page number selects an offset range."""
+        supabase, query = PantryMockFactory.create_query_mock(
+            [PantryMockFactory.create_pantry_item_db_row()]
+        )
+
+        await get_user_pantry_items(
+            user_id=UUID(TEST_USER_ID), supabase=supabase, page=3, per_page=20
+        )
+
+        query.range.assert_called_once_with(40, 60)
+        query.or_.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extra_row_signals_next_page(self):
+        """Test that the row past the page sets has_next and is dropped, without counting."""
+        rows = [PantryMockFactory.create_pantry_item_db_row() for _ in range(3)]
+        supabase, query = PantryMockFactory.create_query_mock(rows)
+
+        items, total_count, has_next = await get_user_pantry_items(
+            user_id=UUID(TEST_USER_ID), supabase=supabase, per_page=2
+        )
+
+        assert [item.id for item in items] == [UUID(row["id"]) for row in rows[:2]]
+        assert has_next is True
+        assert total_count is None
+        assert query.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_total_count_on_request(self):
+        """Test that with_count counts offset pages in the same request."""
+        rows = [PantryMockFactory.create_pantry_item_db_row() for _ in range(3)]
+        supabase, query = PantryMockFactory.create_query_mock(rows)
+        query.execute.return_value.count = 3
+
+        items, total_count, has_next = await get_user_pantry_items(
+            user_id=UUID(TEST_USER_ID), supabase=supabase, per_page=5, with_count=True
+        )
+
+        assert len(items) == 3
+        assert total_count == 3
+        assert has_next is False
+        assert query.execute.await_count == 1
+        query.select.assert_called_once_with("*", count="exact", head=False)
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_count_cached(self):
+        """Test that cursor pages count without the keyset filter, once across pages."""
+        supabase, query = PantryMockFactory.create_query_mock(
+            [PantryMockFactory.create_pantry_item_db_row()]
+        )
+        query.execute.return_value.count = 1
+        after = (datetime(2025, 6, 28, 12, 0, tzinfo=timezone.utc), uuid4())
+
+        for per_page in (5, 10):
+            _, total_count, _ = await get_user_pantry_items(
+                user_id=UUID(TEST_USER_ID),
+                supabase=supabase,
+                per_page=per_page,
+                after=after,
+                with_count=True,
+            )
+            assert total_count == 1
+
+        # One count query, without rows, and two pages
+        assert query.execute.await_count == 3
+        query.select.assert_any_call("id", count="exact", head=True)
+
+    @pytest.mark.asyncio
+    async def test_repeated_page_served_from_cache(self):
+        """Test that polling the same page reuses it until the pantry changes."""
+        from domains.pantry_items.services import PantryItemNotFoundError, delete_pantry_item
+
+        supabase, query = PantryMockFactory.create_query_mock(
+            [PantryMockFactory.create_pantry_item_db_row()]
+        )
+        user_id = UUID(TEST_USER_ID)
+
+        first = await get_user_pantry_items(user_id=user_id, supabase=supabase, per_page=20)
+        second = await get_user_pantry_items(user_id=user_id, supabase=supabase, per_page=20)
+        assert second == first
+        assert query.execute.await_count == 1
+
+        # Positional arguments and spelled-out defaults hit the same entry
+        third = await get_user_pantry_items(user_id, supabase, 1, 20, None)
+        assert third == first
+        assert query.execute.await_count == 1
+
+        query.execute.return_value = MagicMock(data=[])
+        with pytest.raises(PantryItemNotFoundError):
+            await delete_pantry_item(uuid4(), user_id, supabase)
+        items, _, _ = await get_user_pantry_items(user_id=user_id, supabase=supabase, per_page=20)
+        assert items == []
+
+    @pytest.mark.asyncio
+    async def test_streaming_fetches_keyset_batches(self):
+        """Test that streaming continues batch by batch after the last item."""
+        from domains.pantry_items.services import iter_user_pantry_items
+
+        rows = [
+            PantryMockFactory.create_pantry_item_db_row(
+                name=name, added_at=f"2025-06-2{day}T12:00:00"
+            )
+            for day, name in ((8, "Milk"), (7, "Eggs"), (6, "Rice"))
+        ]
+        supabase, query = PantryMockFactory.create_query_mock([])
+        query.execute.side_effect = [MagicMock(data=rows[:2]), MagicMock(data=rows[2:])]
+
+        items = [
+            item
+            async for item in iter_user_pantry_items(UUID(TEST_USER_ID), supabase, batch_size=2)
+        ]
+
+        assert [item.name for item in items] == ["Milk", "Eggs", "Rice"]
+        query.limit.assert_called_with(2)
+        query.or_.assert_called_once()
+        assert rows[1]["id"] in query.or_.call_args.args[0]
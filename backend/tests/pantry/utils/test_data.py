@@ -5,9 +5,9 @@ This module provides utility functions and helpers for pantry testing.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4, UUID
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 from domains.pantry_items.schemas import (
     PantryItemCreate,
@@ -249,6 +249,32 @@ class PantryMockFactory:
         
         return mock_response
 
+    @staticmethod
+    def create_query_mock(rows: List[Dict]) -> Tuple[MagicMock, MagicMock]:
+        """Create a chainable async Supabase query mock whose execute returns rows."""
+        query = MagicMock()
+        methods = (
+            "select",
+            "insert",
+            "update",
+            "delete",
+            "eq",
+            "in_",
+            "ilike",
+            "is_",
+            "lte",
+            "order",
+            "range",
+            "limit",
+            "or_",
+        )
+        for method in methods:
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock(return_value=MagicMock(data=rows))
+        supabase = MagicMock()
+        supabase.table.return_value = query
+        return supabase, query
+
     @staticmethod
     def create_pantry_item_db_row(
         id: Optional[UUID] = None,